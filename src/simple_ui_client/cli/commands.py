@@ -9,24 +9,29 @@ Provides commands for managing the background agent:
 - convert: Convert Office documents to PDF
 """
 
-import asyncio
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import Annotated, Optional, TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
 from simple_ui_client import __version__
-from simple_ui_client.cli.ui import (
-    print_banner,
-    print_status,
-    print_success,
-    print_error,
-    print_info,
-    print_warning,
-)
-from simple_ui_client.utils.config import get_settings
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Heavy imports (pydantic settings, asyncio, Rich) are done inside each
+# command so `--help` / `--version` / shell completion don't pay for
+# machinery only the chosen command needs.
+
+
+@cache
+def _console() -> "Console":
+    """Shared Rich console, created on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 # Create Typer app
@@ -37,13 +42,10 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
-console = Console()
-
-
 def version_callback(value: bool) -> None:
     """Print version and exit."""
     if value:
-        console.print(f"[bold]Simple UI Client[/bold] v{__version__}")
+        _console().print(f"[bold]Simple UI Client[/bold] v{__version__}")
         raise typer.Exit()
 
 
@@ -71,8 +73,11 @@ def start(
     ] = False,
 ) -> None:
     """Start the Simple UI client daemon."""
+    from simple_ui_client.cli.ui import print_banner, print_error, print_info, print_success
+    from simple_ui_client.utils.config import get_settings
+
     settings = get_settings()
-    
+
     print_banner()
     
     if foreground:
@@ -92,11 +97,17 @@ def start(
         
         print_info("Starting daemon...")
         daemon.start()
-        
-        # Give it a moment to start
+
+        # Poll for readiness instead of a fixed sleep: fast starts are
+        # reported immediately, slow ones get up to 2s
         import time
-        time.sleep(0.5)
-        
+
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline:
+            if daemon.is_running():
+                break
+            time.sleep(0.025)
+
         if daemon.is_running():
             status = daemon.get_status()
             print_success(f"Daemon started (PID: {status['pid']})")
@@ -112,8 +123,11 @@ def start(
 @app.command()
 def stop() -> None:
     """Stop the running Simple UI client daemon."""
+    from simple_ui_client.cli.ui import print_error, print_info, print_success
+    from simple_ui_client.utils.config import get_settings
+
     settings = get_settings()
-    
+
     from simple_ui_client.core.daemon import Daemon, DaemonError
     
     daemon = Daemon(settings)
@@ -142,8 +156,13 @@ def run(
 
 def run_impl(daemon_child: bool = False) -> None:
     """Implementation for running the client."""
+    import asyncio
+
+    from simple_ui_client.cli.ui import print_banner, print_info
+    from simple_ui_client.utils.config import get_settings
+
     settings = get_settings()
-    
+
     if not daemon_child:
         print_banner()
         print_info(f"Server: {settings.websocket_url}")
@@ -155,7 +174,15 @@ def run_impl(daemon_child: bool = False) -> None:
     
     # Setup logger
     setup_logger(settings, daemon_mode=daemon_child)
-    
+
+    # Faster event loop when the `perf` extra is installed
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(run_foreground(settings))
     except KeyboardInterrupt:
@@ -166,8 +193,11 @@ def run_impl(daemon_child: bool = False) -> None:
 @app.command()
 def status() -> None:
     """Check the status of the Simple UI client daemon."""
+    from simple_ui_client.cli.ui import print_status
+    from simple_ui_client.utils.config import get_settings
+
     settings = get_settings()
-    
+
     from simple_ui_client.core.daemon import Daemon
     
     daemon = Daemon(settings)
@@ -179,8 +209,10 @@ def status() -> None:
 @app.command()
 def config() -> None:
     """Show current configuration."""
+    from simple_ui_client.utils.config import get_settings
+
     settings = get_settings()
-    
+
     from rich.table import Table
     
     table = Table(title="Configuration", show_header=True, header_style="bold cyan")
@@ -199,6 +231,7 @@ def config() -> None:
     table.add_row("Ping Interval", f"{settings.ping_interval}s")
     table.add_row("Ping Timeout", f"{settings.ping_timeout}s")
     
+    console = _console()
     console.print()
     console.print(table)
 
@@ -258,8 +291,16 @@ def convert(
     ] = False,
 ) -> None:
     """Convert Office documents (Word, Excel, PowerPoint) to PDF."""
-    from pathlib import Path as PathLib
-    
+    import asyncio
+
+    from simple_ui_client.cli.ui import (
+        print_banner,
+        print_error,
+        print_info,
+        print_success,
+        print_warning,
+    )
+    from simple_ui_client.utils.config import get_settings
     from simple_ui_client.features.doc_converter.core.prerequisite import (
         check_prerequisites,
         PrerequisiteError,
@@ -271,8 +312,8 @@ def convert(
     )
     from simple_ui_client.features.doc_converter.worker.batch_worker import BatchWorker
     from simple_ui_client.features.doc_converter.ui.progress_ui import ProgressManager
-    from simple_ui_client.utils.logger import setup_logger
-    
+    from simple_ui_client.utils.logger import reconfigure_log_dir, setup_logger
+
     # Initialize settings and logger
     settings = get_settings()
     setup_logger(settings, daemon_mode=False)
@@ -296,8 +337,8 @@ def convert(
         # Override settings log_dir if specified in YAML
         if config.logging.log_dir:
             settings.log_dir = config.logging.log_dir
-            # Re-initialize logger with new directory
-            setup_logger(settings, daemon_mode=False)
+            # Swap only the file sink; the console sink stays as-is
+            reconfigure_log_dir(settings)
         
         # Override with CLI options
         config.conversion.workers = workers
@@ -340,10 +381,13 @@ def convert(
             log_lines=config.logging.log_console_lines,
         ) as progress:
             worker = BatchWorker(config, progress)
-            result = asyncio.run(worker.process_batch(files, output_manager))
+            try:
+                result = asyncio.run(worker.process_batch(files, output_manager))
+            finally:
+                worker.close()
         
         # Print summary
-        console.print()
+        _console().print()
         if result.failed == 0:
             print_success(
                 f"Conversion complete: {result.successful}/{result.total_files} files "
@@ -8,6 +8,7 @@ for the CLI interface.
 from typing import Any
 
 from rich.console import Console
+from rich.padding import Padding
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -18,35 +19,55 @@ from simple_ui_client import __version__
 console = Console()
 
 
+# Precomputed renderables for the job table hot loop: all 21 possible
+# 20-cell progress bars, and status cells as ready-made Text objects so
+# Rich doesn't re-parse markup per row
+_BARS = tuple(f"[{'█' * i}{'░' * (20 - i)}] {5 * i}%" for i in range(21))
+_STATUS_TEXT = {
+    "pending": Text("pending", style="yellow"),
+    "processing": Text("processing", style="blue"),
+    "completed": Text("completed", style="green"),
+    "failed": Text("failed", style="red"),
+    "cancelled": Text("cancelled", style="dim"),
+}
+
+# Message prefixes as prebuilt Text so per-line helpers skip markup
+# parsing entirely — these run once per file in batch output
+_PREFIX_SUCCESS = Text("✓ ", style="green")
+_PREFIX_ERROR = Text("✗ ", style="red")
+_PREFIX_WARNING = Text("⚠ ", style="yellow")
+_PREFIX_INFO = Text("ℹ ", style="blue")
+
+
 def print_banner() -> None:
     """Print the application banner."""
     banner = Text()
     banner.append("Simple UI Client", style="bold cyan")
     banner.append(f" v{__version__}", style="dim")
-    
-    console.print()
-    console.print(Panel(banner, border_style="cyan", padding=(0, 2)))
-    console.print()
+
+    # Single print: surrounding blank lines come from Padding instead of
+    # separate console.print() calls, so the terminal is written once
+    console.print(Padding(Panel(banner, border_style="cyan", padding=(0, 2)), (1, 0)))
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    console.print(_PREFIX_SUCCESS + Text(message))
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    console.print(_PREFIX_ERROR + Text(message))
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    console.print(_PREFIX_WARNING + Text(message))
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    console.print(_PREFIX_INFO + Text(message))
 
 
 def print_status(status_info: dict[str, Any]) -> None:
@@ -74,9 +95,7 @@ def print_status(status_info: dict[str, Any]) -> None:
     pid_file = status_info.get("pid_file", "")
     table.add_row("PID File", pid_file)
     
-    console.print()
-    console.print(Panel(table, title="Daemon Status", border_style="cyan"))
-    console.print()
+    console.print(Padding(Panel(table, title="Daemon Status", border_style="cyan"), (1, 0)))
 
 
 def create_progress_table(jobs: list[dict[str, Any]]) -> Table:
@@ -100,24 +119,14 @@ def create_progress_table(jobs: list[dict[str, Any]]) -> Table:
         source = job.get("source", "unknown")[:30]
         progress = job.get("progress", 0)
         status = job.get("status", "unknown")
-        
-        # Create progress bar
-        bar_width = 20
-        filled = int(bar_width * progress / 100)
-        bar = f"[{'█' * filled}{'░' * (bar_width - filled)}] {progress}%"
-        
-        # Status color
-        status_colors = {
-            "pending": "yellow",
-            "processing": "blue",
-            "completed": "green",
-            "failed": "red",
-            "cancelled": "dim",
-        }
-        color = status_colors.get(status, "white")
-        
-        table.add_row(job_id, source, bar, f"[{color}]{status}[/{color}]")
-    
+
+        # Bars and status cells come from the precomputed tables above;
+        # the bar resolution is 5%, which 20 cells can't exceed anyway
+        bar = _BARS[min(max(progress, 0), 100) // 5]
+        status_text = _STATUS_TEXT.get(status) or Text(status, style="white")
+
+        table.add_row(job_id, source, bar, status_text)
+
     return table
 
 
@@ -6,8 +6,11 @@ Event naming follows the `feature:action` format (e.g., `doc:convert`, `sys:shut
 """
 
 import asyncio
-from collections import defaultdict
+import fnmatch
+import re
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
 from typing import Any, Callable, Coroutine, Self
 from uuid import UUID, uuid4
@@ -20,6 +23,22 @@ from pydantic import BaseModel, Field
 type EventHandler = Callable[["Event"], Coroutine[Any, Any, None]]
 type EventName = str
 
+# Characters that make a subscription pattern a wildcard (fnmatch syntax)
+_WILDCARD_CHARS = "*?["
+
+
+@lru_cache(maxsize=4096)
+def _match(pattern: str, name: EventName) -> bool:
+    """
+    True if the fnmatch-style pattern matches the event name.
+
+    Memoized: production event streams repeat a small set of names, so
+    after warm-up a (pattern, name) pair is one dict hit instead of a
+    regex match. re.compile keeps its own per-pattern cache, so the
+    translate/compile cost is paid once per pattern, not per pair.
+    """
+    return re.compile(fnmatch.translate(pattern)).match(name) is not None
+
 
 class EventPayload(BaseModel):
     """Base class for event payloads with Pydantic validation."""
@@ -80,11 +99,26 @@ class EventBus:
             max_history: Maximum number of events to keep in history.
         """
         self._queue: asyncio.Queue[Event] = asyncio.Queue()
-        self._handlers: dict[EventName, list[EventHandler]] = defaultdict(list)
+        # Handlers are split by subscription kind: literal names live in
+        # a dict so the common case is a single lookup, wildcard
+        # patterns form a small map that is scanned via the memoized
+        # _match only after the dict hit
+        self._exact: dict[EventName, list[EventHandler]] = defaultdict(list)
+        self._wild: dict[EventName, list[EventHandler]] = {}
+        # Resolved name -> handler tuple, filled on first dispatch of a
+        # name and reused until the subscriptions change: steady-state
+        # publishes skip both the wildcard scan and the list copy
+        self._resolved: dict[EventName, tuple[EventHandler, ...]] = {}
         self._running = False
         self._task: asyncio.Task[None] | None = None
-        self._history: list[Event] = []
-        self._max_history = max_history
+        # maxlen makes eviction O(1); an unbounded list would pay an
+        # O(n) pop(0) shift for every event past the cap
+        self._history: deque[Event] = deque(maxlen=max_history)
+        # Idle signal for join(): counts published-but-not-yet-handled
+        # events so callers can await quiescence instead of sleeping
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
         self._logger = logger.bind(component="EventBus")
     
     def subscribe(self, event_name: EventName, handler: EventHandler) -> Self:
@@ -98,7 +132,14 @@ class EventBus:
         Returns:
             Self for method chaining.
         """
-        self._handlers[event_name].append(handler)
+        if any(c in event_name for c in _WILDCARD_CHARS):
+            self._wild.setdefault(event_name, []).append(handler)
+        else:
+            self._exact[event_name].append(handler)
+        # A wildcard can affect any number of resolved names, so the
+        # whole cache goes; subscription changes are rare next to
+        # publishes, making the coarse invalidation cheap in practice
+        self._resolved.clear()
         self._logger.debug(f"Subscribed handler to '{event_name}'")
         return self
     
@@ -113,14 +154,45 @@ class EventBus:
         Returns:
             Self for method chaining.
         """
-        if event_name in self._handlers:
+        if event_name in self._wild:
+            handlers = self._wild[event_name]
             try:
-                self._handlers[event_name].remove(handler)
+                handlers.remove(handler)
                 self._logger.debug(f"Unsubscribed handler from '{event_name}'")
             except ValueError:
                 pass
+            if not handlers:
+                del self._wild[event_name]
+                # Don't let memoized results keep dead patterns alive
+                _match.cache_clear()
+        elif event_name in self._exact:
+            try:
+                self._exact[event_name].remove(handler)
+                self._logger.debug(f"Unsubscribed handler from '{event_name}'")
+            except ValueError:
+                pass
+            if not self._exact[event_name]:
+                del self._exact[event_name]
+        self._resolved.clear()
         return self
     
+    def has_subscribers(self, event_name: EventName) -> bool:
+        """
+        Cheap check whether any handler would receive this event.
+
+        Considers exact and wildcard subscriptions without building
+        the handler list.
+
+        Args:
+            event_name: The event name to check.
+
+        Returns:
+            True if at least one handler matches.
+        """
+        if self._exact.get(event_name):
+            return True
+        return any(_match(pattern, event_name) for pattern in self._wild)
+
     async def publish(self, event: Event) -> None:
         """
         Publish an event to the bus.
@@ -128,9 +200,29 @@ class EventBus:
         Args:
             event: The event to publish.
         """
+        self._inflight += 1
+        self._idle.clear()
         await self._queue.put(event)
         self._logger.debug(f"Published {event}")
     
+    async def publish_many(self, events: list[Event]) -> None:
+        """
+        Publish a batch of events in one call.
+
+        The queue is unbounded, so the whole batch is enqueued without
+        yielding between events — one call amortizes scheduling overhead
+        across the batch.
+
+        Args:
+            events: The events to publish, in order.
+        """
+        self._inflight += len(events)
+        if events:
+            self._idle.clear()
+        for event in events:
+            self._queue.put_nowait(event)
+        self._logger.debug(f"Published batch of {len(events)} events")
+
     def publish_sync(self, event: Event) -> None:
         """
         Publish an event synchronously (for use in non-async contexts).
@@ -138,6 +230,8 @@ class EventBus:
         Args:
             event: The event to publish.
         """
+        self._inflight += 1
+        self._idle.clear()
         self._queue.put_nowait(event)
         self._logger.debug(f"Published (sync) {event}")
     
@@ -178,60 +272,81 @@ class EventBus:
         """Main dispatch loop processing events from the queue."""
         while self._running:
             try:
-                event = await self._queue.get()
-                
-                # Add to history
-                self._history.append(event)
-                if len(self._history) > self._max_history:
-                    self._history.pop(0)
-                
-                # Skip shutdown event processing
-                if event.name == "sys:shutdown":
-                    continue
-                
-                # Find matching handlers
-                handlers = self._get_matching_handlers(event.name)
-                
-                if not handlers:
-                    self._logger.debug(f"No handlers for {event}")
-                    continue
-                
-                # Execute handlers concurrently
-                await asyncio.gather(
-                    *(self._safe_call(handler, event) for handler in handlers),
-                    return_exceptions=True,
-                )
-                
+                # Block for the first event, then drain whatever else
+                # already sits in the queue so a burst (publish_many)
+                # is dispatched in one pass instead of one loop
+                # iteration per event
+                batch = [await self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                calls = []
+                for event in batch:
+                    # Add to history (deque evicts the oldest entry itself)
+                    self._history.append(event)
+
+                    # Skip shutdown event processing
+                    if event.name == "sys:shutdown":
+                        continue
+
+                    handlers = self._get_matching_handlers(event.name)
+                    if not handlers:
+                        self._logger.debug(f"No handlers for {event}")
+                        continue
+                    calls.extend(self._safe_call(handler, event) for handler in handlers)
+
+                try:
+                    # One gather for the whole batch: wall time is the
+                    # slowest handler, not the sum across events
+                    if calls:
+                        await asyncio.gather(*calls, return_exceptions=True)
+                finally:
+                    # Settle the batch for join(), even if the gather
+                    # was cancelled mid-flight
+                    self._inflight -= len(batch)
+                    if self._inflight == 0:
+                        self._idle.set()
+
             except asyncio.CancelledError:
                 self._logger.debug("Dispatch loop cancelled")
                 break
             except Exception as e:
                 self._logger.exception(f"Error in dispatch loop: {e}")
     
-    def _get_matching_handlers(self, event_name: EventName) -> list[EventHandler]:
+    def _get_matching_handlers(self, event_name: EventName) -> tuple[EventHandler, ...]:
         """
         Get all handlers that match an event name (including wildcards).
-        
+
+        The resolved tuple is cached per name — after the first dispatch
+        of a name this is a single dict hit, with no copy and no
+        wildcard scan. subscribe/unsubscribe invalidate the cache.
+
         Args:
             event_name: The event name to match.
-            
+
         Returns:
-            List of matching handler functions.
+            Tuple of matching handler functions.
         """
-        handlers: list[EventHandler] = []
-        
-        # Exact match
-        handlers.extend(self._handlers.get(event_name, []))
-        
-        # Wildcard match (e.g., `doc:*` matches `doc:convert`)
-        if ":" in event_name:
-            prefix = event_name.split(":")[0]
-            wildcard = f"{prefix}:*"
-            handlers.extend(self._handlers.get(wildcard, []))
-        
-        # Global wildcard
-        handlers.extend(self._handlers.get("*", []))
-        
+        handlers = self._resolved.get(event_name)
+        if handlers is None:
+            # Literal subscriptions first, then wildcard matches
+            # (e.g., `doc:*` matches `doc:convert`)
+            merged: list[EventHandler] = list(self._exact.get(event_name, ()))
+            for pattern, wild_handlers in self._wild.items():
+                if _match(pattern, event_name):
+                    merged.extend(wild_handlers)
+
+            # Unmatched names cache an empty tuple too, so streams of
+            # unhandled events don't rescan the wildcard map. Bounded
+            # the same way as _match to keep hostile name churn from
+            # growing the dict without limit.
+            if len(self._resolved) >= 4096:
+                self._resolved.clear()
+            handlers = self._resolved[event_name] = tuple(merged)
+
         return handlers
     
     async def _safe_call(self, handler: EventHandler, event: Event) -> None:
@@ -249,10 +364,32 @@ class EventBus:
                 f"Handler error for {event.name}: {e}"
             )
     
+    async def join(self) -> None:
+        """
+        Wait until every published event has been fully dispatched.
+
+        Resolves once the queue is empty and all handlers for already
+        dequeued events have finished — a deterministic alternative to
+        sleeping for an arbitrary interval after publish. Returns
+        immediately when the bus is idle.
+        """
+        await self._idle.wait()
+
     @property
     def history(self) -> list[Event]:
         """Get the event history (read-only copy)."""
         return list(self._history)
+
+    @property
+    def _max_history(self) -> int:
+        """Maximum number of events kept in history."""
+        return self._history.maxlen or 0
+
+    @_max_history.setter
+    def _max_history(self, value: int) -> None:
+        # deque maxlen is immutable, so resizing rebuilds the deque
+        # (keeping the newest events that still fit)
+        self._history = deque(self._history, maxlen=value)
     
     @property
     def is_running(self) -> bool:
@@ -14,6 +14,15 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.windll.kernel32
+    # OpenProcess access right / GetExitCodeProcess sentinel
+    _PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    _STILL_ACTIVE = 259
+
 if TYPE_CHECKING:
     from simple_ui_client.utils.config import Settings
 
@@ -49,16 +58,13 @@ class Daemon:
         Raises:
             DaemonError: If daemon is already running or failed to start.
         """
-        if self.is_running():
-            pid = self._read_pid()
+        pid = self._read_pid()
+        if pid is not None and self._process_exists(pid):
             raise DaemonError(f"Daemon already running (PID: {pid})")
         
         self.settings.ensure_directories()
-        
-        if sys.platform == "win32":
-            self._start_windows()
-        else:
-            self._start_unix()
+
+        self._start_impl()
     
     def stop(self) -> bool:
         """
@@ -76,11 +82,8 @@ class Daemon:
             return False
         
         try:
-            if sys.platform == "win32":
-                self._stop_windows(pid)
-            else:
-                self._stop_unix(pid)
-            
+            self._stop_impl(pid)
+
             self._cleanup_pid_file()
             self._logger.info(f"Daemon stopped (PID: {pid})")
             return True
@@ -203,33 +206,37 @@ class Daemon:
         import signal
         os.kill(pid, signal.SIGTERM)
     
-    def _process_exists(self, pid: int) -> bool:
-        """Check if a process with the given PID exists."""
+    def _process_exists_windows(self, pid: int) -> bool:
+        """Check process existence by querying the handle directly —
+        the old tasklist subprocess cost a fork+exec per status poll."""
+        handle = _kernel32.OpenProcess(
+            _PROCESS_QUERY_LIMITED_INFORMATION, False, pid
+        )
+        if not handle:
+            return False
+        try:
+            exit_code = wintypes.DWORD()
+            if not _kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            _kernel32.CloseHandle(handle)
+
+    def _process_exists_unix(self, pid: int) -> bool:
+        """Check process existence with signal 0."""
         try:
-            if sys.platform == "win32":
-                # Windows: Use tasklist
-                result = subprocess.run(
-                    ["tasklist", "/FI", f"PID eq {pid}"],
-                    capture_output=True,
-                    text=True,
-                )
-                return str(pid) in result.stdout
-            else:
-                # Unix: Send signal 0
-                os.kill(pid, 0)
-                return True
+            os.kill(pid, 0)
+            return True
         except (OSError, ProcessLookupError):
             return False
     
     def _read_pid(self) -> int | None:
-        """Read PID from file."""
+        """Read PID from file (EAFP: one open, no prior stat)."""
         try:
-            if self.pid_file.exists():
-                content = self.pid_file.read_text().strip()
-                return int(content) if content else None
-        except (ValueError, IOError):
-            pass
-        return None
+            content = self.pid_file.read_text().strip()
+            return int(content) if content else None
+        except (FileNotFoundError, ValueError, OSError):
+            return None
     
     def _write_pid(self, pid: int) -> None:
         """Write PID to file."""
@@ -239,10 +246,9 @@ class Daemon:
     def _cleanup_pid_file(self) -> None:
         """Remove the PID file."""
         try:
-            if self.pid_file.exists():
-                self.pid_file.unlink()
-                self._logger.debug(f"Removed PID file: {self.pid_file}")
-        except IOError as e:
+            self.pid_file.unlink(missing_ok=True)
+            self._logger.debug(f"Removed PID file: {self.pid_file}")
+        except OSError as e:
             self._logger.warning(f"Failed to remove PID file: {e}")
     
     def _run_daemon_main(self) -> None:
@@ -264,9 +270,17 @@ class Daemon:
         
         self._logger.info(f"Daemon process started (PID: {os.getpid()})")
         
+        # Faster event loop when the `perf` extra is installed
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
         # Run the main application loop
         lifecycle = LifecycleManager(settings)
-        
+
         try:
             asyncio.run(lifecycle.run())
         except KeyboardInterrupt:
@@ -275,3 +289,16 @@ class Daemon:
             self._logger.exception(f"Daemon crashed: {e}")
         finally:
             self._cleanup_pid_file()
+
+
+# The platform never changes after interpreter start, so bind the
+# right implementations once instead of branching on sys.platform in
+# every start/stop/status call
+if sys.platform == "win32":
+    Daemon._start_impl = Daemon._start_windows
+    Daemon._stop_impl = Daemon._stop_windows
+    Daemon._process_exists = Daemon._process_exists_windows
+else:
+    Daemon._start_impl = Daemon._start_unix
+    Daemon._stop_impl = Daemon._stop_unix
+    Daemon._process_exists = Daemon._process_exists_unix
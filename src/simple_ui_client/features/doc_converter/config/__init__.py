@@ -27,6 +27,7 @@ from simple_ui_client.features.doc_converter.config.converter_config import (
     MarginType,
     ScalingMode,
     PrintMode,
+    ExcelBackend,
     SlideSize,
     OutputType,
     # Config classes
@@ -53,6 +54,7 @@ __all__ = [
     "MarginType",
     "ScalingMode",
     "PrintMode",
+    "ExcelBackend",
     "SlideSize",
     "OutputType",
     # Config classes
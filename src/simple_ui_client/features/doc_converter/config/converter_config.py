@@ -8,12 +8,21 @@ print settings using Pydantic models.
 from __future__ import annotations
 
 import fnmatch
+import hashlib
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+try:
+    # libyaml C bindings: identical semantics to SafeLoader/SafeDumper,
+    # but the parse/emit loops run in C instead of the interpreter
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
 
 
 # ============================================================================
@@ -57,6 +66,12 @@ class PrintMode(str, Enum):
     SCREEN_OPTIMIZED = "screen_optimized"
 
 
+class ExcelBackend(str, Enum):
+    """Engine used for Excel-to-PDF conversion on Windows."""
+    EXCEL = "excel"
+    LIBREOFFICE = "libreoffice"
+
+
 class SlideSize(str, Enum):
     """PowerPoint slide sizes."""
     WIDESCREEN = "widescreen"
@@ -113,6 +128,8 @@ class ConversionConfig(BaseModel):
     workers: int = Field(default=4, ge=1, le=32)
     timeout_minutes: int = Field(default=30, ge=1, le=120)
     keep_temp_files: bool = False
+    recycle_after: int = Field(default=100, ge=1)
+    skip_existing: bool = False
     suffixes: SuffixConfig = Field(default_factory=SuffixConfig)
 
 
@@ -163,6 +180,15 @@ class ExcelPrintConfig(BaseModel):
     orientation: Orientation = Orientation.LANDSCAPE
     paper_size: str = "A4"
 
+    # Force one full recalculation before PDF export (for workbooks
+    # with volatile formulas that would otherwise export stale values)
+    recalculate_before_export: bool = False
+
+    # Windows-only backend choice: Excel COM gives full print-setup
+    # fidelity; headless LibreOffice skips the Office startup cost but
+    # only applies to macro-free workbooks
+    backend: ExcelBackend = ExcelBackend.EXCEL
+
 
 class SheetConfig(BaseModel):
     """Sheet-specific configuration with priority."""
@@ -210,19 +236,35 @@ class ExcelSettings(BaseModel):
     """Excel settings with default and sheet overrides."""
     default: ExcelPrintConfig = Field(default_factory=ExcelPrintConfig)
     sheets: list[SheetConfig] = Field(default_factory=list)
-    
+
+    # Resolution cache: workbooks repeat sheet names across runs, and
+    # each miss costs a full sort + pattern scan + model merge. Keyed
+    # by identity of the sheets list, so reassigning `self.sheets`
+    # (as callers and tests do) invalidates everything at once.
+    _sorted_sheets: list[SheetConfig] = PrivateAttr(default_factory=list)
+    _sheet_cache: dict[str, ExcelPrintConfig] = PrivateAttr(default_factory=dict)
+    _cache_source: list[SheetConfig] | None = PrivateAttr(default=None)
+
     def get_config_for_sheet(self, sheet_name: str) -> ExcelPrintConfig:
         """Get the configuration for a specific sheet."""
-        # Sort by priority (lower = higher priority)
-        sorted_sheets = sorted(
-            [s for s in self.sheets if s.matches_sheet(sheet_name)],
-            key=lambda s: s.priority
-        )
-        
-        if sorted_sheets:
-            return sorted_sheets[0].apply_to(self.default)
-        
-        return self.default
+        if self._cache_source is not self.sheets:
+            # Sort once by priority (lower = higher priority); the
+            # stable sort makes "first match wins" below equivalent to
+            # the old sort-matches-then-take-head
+            self._sorted_sheets = sorted(self.sheets, key=lambda s: s.priority)
+            self._sheet_cache = {}
+            self._cache_source = self.sheets
+
+        cached = self._sheet_cache.get(sheet_name)
+        if cached is None:
+            for sheet in self._sorted_sheets:
+                if sheet.matches_sheet(sheet_name):
+                    cached = sheet.apply_to(self.default)
+                    break
+            else:
+                cached = self.default
+            self._sheet_cache[sheet_name] = cached
+        return cached
 
 
 # ============================================================================
@@ -248,6 +290,14 @@ class PowerPointSettings(BaseModel):
 # Main Config
 # ============================================================================
 
+# Parsed-config cache keyed by file content hash: worker restarts and
+# repeated CLI invocations load the same YAML over and over, and the
+# content key means an edited file is simply a new entry — no mtime
+# races. Bounded LRU so long-lived processes can't accumulate stale
+# configs.
+_CONFIG_CACHE: OrderedDict[str, "ConverterConfig"] = OrderedDict()
+_CONFIG_CACHE_MAX = 32
+
 class ConverterConfig(BaseModel):
     """Root configuration for the document converter."""
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
@@ -269,21 +319,33 @@ class ConverterConfig(BaseModel):
         """
         if config_path is None:
             return cls()
-        
+
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
-        
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        
-        return cls.model_validate(data)
+
+        raw = config_path.read_bytes()
+        key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        config = _CONFIG_CACHE.get(key)
+        if config is None:
+            config = cls.model_validate(yaml.load(raw, Loader=_YamlLoader) or {})
+            _CONFIG_CACHE[key] = config
+            while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+                _CONFIG_CACHE.popitem(last=False)
+        else:
+            _CONFIG_CACHE.move_to_end(key)
+
+        # The cached instance stays pristine; callers get a private
+        # deep copy they are free to mutate (tests reassign
+        # excel.sheets, for example)
+        return config.model_copy(deep=True)
     
     def save(self, config_path: Path) -> None:
         """Save configuration to YAML file."""
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(
+            yaml.dump(
                 self.model_dump(mode="json"),
                 f,
+                Dumper=_YamlDumper,
                 default_flow_style=False,
                 sort_keys=False,
             )
@@ -7,9 +7,13 @@ suffix mapping, temp file management, and summary report generation.
 
 from __future__ import annotations
 
+import io
+import os
 import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -34,19 +38,36 @@ EXCEL_EXTENSIONS = {".xls", ".xlsx", ".xlsm", ".xlsb", ".ods", ".csv"}
 POWERPOINT_EXTENSIONS = {".ppt", ".pptx", ".odp"}
 MACRO_EXCEL_EXTENSIONS = {".xlsm", ".xlsb", ".xltm"}
 
+_ALL_EXTENSIONS = WORD_EXTENSIONS | EXCEL_EXTENSIONS | POWERPOINT_EXTENSIONS
+
+# Extension -> type in one dict probe instead of up to three set
+# membership tests; built from the sets above so both stay in sync
+_EXT_TO_TYPE = {
+    **dict.fromkeys(WORD_EXTENSIONS, FileType.WORD),
+    **dict.fromkeys(EXCEL_EXTENSIONS, FileType.EXCEL),
+    **dict.fromkeys(POWERPOINT_EXTENSIONS, FileType.POWERPOINT),
+}
+
 
 @dataclass
 class ConversionError:
-    """Details of a conversion error."""
+    """
+    Details of a conversion error.
+
+    The timestamp is a monotonic offset (cheap to capture on the hot
+    failure path); wall-clock times are derived at report time from the
+    summary's start anchors.
+    """
     source_path: Path
     error_message: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.monotonic_ns)
 
 
 @dataclass
 class ConversionSummary:
     """Summary of a conversion batch."""
     start_time: datetime
+    start_monotonic_ns: int = field(default_factory=time.monotonic_ns)
     end_time: datetime | None = None
     total_files: int = 0
     successful: int = 0
@@ -90,24 +111,49 @@ class OutputManager:
         self._temp_files: list[Path] = []
         self._summary = ConversionSummary(start_time=datetime.now())
         self._logger = logger.bind(component="OutputManager")
+
+        # Directories already created this run; files sharing an output
+        # folder then cost zero mkdir syscalls after the first
+        self._known_dirs: set[Path] = set()
+
+        # Prefix used for cheap string-based relative paths; discovery
+        # returns paths already rooted under input_dir, so the resolve()
+        # fallback is rarely taken. Output base is cached as a string
+        # for the same reason — get_output_path runs once per file.
+        self._input_prefix = os.fspath(self.input_dir) + os.sep
+        self._output_str = os.fspath(self.output_dir)
+
+        # Suffix lookup built once; get_suffix runs per file in batches
+        self._suffix_by_type = {
+            FileType.WORD: suffix_config.word,
+            FileType.EXCEL: suffix_config.excel,
+            FileType.POWERPOINT: suffix_config.powerpoint,
+        }
         
         # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.output_dir)
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once, remembering it for later calls."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
     
+    @staticmethod
+    def get_file_type_for_ext(ext: str) -> FileType:
+        """Determine the file type from a pre-lowered extension."""
+        return _EXT_TO_TYPE.get(ext, FileType.UNKNOWN)
+
     @staticmethod
     def get_file_type(path: Path) -> FileType:
         """Determine the file type from extension."""
-        ext = path.suffix.lower()
-        
-        if ext in WORD_EXTENSIONS:
-            return FileType.WORD
-        elif ext in EXCEL_EXTENSIONS:
-            return FileType.EXCEL
-        elif ext in POWERPOINT_EXTENSIONS:
-            return FileType.POWERPOINT
-        else:
-            return FileType.UNKNOWN
-    
+        return OutputManager.get_file_type_for_ext(path.suffix.lower())
+
+    @staticmethod
+    def is_macro_ext(ext: str) -> bool:
+        """Check if a pre-lowered extension is macro-enabled Excel."""
+        return ext in MACRO_EXCEL_EXTENSIONS
+
     @staticmethod
     def is_macro_excel(path: Path) -> bool:
         """Check if the file is a macro-enabled Excel file."""
@@ -115,12 +161,7 @@ class OutputManager:
     
     def get_suffix(self, file_type: FileType) -> str:
         """Get the suffix for a file type."""
-        suffixes = {
-            FileType.WORD: self.suffix_config.word,
-            FileType.EXCEL: self.suffix_config.excel,
-            FileType.POWERPOINT: self.suffix_config.powerpoint,
-        }
-        return suffixes.get(file_type, "")
+        return self._suffix_by_type.get(file_type, "")
     
     def get_output_path(self, source_path: Path) -> Path:
         """
@@ -132,25 +173,41 @@ class OutputManager:
         Returns:
             Path for the output PDF.
         """
-        # Get relative path from input directory
-        try:
-            relative = source_path.resolve().relative_to(self.input_dir)
-        except ValueError:
-            # Source is not under input_dir, use just the filename
-            relative = Path(source_path.name)
-        
-        # Get file type and suffix
-        file_type = self.get_file_type(source_path)
-        suffix = self.get_suffix(file_type)
-        
+        # Everything below is plain string math — os.path instead of
+        # Path operators — because this runs once per file per batch and
+        # each Path join/attribute allocates a fresh object. A single
+        # Path is built at the end for API compatibility.
+
+        # Get relative path from input directory; a string-prefix check
+        # avoids the per-file realpath syscall of resolve()
+        source_str = os.fspath(source_path)
+        if source_str.startswith(self._input_prefix):
+            rel_str = source_str[len(self._input_prefix):]
+        else:
+            try:
+                rel_str = os.path.relpath(
+                    os.fspath(source_path.resolve()), self._input_prefix[:-1]
+                )
+                if rel_str == ".." or rel_str.startswith(".." + os.sep):
+                    raise ValueError(rel_str)
+            except ValueError:
+                # Source is not under input_dir, use just the filename
+                rel_str = source_path.name
+
+        # Get file type and suffix (extension lowered once)
+        rel_dir, name = os.path.split(rel_str)
+        stem, ext = os.path.splitext(name)
+        suffix = self.get_suffix(self.get_file_type_for_ext(ext.lower()))
+
         # Create output path: preserve structure, change name and extension
-        output_name = f"{source_path.stem}{suffix}.pdf"
-        output_path = self.output_dir / relative.parent / output_name
-        
+        parent_str = (
+            os.path.join(self._output_str, rel_dir) if rel_dir else self._output_str
+        )
+
         # Ensure parent directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        return output_path
+        self._ensure_dir(Path(parent_str))
+
+        return Path(os.path.join(parent_str, f"{stem}{suffix}.pdf"))
     
     def get_temp_path(self, source_path: Path, extension: str = ".xlsx") -> Path:
         """
@@ -164,8 +221,8 @@ class OutputManager:
             Path for temporary file.
         """
         temp_dir = self.output_dir / ".temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        
+        self._ensure_dir(temp_dir)
+
         temp_path = temp_dir / f"{source_path.stem}_temp{extension}"
         self._temp_files.append(temp_path)
         
@@ -185,28 +242,49 @@ class OutputManager:
             error_message=error_message,
         ))
     
+    def record_batch(self, items: list[tuple[Path, bool, str | None]]) -> None:
+        """
+        Record a batch of conversion outcomes in one pass.
+
+        Args:
+            items: Tuples of (source_path, success, error_message).
+        """
+        for source_path, success, error_message in items:
+            if success:
+                self._summary.successful += 1
+            else:
+                self._summary.failed += 1
+                self._summary.errors.append(ConversionError(
+                    source_path=source_path,
+                    error_message=error_message or "Unknown error",
+                ))
+        self._summary.total_files += len(items)
+
     def cleanup_temp_files(self) -> None:
         """Clean up temporary files if configured."""
         if self.keep_temp:
             self._logger.info(f"Keeping {len(self._temp_files)} temporary files")
             return
-        
-        for temp_path in self._temp_files:
-            try:
-                if temp_path.exists():
-                    temp_path.unlink()
-                    self._logger.debug(f"Deleted temp file: {temp_path}")
-            except Exception as e:
-                self._logger.warning(f"Failed to delete temp file {temp_path}: {e}")
-        
-        # Try to remove temp directory if empty
+
+        # Sweep the .temp tree with scandir instead of unlinking the
+        # recorded list one Path at a time: DirEntry carries the dirent
+        # type, so no per-file stat, and leftovers from a previous
+        # crashed run are collected too
         temp_dir = self.output_dir / ".temp"
-        if temp_dir.exists():
+        for path in _iter_files(os.fspath(temp_dir)):
             try:
-                temp_dir.rmdir()
-            except OSError:
-                pass  # Directory not empty
-        
+                os.unlink(path)
+                self._logger.debug(f"Deleted temp file: {path}")
+            except OSError as e:
+                self._logger.warning(f"Failed to delete temp file {path}: {e}")
+
+        # Try to remove temp directory if empty
+        try:
+            temp_dir.rmdir()
+            self._known_dirs.discard(temp_dir)
+        except OSError:
+            pass  # Directory not empty or never created
+
         self._temp_files.clear()
     
     def generate_summary_report(self) -> Path:
@@ -223,51 +301,49 @@ class OutputManager:
         timestamp = self._summary.start_time.strftime("%Y%m%d%H%M%S")
         report_path = self.output_dir / f"summary_{timestamp}.txt"
         
-        # Build report content
-        lines = [
-            "=" * 60,
-            "DOCUMENT CONVERSION SUMMARY REPORT",
-            "=" * 60,
-            "",
-            f"Start Time:    {self._summary.start_time.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"End Time:      {self._summary.end_time.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Duration:      {(self._summary.end_time - self._summary.start_time).total_seconds():.1f} seconds",
-            "",
-            f"Total Files:   {self._summary.total_files}",
-            f"Successful:    {self._summary.successful}",
-            f"Failed:        {self._summary.failed}",
-            "",
-            f"Output Dir:    {self._summary.output_dir}",
-            "",
-        ]
-        
+        # Build report content in one buffer, flushed with a single write
+        rule = "=" * 60
+        sep = "-" * 60
+        buf = io.StringIO()
+        buf.write(
+            f"{rule}\n"
+            "DOCUMENT CONVERSION SUMMARY REPORT\n"
+            f"{rule}\n"
+            "\n"
+            f"Start Time:    {self._summary.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"End Time:      {self._summary.end_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Duration:      {(self._summary.end_time - self._summary.start_time).total_seconds():.1f} seconds\n"
+            "\n"
+            f"Total Files:   {self._summary.total_files}\n"
+            f"Successful:    {self._summary.successful}\n"
+            f"Failed:        {self._summary.failed}\n"
+            "\n"
+            f"Output Dir:    {self._summary.output_dir}\n"
+            "\n"
+        )
+
         if self._summary.errors:
-            lines.extend([
-                "-" * 60,
-                "ERRORS",
-                "-" * 60,
-                "",
-            ])
-            
+            buf.write(f"{sep}\nERRORS\n{sep}\n\n")
+
+            anchor = self._summary.start_time
+            anchor_ns = self._summary.start_monotonic_ns
             for error in self._summary.errors:
-                lines.extend([
-                    f"File: {error.source_path}",
-                    f"Error: {error.error_message}",
-                    f"Time: {error.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-                    "",
-                ])
+                wall = anchor + timedelta(
+                    microseconds=(error.timestamp_ns - anchor_ns) / 1000
+                )
+                buf.write(
+                    f"File: {error.source_path}\n"
+                    f"Error: {error.error_message}\n"
+                    f"Time: {wall.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    "\n"
+                )
         else:
-            lines.extend([
-                "-" * 60,
-                "No errors occurred.",
-                "-" * 60,
-            ])
-        
-        lines.append("")
-        lines.append("=" * 60)
-        
+            buf.write(f"{sep}\nNo errors occurred.\n{sep}\n")
+
+        buf.write(f"\n{rule}")
+
         # Write report
-        report_path.write_text("\n".join(lines), encoding="utf-8")
+        report_path.write_text(buf.getvalue(), encoding="utf-8")
         
         self._logger.info(f"Summary report generated: {report_path}")
         
@@ -279,29 +355,71 @@ class OutputManager:
         return self._summary
 
 
+def _iter_files(root: str):
+    """Yield every file path under root, using scandir's cached type info."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_files(entry.path)
+                else:
+                    yield entry.path
+    except OSError:
+        pass
+
+
+def _scan_dir(path: str) -> tuple[list[Path], list[str]]:
+    """Scan one directory, returning (matching files, subdirectories)."""
+    matches: list[Path] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in _ALL_EXTENSIONS:
+                    matches.append(Path(entry.path))
+    except OSError:
+        pass
+    return matches, subdirs
+
+
 def discover_files(input_dir: Path, recursive: bool = True) -> list[Path]:
     """
     Discover Office documents in a directory.
-    
+
+    Each directory is read exactly once with os.scandir and the entry's
+    extension checked against the combined set. Recursive scans fan
+    subdirectories out across a small thread pool — scandir releases
+    the GIL during the syscall, which keeps several directory reads in
+    flight on network filesystems instead of waiting on them serially.
+
     Args:
         input_dir: Directory to search.
         recursive: Whether to search recursively.
-        
+
     Returns:
         List of Office document paths.
     """
-    all_extensions = WORD_EXTENSIONS | EXCEL_EXTENSIONS | POWERPOINT_EXTENSIONS
-    
     files: list[Path] = []
-    
-    if recursive:
-        for ext in all_extensions:
-            files.extend(input_dir.rglob(f"*{ext}"))
+
+    if not recursive:
+        files, _ = _scan_dir(os.fspath(input_dir))
     else:
-        for ext in all_extensions:
-            files.extend(input_dir.glob(f"*{ext}"))
-    
+        max_workers = min(32, (os.cpu_count() or 4) * 4)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scan"
+        ) as pool:
+            pending = {pool.submit(_scan_dir, os.fspath(input_dir))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    matches, subdirs = future.result()
+                    files.extend(matches)
+                    for subdir in subdirs:
+                        pending.add(pool.submit(_scan_dir, subdir))
+
     # Sort by path for consistent ordering
     files.sort()
-    
+
     return files
@@ -6,6 +6,9 @@ Defines the interface that platform-specific converters must implement.
 
 from __future__ import annotations
 
+import errno
+import os
+import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -21,7 +24,13 @@ if TYPE_CHECKING:
 
 @dataclass
 class ConversionResult:
-    """Result of a document conversion."""
+    """Result of a document conversion.
+
+    Output normally lands at output_path; converters supporting
+    in-memory hand-off set shared_memory_name instead, and consumers
+    attach to that multiprocessing.shared_memory segment by name (the
+    attaching side owns unlinking it).
+    """
     success: bool
     source_path: Path
     output_path: Path | None = None
@@ -29,6 +38,32 @@ class ConversionResult:
     duration_seconds: float = 0.0
     pages: int = 0
     metadata: dict[str, str] = field(default_factory=dict)
+    shared_memory_name: str | None = None
+
+
+def move_into_place(src: Path | str, dst: Path | str) -> None:
+    """
+    Move a finished output into its final location.
+
+    os.replace is atomic and copies zero bytes when both paths share a
+    filesystem — the common case. A cross-filesystem target raises
+    EXDEV, which falls back to shutil.move; its copy path rides the
+    kernel's zero-copy sendfile/copy_file_range on platforms that have
+    one, so the PDF never round-trips through Python bytes objects.
+
+    Args:
+        src: Path the converter wrote.
+        dst: Final output path (parent must exist).
+
+    Raises:
+        OSError: On failures other than a cross-filesystem rename.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(os.fspath(src), os.fspath(dst))
 
 
 class BaseConverter(ABC):
@@ -129,15 +164,39 @@ class BaseConverter(ABC):
     ) -> ConversionResult:
         """
         Convert XLSM/XLM to XLSX (remove macros).
-        
+
         Args:
             source: Path to the XLSM/XLM file.
             target: Path for the output XLSX.
-            
+
         Returns:
             ConversionResult with success status.
         """
         pass
+
+    @abstractmethod
+    def convert_xlsm(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+    ) -> ConversionResult:
+        """
+        Convert a macro-enabled Excel file directly to PDF.
+
+        Single-session alternative to convert_xlsm_to_xlsx followed by
+        convert_excel: the workbook is opened once and exported straight
+        to PDF (macros are never part of the PDF output).
+
+        Args:
+            source: Path to the XLSM/XLSB file.
+            target: Path for the output PDF.
+            config: Excel print configuration.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        pass
     
     @property
     @abstractmethod
@@ -16,6 +16,10 @@ Created: December 2024
 
 from __future__ import annotations
 
+import os
+import subprocess
+import tempfile
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -25,6 +29,7 @@ from loguru import logger
 from simple_ui_client.features.doc_converter.engine.base import (
     BaseConverter,
     ConversionResult,
+    move_into_place,
 )
 
 # Import individual document converters
@@ -84,43 +89,115 @@ class LinuxConverter(BaseConverter):
         """
         # Store path for reference
         self._libreoffice_path = libreoffice_path
-        
-        # Create individual converters for each document type
-        # Each converter handles one document type independently
-        self._word_converter = LinuxWordConverter(libreoffice_path)
-        self._excel_converter = LinuxExcelConverter(libreoffice_path)
-        self._powerpoint_converter = LinuxPowerPointConverter(libreoffice_path)
-        
+
+        # Dispatch table owning the per-type converters, filled lazily by
+        # _conv() — the single place converters get constructed
+        self._converters: dict[str, object] = {}
+
         # Setup logging with component context
         self._logger = logger.bind(component="LinuxConverter")
-        
+
         self._logger.debug(f"Initialized with LibreOffice path: {libreoffice_path}")
+
+    def _conv(self, kind: str):
+        """
+        Get (building on first use) the converter for a document kind.
+
+        A typical batch touches one or two document types, so unused
+        converters — and their bound loggers — are never constructed.
+        Classes are resolved at call time so tests can patch them.
+
+        Args:
+            kind: One of "word", "excel", or "powerpoint".
+
+        Returns:
+            The cached converter instance for that kind.
+        """
+        converter = self._converters.get(kind)
+        if converter is None:
+            if kind == "word":
+                converter = LinuxWordConverter(self._libreoffice_path)
+            elif kind == "excel":
+                converter = LinuxExcelConverter(self._libreoffice_path)
+            else:
+                converter = LinuxPowerPointConverter(self._libreoffice_path)
+            self._converters[kind] = converter
+        return converter
+
+    # Typed shims over the dispatch table for the delegating methods below
+
+    @property
+    def _word_converter(self) -> LinuxWordConverter:
+        """Word converter, created on first Word conversion."""
+        return self._conv("word")
+
+    @property
+    def _excel_converter(self) -> LinuxExcelConverter:
+        """Excel converter, created on first Excel conversion."""
+        return self._conv("excel")
+
+    @property
+    def _powerpoint_converter(self) -> LinuxPowerPointConverter:
+        """PowerPoint converter, created on first PowerPoint conversion."""
+        return self._conv("powerpoint")
     
     def initialize(self) -> None:
         """
-        Initialize the converter.
-        
-        On Linux with LibreOffice, no special initialization is needed.
-        Each subprocess handles its own LibreOffice instance.
-        
-        This method exists to satisfy the BaseConverter interface.
+        Initialize the converter by warming a LibreOffice profile.
+
+        soffice provisions every fresh UserInstallation directory on
+        first run — 50-200 small-file writes that otherwise land inside
+        the first conversion. A throwaway soffice run provisions one
+        template profile here; subsequent per-call profiles are cheap
+        copies of it (see profiles.make_profile).
+
+        Warm-up failures are logged and ignored: conversion still works,
+        the first call just pays the provisioning cost as before.
+
         On Windows, this is where COM would be initialized.
         """
-        # No-op for LibreOffice - each subprocess is independent
-        self._logger.debug("Linux converter ready (no initialization needed)")
+        from simple_ui_client.features.doc_converter.engine.linux import profiles, uno_pool
+
+        template = tempfile.mkdtemp(prefix="lo-template-")
+        try:
+            subprocess.run(
+                [
+                    self._libreoffice_path,
+                    "--headless",
+                    "--terminate_after_init",
+                    f"-env:UserInstallation=file://{template}",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=60,
+            )
+            profiles.set_template(template)
+            self._logger.debug(f"Warmed LibreOffice profile template: {template}")
+        except (OSError, subprocess.SubprocessError) as e:
+            self._logger.warning(f"LibreOffice profile warm-up skipped: {e}")
+
+        # Boot one warm UNO session in the background so the first
+        # conversion finds a running soffice instead of paying the
+        # daemon start itself. No-op when the uno bindings are missing.
+        pool = uno_pool.get_uno_pool(self._libreoffice_path)
+        if pool is not None:
+            threading.Thread(target=pool.warm, daemon=True).start()
     
     def cleanup(self) -> None:
         """
         Clean up resources.
-        
-        On Linux with LibreOffice, no cleanup is needed.
-        Subprocesses clean themselves up when they exit.
-        
-        This method exists to satisfy the BaseConverter interface.
+
+        Per-file subprocesses clean themselves up when they exit, but the
+        optional UNO pool keeps warm soffice instances alive and must be
+        shut down explicitly.
+
         On Windows, this would uninitialize COM.
         """
-        # No-op for LibreOffice - subprocesses handle their own cleanup
-        self._logger.debug("Linux converter cleanup (no action needed)")
+        from simple_ui_client.features.doc_converter.engine.linux import uno_pool
+
+        if uno_pool._pool is not None:
+            uno_pool._pool.shutdown()
+        self._logger.debug("Linux converter cleanup complete")
     
     def convert_word(
         self,
@@ -166,6 +243,126 @@ class LinuxConverter(BaseConverter):
         """
         return self._excel_converter.convert(source, target, config, sheet_name)
     
+    def convert_excel_batch(
+        self,
+        pairs: list[tuple[Path, Path]],
+        config: "ExcelPrintConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert several Excel spreadsheets, batching soffice invocations.
+
+        Pairs sharing an output directory are converted in one soffice
+        run (one process cold start per directory instead of per file),
+        then renamed from LibreOffice's "<stem>.pdf" naming to each
+        requested target.
+
+        Args:
+            pairs: (source, target) path pairs to convert.
+            config: Excel print configuration.
+            timeout: Maximum time per soffice invocation in seconds.
+
+        Returns:
+            One ConversionResult per pair, in input order.
+        """
+        return self._convert_pairs_batched(
+            pairs, self._excel_converter.convert_batch, config, timeout
+        )
+
+    def convert_word_batch(
+        self,
+        pairs: list[tuple[Path, Path]],
+        config: "WordConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert several Word documents, batching soffice invocations.
+
+        Same scheme as convert_excel_batch: pairs sharing an output
+        directory go through one soffice run, then outputs are renamed
+        to each requested target.
+
+        Args:
+            pairs: (source, target) path pairs to convert.
+            config: Word print configuration.
+            timeout: Maximum time per soffice invocation in seconds.
+
+        Returns:
+            One ConversionResult per pair, in input order.
+        """
+        return self._convert_pairs_batched(
+            pairs, self._word_converter.convert_batch, config, timeout
+        )
+
+    def convert_powerpoint_batch(
+        self,
+        pairs: list[tuple[Path, Path]],
+        config: "PowerPointConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert several PowerPoint presentations, batching soffice runs.
+
+        Same scheme as convert_excel_batch: pairs sharing an output
+        directory go through one soffice run, then outputs are renamed
+        to each requested target.
+
+        Args:
+            pairs: (source, target) path pairs to convert.
+            config: PowerPoint configuration.
+            timeout: Maximum time per soffice invocation in seconds.
+
+        Returns:
+            One ConversionResult per pair, in input order.
+        """
+        return self._convert_pairs_batched(
+            pairs, self._powerpoint_converter.convert_batch, config, timeout
+        )
+
+    def _convert_pairs_batched(
+        self,
+        pairs: list[tuple[Path, Path]],
+        batch_convert,
+        config,
+        timeout: int,
+    ) -> list[ConversionResult]:
+        """
+        Shared (source, target) batching used by the convert_*_batch APIs.
+
+        Groups pairs by output directory (soffice only takes one
+        --outdir per run), converts each group in a single invocation,
+        then renames LibreOffice's "<stem>.pdf" outputs to the
+        requested targets.
+        """
+        # Group by output directory — soffice only takes one --outdir
+        groups: dict[Path, list[tuple[int, Path, Path]]] = {}
+        for index, (source, target) in enumerate(pairs):
+            groups.setdefault(target.parent, []).append((index, source, target))
+
+        results: list[ConversionResult | None] = [None] * len(pairs)
+        for output_dir, group in groups.items():
+            batch_results = batch_convert(
+                [source for _, source, _ in group],
+                output_dir,
+                config,
+                timeout=timeout,
+            )
+            for (index, source, target), result in zip(group, batch_results):
+                if result.success and result.output_path and result.output_path != target:
+                    try:
+                        move_into_place(result.output_path, target)
+                        result.output_path = target
+                    except OSError as e:
+                        result = ConversionResult(
+                            success=False,
+                            source_path=source,
+                            error=f"Failed to move output to {target}: {e}",
+                            duration_seconds=result.duration_seconds,
+                        )
+                results[index] = result
+
+        return results  # type: ignore[return-value]
+
     def convert_powerpoint(
         self,
         source: Path,
@@ -206,7 +403,62 @@ class LinuxConverter(BaseConverter):
             ConversionResult with success status and details.
         """
         return self._excel_converter.convert_xlsm_to_xlsx(source, target)
-    
+
+    def convert_xlsm(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+    ) -> ConversionResult:
+        """
+        Convert a macro-enabled Excel file directly to PDF.
+
+        Single soffice invocation — LibreOffice ignores macros on PDF
+        export. Delegates to LinuxExcelConverter.
+
+        Args:
+            source: Path to the XLSM/XLSB file with macros.
+            target: Desired output path for the PDF file.
+            config: Excel print configuration.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        return self._excel_converter.convert_xlsm(source, target, config)
+
+    def convert_many(
+        self,
+        jobs: list[tuple[str, Path, Path, object]],
+        max_workers: int | None = None,
+    ) -> list[ConversionResult]:
+        """
+        Convert a heterogeneous batch of documents across CPU cores.
+
+        supports_parallel promises caller-side parallelism is safe, but
+        callers rolling their own pools hit soffice's shared-profile
+        collisions. This is the supported path: a ProcessPoolExecutor
+        whose workers each get a private HOME (so every soffice profile
+        tree is distinct) and reuse one converter per worker process.
+
+        Args:
+            jobs: (kind, source, target, config) tuples, where kind is
+                "word", "excel", or "powerpoint" and config is the
+                matching print configuration.
+            max_workers: Worker process count; defaults to the CPU count.
+
+        Returns:
+            One ConversionResult per job, in input order.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._logger.info(f"Converting {len(jobs)} documents in parallel")
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            initializer=_init_worker,
+            initargs=(self._libreoffice_path,),
+        ) as executor:
+            return list(executor.map(_run_job, jobs, chunksize=4))
+
     @property
     def supports_parallel(self) -> bool:
         """
@@ -225,10 +477,48 @@ class LinuxConverter(BaseConverter):
     def name(self) -> str:
         """
         Human-readable name of this converter.
-        
+
         Used for logging and user messages.
-        
+
         Returns:
             String identifying this converter.
         """
         return "Linux LibreOffice"
+
+
+# ============================================================================
+# convert_many worker-process helpers (must be module-level to pickle)
+# ============================================================================
+
+# One converter per worker process, created by _init_worker
+_worker_converter: LinuxConverter | None = None
+
+
+def _init_worker(libreoffice_path: str) -> None:
+    """
+    Initialize a convert_many pool worker.
+
+    Points HOME at a private temp directory so this worker's soffice
+    processes provision their profiles there — no collisions with other
+    workers or the user's real ~/.config/libreoffice — and builds the
+    converter the worker will reuse for all its jobs.
+    """
+    global _worker_converter
+    os.environ["HOME"] = tempfile.mkdtemp(prefix="lo-worker-home-")
+    _worker_converter = LinuxConverter(libreoffice_path)
+
+
+def _run_job(job: tuple[str, Path, Path, object]) -> ConversionResult:
+    """Run one (kind, source, target, config) job on the worker converter."""
+    kind, source, target, config = job
+    if kind == "word":
+        return _worker_converter.convert_word(source, target, config)
+    if kind == "excel":
+        return _worker_converter.convert_excel(source, target, config)
+    if kind == "powerpoint":
+        return _worker_converter.convert_powerpoint(source, target, config)
+    return ConversionResult(
+        success=False,
+        source_path=source,
+        error=f"Unknown document kind: {kind}",
+    )
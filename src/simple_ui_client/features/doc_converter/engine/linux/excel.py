@@ -15,22 +15,73 @@ Created: December 2024
 from __future__ import annotations
 
 # Standard library imports
+import asyncio    # Non-blocking subprocess execution
+import csv        # Direct CSV/TSV parsing for the ReportLab fast path
+import json       # Encode FilterData for --convert-to filter options
+import os         # CPU count for concurrency limit
+import re         # Patch OOXML metadata when stripping macros
+import shutil     # Remove per-task LibreOffice profiles
+import signal     # Kill soffice process groups on timeout
 import subprocess  # Run LibreOffice as external process
+import tempfile   # Scratch directory for per-sheet PDF parts
 import time       # Measure conversion time
+import zipfile    # XLSM files are zip archives (OOXML)
+from concurrent.futures import ThreadPoolExecutor  # Parallel per-sheet export
 from pathlib import Path  # Cross-platform path handling
-from typing import TYPE_CHECKING  # Type hints without runtime import
+from typing import TYPE_CHECKING, ClassVar  # Type hints without runtime import
 
 # Structured logging library
 from loguru import logger
 
-# Our base conversion result type
-from simple_ui_client.features.doc_converter.engine.base import ConversionResult
+# Our base conversion result type and output finalization helper
+from simple_ui_client.features.doc_converter.engine.base import (
+    ConversionResult,
+    move_into_place,
+)
+
+# Per-call profile directories, cloned from the warm template when
+# LinuxConverter.initialize() has run
+from simple_ui_client.features.doc_converter.engine.linux.profiles import make_profile
+
+# Optional pool of warm soffice instances (None when uno is unavailable)
+from simple_ui_client.features.doc_converter.engine.linux.uno_pool import get_uno_pool
+
+# Direct PDF rendering for delimited text when the `perf` extra is
+# installed; without it CSVs take the normal LibreOffice path
+try:
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table
+
+    _REPORTLAB_AVAILABLE = True
+except ImportError:
+    _REPORTLAB_AVAILABLE = False
+
+# PDF merging for the parallel per-sheet export path, also part of the
+# `perf` extra; without it multi-sheet requests use one soffice run
+try:
+    from pypdf import PdfWriter
+
+    _PYPDF_AVAILABLE = True
+except ImportError:
+    _PYPDF_AVAILABLE = False
 
 # Import config type only for type checking (avoids circular imports)
 if TYPE_CHECKING:
     from simple_ui_client.features.doc_converter.config import ExcelPrintConfig
 
 
+# OOXML pieces that make a workbook "macro-enabled": the VBA blob itself,
+# its workbook content type, and the relationship pointing at the blob
+_VBA_PART = "xl/vbaProject.bin"
+_MACRO_CONTENT_TYPE = b"application/vnd.ms-excel.sheet.macroEnabled.main+xml"
+_SHEET_CONTENT_TYPE = (
+    b"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+)
+_VBA_OVERRIDE_RE = re.compile(rb"<Override[^>]*vbaProject\.bin[^>]*/>")
+_VBA_RELATIONSHIP_RE = re.compile(rb"<Relationship[^>]*vbaProject[^>]*/>")
+
+
 class LinuxExcelConverter:
     """
     Converts Excel spreadsheets to PDF using LibreOffice Calc on Linux.
@@ -62,17 +113,248 @@ class LinuxExcelConverter:
         )
     """
     
+    # Flags identical for every soffice invocation; hoisted so each call
+    # splices only its per-call parts instead of rebuilding the full list
+    _BASE_ARGS: ClassVar[tuple[str, ...]] = (
+        "--headless",            # No GUI
+        "--invisible",           # Hidden processing
+        "--nologo",              # No splash screen
+        "--nofirststartwizard",  # Skip first-run wizard
+    )
+
     def __init__(self, libreoffice_path: str = "libreoffice") -> None:
         """
         Initialize the Excel converter.
-        
+
         Args:
             libreoffice_path: Path to LibreOffice executable.
                             Defaults to "libreoffice" (must be in system PATH).
         """
         self._libreoffice = libreoffice_path
+        # Executable + invariant flags, ready to splice per call
+        self._prefix = (libreoffice_path, *self._BASE_ARGS)
         self._logger = logger.bind(component="LinuxExcelConverter")
-    
+
+    # Caps concurrent soffice subprocesses across all convert_async()
+    # callers; created lazily so it binds to the running event loop
+    _semaphore: asyncio.Semaphore | None = None
+
+    @staticmethod
+    def _make_filter_data(config: "ExcelPrintConfig") -> dict[str, object]:
+        """
+        Translate the print config into calc_pdf_Export FilterData.
+
+        Only options the export filter actually understands are emitted.
+        Scaling modes and per-sheet page setup live in page styles that
+        the filter cannot touch, so those remain engine limitations —
+        but they are no longer silently discarded along with everything
+        else.
+
+        Args:
+            config: Excel print configuration.
+
+        Returns:
+            FilterData options for the PDF export filter.
+        """
+        data: dict[str, object] = {"IsSkipEmptyPages": True}
+        if config.print_header_footer:
+            data["ExportNotesPages"] = False
+        if config.mode == "one_page":
+            # Lossless keeps one-page summaries crisp when zoomed
+            data["UseLosslessCompression"] = True
+        return data
+
+    @staticmethod
+    def _pdf_convert_target(filter_data: dict[str, object]) -> str:
+        """
+        Build the --convert-to value carrying FilterData options.
+
+        LibreOffice accepts filter options as a JSON object of
+        {"Name": {"type": ..., "value": ...}} entries appended to the
+        filter name.
+        """
+        encoded = {
+            name: {
+                "type": "boolean" if isinstance(value, bool) else "long"
+                if isinstance(value, int) else "string",
+                "value": str(value).lower() if isinstance(value, bool) else str(value),
+            }
+            for name, value in filter_data.items()
+        }
+        return f"pdf:calc_pdf_Export:{json.dumps(encoded)}"
+
+    def _run_soffice(
+        self,
+        args: tuple[str, ...],
+        timeout: int,
+        *,
+        capture_stdout: bool = False,
+    ) -> tuple[int, bytes, bytes]:
+        """
+        Run one soffice invocation, reaping its whole tree on timeout.
+
+        The libreoffice executable is a wrapper that forks soffice.bin,
+        so killing only the direct child on timeout leaves the grandchild
+        alive holding profile locks — which then corrupts or serializes
+        subsequent parallel conversions. Each run already gets its own
+        session (start_new_session), so on timeout the entire process
+        group is signalled: SIGTERM, a 5-second grace, then SIGKILL.
+
+        Args:
+            args: Full soffice argument tuple.
+            timeout: Seconds to wait before killing the process group.
+            capture_stdout: Capture stdout (convert_batch parses it)
+                instead of discarding it.
+
+        Returns:
+            (returncode, stdout, stderr); stdout is b"" unless captured.
+
+        Raises:
+            subprocess.TimeoutExpired: After the process tree is dead.
+        """
+        process = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,         # Keeps posix_spawn eligibility
+            start_new_session=True,  # Own process group for soffice
+        )
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill_group(process)
+            raise
+        return process.returncode, stdout or b"", stderr or b""
+
+    def _kill_group(self, process: subprocess.Popen) -> None:
+        """SIGTERM a run's process group, escalating to SIGKILL."""
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            process.wait()
+
+    async def convert_async(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+        timeout: int = 600,
+    ) -> ConversionResult:
+        """
+        Convert an Excel spreadsheet to PDF without blocking the event loop.
+
+        Unlike convert(), which parks a worker thread in subprocess.run(),
+        this spawns soffice with asyncio.create_subprocess_exec so many
+        conversions can run concurrently from a single task set. A
+        class-wide semaphore caps concurrency at the CPU count, and each
+        invocation gets its own -env:UserInstallation profile directory so
+        parallel soffice processes never fight over the shared profile
+        lock (which silently serializes them).
+
+        Args:
+            source: Path to the Excel file to convert.
+            target: Desired path for the output PDF.
+            config: Excel print configuration (limited LibreOffice support).
+            timeout: Maximum conversion time in seconds.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        if LinuxExcelConverter._semaphore is None:
+            LinuxExcelConverter._semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async with LinuxExcelConverter._semaphore:
+            start_ns = time.perf_counter_ns()
+            self._logger.info(f"Converting Excel spreadsheet (async): {source.name}")
+
+            output_dir = target.parent
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Private profile per invocation — see docstring
+            profile = make_profile()
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *self._prefix,
+                    f"-env:UserInstallation=file://{profile}",
+                    "--convert-to",
+                    self._pdf_convert_target(self._make_filter_data(config)),
+                    "--outdir", str(output_dir),
+                    str(source),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        process.communicate(), timeout=timeout
+                    )
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    self._logger.error(f"Excel conversion timed out after {timeout}s")
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=f"Conversion timed out after {timeout} seconds. "
+                              f"Try increasing timeout for large spreadsheets.",
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                if process.returncode != 0:
+                    error = (
+                        stderr.decode(errors="replace").strip()
+                        or "LibreOffice conversion failed"
+                    )
+                    self._logger.error(f"LibreOffice Calc error: {error}")
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=error,
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                # LibreOffice names output as "filename.pdf" in output dir;
+                # move it into place EAFP — an atomic rename (zero-copy
+                # cross-device fallback) instead of an exists() stat
+                # followed by a rename
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if generated_pdf != target:
+                    try:
+                        move_into_place(generated_pdf, target)
+                    except FileNotFoundError:
+                        pass  # soffice produced no output; handled below
+
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                self._logger.info(
+                    f"Excel conversion complete: {target.name} ({duration:.1f}s)"
+                )
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=duration,
+                )
+
+            except Exception as e:
+                self._logger.error(f"Excel conversion failed unexpectedly: {e}")
+                return ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=str(e),
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                )
+            finally:
+                shutil.rmtree(profile, ignore_errors=True)
+
     def convert(
         self,
         source: Path,
@@ -107,9 +389,46 @@ class LinuxExcelConverter:
             Check result.success before using result.output_path.
         """
         # Start timing the conversion
-        start_time = time.time()
-        
+        start_ns = time.perf_counter_ns()
+        profile: str | None = None
+
         try:
+            # Reject mismatched targets before paying for soffice — the
+            # output would be a PDF under a misleading name
+            if target.suffix.lower() != ".pdf":
+                return ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=f"Target must be a .pdf path, got: {target.name}",
+                )
+
+            # Already a PDF: nothing to convert. Hardlink when possible
+            # (single inode operation, no bytes copied), copy otherwise
+            if source.suffix.lower() == ".pdf":
+                target.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(source, target)
+                except OSError:
+                    shutil.copyfile(source, target)
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=0.0,
+                )
+
+            # Delimited text doesn't need LibreOffice at all — render it
+            # straight to PDF when ReportLab is installed
+            if _REPORTLAB_AVAILABLE and source.suffix.lower() in (".csv", ".tsv"):
+                return self._render_csv_pdf(source, target, config)
+
+            # Materialize path pieces once up front — PurePath.__str__
+            # re-joins segments and .stem/.name re-slice on every access
+            src_str = os.fspath(source)
+            stem = source.stem
+            output_dir = target.parent
+            out_dir_str = os.fspath(output_dir)
+
             self._logger.info(f"Converting Excel spreadsheet: {source.name}")
             
             # ===================================================================
@@ -126,11 +445,44 @@ class LinuxExcelConverter:
             # ===================================================================
             # STEP 2: Prepare output directory
             # ===================================================================
-            output_dir = target.parent
             output_dir.mkdir(parents=True, exist_ok=True)
-            
+
             # ===================================================================
-            # STEP 3: Build LibreOffice command with filter options
+            # STEP 3: Try the persistent UNO pool (fast path)
+            # ===================================================================
+            # When LibreOffice's `uno` bindings are importable, the document
+            # is converted on a pool of already-warm soffice instances,
+            # skipping the per-file process cold start. Any pool failure
+            # falls through to the subprocess path below.
+            # Options the PDF export filter can honor, derived from config
+            filter_data = self._make_filter_data(config)
+
+            pool = get_uno_pool(self._libreoffice)
+            if pool is not None:
+                try:
+                    pool.convert_to_pdf(
+                        source, target, "calc_pdf_Export", filter_data,
+                        sheet_name=sheet_name,
+                    )
+                    duration = (time.perf_counter_ns() - start_ns) / 1e9
+                    self._logger.info(
+                        f"Excel conversion complete (UNO pool): "
+                        f"{target.name} ({duration:.1f}s)"
+                    )
+                    return ConversionResult(
+                        success=True,
+                        source_path=source,
+                        output_path=target,
+                        duration_seconds=duration,
+                    )
+                except Exception as e:
+                    self._logger.warning(
+                        f"UNO pool conversion failed, "
+                        f"falling back to subprocess: {e}"
+                    )
+
+            # ===================================================================
+            # STEP 4: Build LibreOffice command with filter options
             # ===================================================================
             # LibreOffice can accept PDF export filters, but support is limited.
             # The "calc_pdf_Export" filter accepts some options like:
@@ -138,59 +490,71 @@ class LinuxExcelConverter:
             #   - Selection: export only selected cells
             #   - UseLosslessCompression: for images
             # However, most Excel-specific settings are not supported.
-            
-            args = [
-                self._libreoffice,
-                "--headless",           # No GUI
-                "--invisible",          # Hidden processing
-                "--nologo",             # No splash screen
-                "--nofirststartwizard", # Skip first-run wizard
-                "--convert-to", "pdf",  # Output format
-                "--outdir", str(output_dir),  # Output directory
-                str(source),            # Input file
-            ]
+
+            # Private profile per invocation: concurrent soffice processes
+            # sharing the default profile queue up on its lock and silently
+            # serialize (or hand the job to an existing instance and exit
+            # before the PDF is written). Cleaned up in the finally below.
+            profile = make_profile()
+
+            args = (
+                *self._prefix,          # Executable + invariant flags
+                f"-env:UserInstallation=file://{profile}",  # Isolated profile
+                # Output format, with FilterData options appended
+                "--convert-to", self._pdf_convert_target(filter_data),
+                "--outdir", out_dir_str,  # Output directory
+                src_str,                # Input file
+            )
             
             # ===================================================================
-            # STEP 4: Execute the conversion
+            # STEP 5: Execute the conversion
             # ===================================================================
             # Excel files with many sheets/formulas may take longer
             self._logger.debug(f"Running LibreOffice with timeout={timeout}s")
             
-            result = subprocess.run(
-                args,
-                capture_output=True,  # Capture stdout/stderr
-                text=True,            # Return as string
-                timeout=timeout,      # Maximum wait time
-            )
-            
+            returncode, _, stderr = self._run_soffice(args, timeout)
+
             # ===================================================================
-            # STEP 5: Check for errors
+            # STEP 6: Check for errors
             # ===================================================================
-            if result.returncode != 0:
-                error = result.stderr or result.stdout or "LibreOffice conversion failed"
+            if returncode != 0:
+                error = (
+                    stderr.decode(errors="replace").strip()
+                    or "LibreOffice conversion failed"
+                )
                 self._logger.error(f"LibreOffice Calc error: {error}")
                 
                 return ConversionResult(
                     success=False,
                     source_path=source,
                     error=error,
-                    duration_seconds=time.time() - start_time,
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
                 )
             
             # ===================================================================
-            # STEP 6: Handle output file naming
+            # STEP 7: Handle output file naming
             # ===================================================================
-            # LibreOffice names output as "filename.pdf" in output directory
-            generated_pdf = output_dir / f"{source.stem}.pdf"
-            
-            # Rename to target path if different
-            if generated_pdf != target and generated_pdf.exists():
-                generated_pdf.rename(target)
-            
+            # LibreOffice names output as "filename.pdf" in output directory.
+            # Move it into place EAFP: attempt the rename directly and
+            # retry briefly on FileNotFoundError, since soffice can return
+            # before the file is visible on some filesystems. This replaces
+            # the old exists() poll + rename with a single syscall per try.
+            generated_pdf = output_dir / f"{stem}.pdf"
+            if generated_pdf != target:
+                poll_deadline = time.monotonic() + 2.0
+                while True:
+                    try:
+                        move_into_place(generated_pdf, target)
+                        break
+                    except FileNotFoundError:
+                        if time.monotonic() >= poll_deadline:
+                            break
+                        time.sleep(0.05)
+
             # ===================================================================
-            # STEP 7: Return success
+            # STEP 8: Return success
             # ===================================================================
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self._logger.info(
                 f"Excel conversion complete: {target.name} ({duration:.1f}s)"
             )
@@ -209,7 +573,7 @@ class LinuxExcelConverter:
                 source_path=source,
                 error=f"Conversion timed out after {timeout} seconds. "
                       f"Try increasing timeout for large spreadsheets.",
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
             
         except Exception as e:
@@ -218,9 +582,407 @@ class LinuxExcelConverter:
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
-    
+
+        finally:
+            if profile is not None:
+                shutil.rmtree(profile, ignore_errors=True)
+
+    def convert_sheets(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+        sheet_names: list[str],
+        timeout: int = 600,
+        workers: int | None = None,
+    ) -> ConversionResult:
+        """
+        Export named sheets concurrently and merge them into one PDF.
+
+        Exporting sheets one at a time serializes on soffice; each sheet
+        here becomes its own export running on the UNO pool (or its own
+        soffice subprocess), fanned out across a thread pool, and the
+        per-sheet PDFs are stitched together in sheet_names order.
+
+        Needs pypdf (the `perf` extra) for the merge; without it, or for
+        a single sheet, this degrades to the plain convert() path.
+
+        Args:
+            source: Path to the Excel file to convert.
+            target: Desired path for the merged output PDF.
+            config: Excel print configuration.
+            sheet_names: Sheets to export, in output order.
+            timeout: Maximum time per sheet export in seconds.
+            workers: Concurrent exports; defaults to the CPU count.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        start_ns = time.perf_counter_ns()
+
+        if not sheet_names:
+            return self.convert(source, target, config, timeout=timeout)
+        if len(sheet_names) == 1:
+            return self.convert(
+                source, target, config, sheet_name=sheet_names[0], timeout=timeout
+            )
+        if not _PYPDF_AVAILABLE:
+            # No merge available — one soffice run over the whole
+            # workbook beats N runs whose outputs we cannot combine
+            self._logger.debug(
+                "pypdf not installed; converting all sheets in one pass"
+            )
+            return self.convert(source, target, config, timeout=timeout)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        scratch = tempfile.mkdtemp(prefix=".sheets-", dir=target.parent)
+        self._logger.info(
+            f"Converting {len(sheet_names)} sheets of {source.name} in parallel"
+        )
+
+        try:
+            # Index-prefixed part names keep the merge order stable even
+            # for sheets whose names collide after path mangling
+            parts = [
+                Path(scratch) / f"{index:03d}.pdf"
+                for index in range(len(sheet_names))
+            ]
+
+            # Threads suffice here: each export blocks in soffice (a
+            # separate process already), so the GIL never serializes the
+            # actual work
+            max_workers = min(len(sheet_names), workers or os.cpu_count() or 1)
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="sheet"
+            ) as pool:
+                results = list(pool.map(
+                    lambda args: self.convert(
+                        source, args[0], config, sheet_name=args[1], timeout=timeout
+                    ),
+                    zip(parts, sheet_names),
+                ))
+
+            for sheet, result in zip(sheet_names, results):
+                if not result.success:
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=f"Sheet '{sheet}' failed: {result.error}",
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+            # Stitch the parts together, then move the merged PDF into
+            # place atomically so readers never see a partial file
+            merged = Path(scratch) / "merged.pdf"
+            writer = PdfWriter()
+            for part in parts:
+                writer.append(part)
+            with open(merged, "wb") as handle:
+                writer.write(handle)
+            writer.close()
+            move_into_place(merged, target)
+
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            self._logger.info(
+                f"Merged {len(sheet_names)} sheets into {target.name} "
+                f"({duration:.1f}s)"
+            )
+            return ConversionResult(
+                success=True,
+                source_path=source,
+                output_path=target,
+                duration_seconds=duration,
+            )
+
+        except Exception as e:
+            self._logger.error(f"Per-sheet Excel conversion failed: {e}")
+            return ConversionResult(
+                success=False,
+                source_path=source,
+                error=str(e),
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+            )
+
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    # Margin presets in inches (top, bottom, left, right), mirroring the
+    # Excel-style presets in MarginType
+    _MARGIN_PRESETS: ClassVar[dict[str, tuple[float, float, float, float]]] = {
+        "normal": (1.0, 1.0, 1.25, 1.25),
+        "narrow": (0.5, 0.5, 0.5, 0.5),
+        "wide": (1.5, 1.5, 1.5, 1.5),
+    }
+
+    def _render_csv_pdf(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+    ) -> ConversionResult:
+        """
+        Render a CSV/TSV file directly to PDF with ReportLab.
+
+        Delimited text carries no formulas, sheets, or formatting, so
+        booting LibreOffice (~seconds) for it is pure overhead: parsing
+        with csv.reader and laying the rows out as one table takes tens
+        of milliseconds and keeps soffice free for real spreadsheets.
+
+        Margins come from the print config (presets or custom values);
+        spreadsheet-only settings like scaling modes and per-sheet page
+        breaks have no meaning for delimited text and are ignored.
+
+        Args:
+            source: Path to the .csv or .tsv file.
+            target: Desired path for the output PDF.
+            config: Excel print configuration (margins are honored).
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            self._logger.info(f"Rendering delimited text to PDF: {source.name}")
+
+            delimiter = "\t" if source.suffix.lower() == ".tsv" else ","
+            with open(source, newline="", encoding="utf-8-sig") as handle:
+                rows = list(csv.reader(handle, delimiter=delimiter))
+            if not rows:
+                rows = [[""]]  # ReportLab tables need at least one cell
+
+            if config.margins == "custom":
+                custom = config.margins_custom
+                top, bottom, left, right = (
+                    custom.top, custom.bottom, custom.left, custom.right
+                )
+            else:
+                top, bottom, left, right = self._MARGIN_PRESETS.get(
+                    config.margins, self._MARGIN_PRESETS["normal"]
+                )
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            document = SimpleDocTemplate(
+                os.fspath(target),
+                pagesize=landscape(A4),
+                topMargin=top * inch,
+                bottomMargin=bottom * inch,
+                leftMargin=left * inch,
+                rightMargin=right * inch,
+            )
+            document.build([Table(rows)])
+
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            self._logger.info(
+                f"CSV conversion complete: {target.name} ({duration:.2f}s)"
+            )
+            return ConversionResult(
+                success=True,
+                source_path=source,
+                output_path=target,
+                duration_seconds=duration,
+            )
+
+        except Exception as e:
+            self._logger.error(f"CSV rendering failed: {e}")
+            return ConversionResult(
+                success=False,
+                source_path=source,
+                error=str(e),
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+            )
+
+    def convert_batch(
+        self,
+        sources: list[Path],
+        output_dir: Path,
+        config: "ExcelPrintConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert many Excel spreadsheets in a single soffice invocation.
+
+        LibreOffice accepts multiple input files per --convert-to run, so
+        the process cold start is paid once for the whole batch instead of
+        once per file. All outputs land in output_dir named
+        "<stem>.pdf"; callers that need different target names rename
+        afterwards (see LinuxConverter.convert_excel_batch).
+
+        Per-file outcomes are recovered from soffice's stdout, which
+        prints one "convert <source> -> <output> ..." line per document
+        it actually exported; files missing from that output (and from
+        disk) are reported as individual failures.
+
+        Args:
+            sources: Excel files to convert.
+            output_dir: Directory that receives all generated PDFs.
+            config: Excel print configuration (limited LibreOffice support).
+            timeout: Maximum time for the whole batch in seconds.
+
+        Returns:
+            One ConversionResult per source, in input order.
+        """
+        start_ns = time.perf_counter_ns()
+        profile: str | None = None
+
+        def _all_failed(error: str) -> list[ConversionResult]:
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            return [
+                ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=error,
+                    duration_seconds=duration / max(len(sources), 1),
+                )
+                for source in sources
+            ]
+
+        try:
+            self._logger.info(
+                f"Converting Excel batch: {len(sources)} files -> {output_dir}"
+            )
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Isolated profile, as in the single-file paths
+            profile = make_profile()
+
+            args = (
+                *self._prefix,
+                f"-env:UserInstallation=file://{profile}",
+                "--convert-to",
+                self._pdf_convert_target(self._make_filter_data(config)),
+                "--outdir", str(output_dir),
+                *(str(source) for source in sources),
+            )
+
+            returncode, stdout, stderr = self._run_soffice(
+                args, timeout, capture_stdout=True
+            )
+
+            # soffice exits 0 even when individual files fail, so the
+            # stdout convert lines are the per-file ground truth
+            converted: set[str] = set()
+            for line in stdout.decode(errors="replace").splitlines():
+                if line.startswith("convert ") and " -> " in line:
+                    converted.add(line[len("convert "):].split(" -> ", 1)[0].strip())
+
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            per_file = duration / max(len(sources), 1)
+            batch_error = (
+                stderr.decode(errors="replace").strip()
+                or "LibreOffice did not convert this file"
+                if returncode != 0 or len(converted) < len(sources)
+                else ""
+            )
+
+            results: list[ConversionResult] = []
+            for source in sources:
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if str(source) in converted or generated_pdf.exists():
+                    results.append(
+                        ConversionResult(
+                            success=True,
+                            source_path=source,
+                            output_path=generated_pdf,
+                            duration_seconds=per_file,
+                        )
+                    )
+                else:
+                    self._logger.error(f"Batch conversion missed: {source.name}")
+                    results.append(
+                        ConversionResult(
+                            success=False,
+                            source_path=source,
+                            error=batch_error or "LibreOffice did not convert this file",
+                            duration_seconds=per_file,
+                        )
+                    )
+
+            succeeded = sum(1 for r in results if r.success)
+            self._logger.info(
+                f"Excel batch complete: {succeeded}/{len(sources)} files "
+                f"({duration:.1f}s)"
+            )
+            return results
+
+        except subprocess.TimeoutExpired:
+            self._logger.error(f"Excel batch timed out after {timeout}s")
+            return _all_failed(
+                f"Batch conversion timed out after {timeout} seconds. "
+                f"Try a smaller batch or a larger timeout."
+            )
+
+        except Exception as e:
+            self._logger.error(f"Excel batch failed unexpectedly: {e}")
+            return _all_failed(str(e))
+
+        finally:
+            if profile is not None:
+                shutil.rmtree(profile, ignore_errors=True)
+
+    def convert_xlsm(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+        timeout: int = 600,
+    ) -> ConversionResult:
+        """
+        Convert a macro-enabled Excel file directly to PDF.
+
+        LibreOffice ignores VBA macros during PDF export, so the
+        spreadsheet can be converted in a single soffice invocation
+        without the separate macro-stripping pass.
+
+        Args:
+            source: Path to the XLSM/XLSB file with macros.
+            target: Desired path for the output PDF.
+            config: Excel print configuration.
+            timeout: Maximum conversion time in seconds.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        return self.convert(source, target, config, timeout=timeout)
+
+    def _strip_vba_inplace(self, source: Path, target: Path) -> None:
+        """
+        Rewrite an XLSM as XLSX by dropping the VBA parts at zip level.
+
+        An .xlsm is an .xlsx plus xl/vbaProject.bin, a macro-enabled
+        workbook content type, and one relationship entry — so the macros
+        can be removed by copying the archive member-by-member while:
+
+        1. Skipping xl/vbaProject.bin entirely
+        2. Patching [Content_Types].xml: dropping the vbaProject Override
+           and switching the workbook content type back to the plain
+           spreadsheet one
+        3. Dropping the vbaProject <Relationship> from
+           xl/_rels/workbook.xml.rels
+
+        Cell data, formulas, and formatting pass through untouched.
+
+        Raises:
+            Exception: On any zip or metadata problem — the caller falls
+                back to a full LibreOffice conversion.
+        """
+        with (
+            zipfile.ZipFile(source) as src,
+            zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as dst,
+        ):
+            for item in src.infolist():
+                if item.filename == _VBA_PART:
+                    continue
+                data = src.read(item.filename)
+                if item.filename == "[Content_Types].xml":
+                    data = data.replace(_MACRO_CONTENT_TYPE, _SHEET_CONTENT_TYPE)
+                    data = _VBA_OVERRIDE_RE.sub(b"", data)
+                elif item.filename == "xl/_rels/workbook.xml.rels":
+                    data = _VBA_RELATIONSHIP_RE.sub(b"", data)
+                dst.writestr(item, data)
+
     def convert_xlsm_to_xlsx(
         self,
         source: Path,
@@ -229,65 +991,134 @@ class LinuxExcelConverter:
     ) -> ConversionResult:
         """
         Convert a macro-enabled Excel file to standard XLSX.
-        
+
         This is useful for:
         1. Removing macros before PDF conversion (security)
         2. Creating a clean copy for processing
         3. Compatibility with systems that don't support macros
-        
+
         The macros (VBA code) will be removed in the output file.
         All data, formulas, and formatting are preserved.
-        
+
+        XLSM input is handled in-process with zip-level surgery
+        (_strip_vba_inplace) — milliseconds instead of a multi-second
+        soffice round-trip. Anything else, or a malformed archive, goes
+        through LibreOffice as before.
+
         Args:
             source: Path to the XLSM/XLSB file with macros.
             target: Path for the output XLSX file (without macros).
             timeout: Maximum time for conversion in seconds.
-        
+
         Returns:
             ConversionResult indicating success or failure.
         """
-        start_time = time.time()
-        
+        start_ns = time.perf_counter_ns()
+
+        # Reject mismatched targets up front (see convert)
+        if target.suffix.lower() != ".xlsx":
+            return ConversionResult(
+                success=False,
+                source_path=source,
+                error=f"Target must be an .xlsx path, got: {target.name}",
+            )
+
+        # Already macro-free: nothing to convert. Hardlink when possible
+        # (single inode operation, no bytes copied), copy otherwise
+        if source.suffix.lower() == ".xlsx":
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copyfile(source, target)
+            return ConversionResult(
+                success=True,
+                source_path=source,
+                output_path=target,
+                duration_seconds=0.0,
+            )
+
+        # Fast path: .xlsm is zip-based OOXML, so macros can be stripped
+        # without launching LibreOffice at all (.xlsb needs a real
+        # format conversion and stays on the soffice path)
+        if source.suffix.lower() == ".xlsm":
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._strip_vba_inplace(source, target)
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                self._logger.info(
+                    f"Stripped macros at zip level: {target.name} ({duration:.2f}s)"
+                )
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=duration,
+                )
+            except Exception as e:
+                self._logger.warning(
+                    f"Zip-level macro strip failed, "
+                    f"falling back to LibreOffice: {e}"
+                )
+                target.unlink(missing_ok=True)  # Drop any partial output
+        profile: str | None = None
+
         try:
             self._logger.info(f"Converting macro Excel to XLSX: {source.name}")
-            
-            # Ensure output directory exists
+
+            # Materialize path pieces once (see convert)
+            src_str = os.fspath(source)
+            stem = source.stem
             output_dir = target.parent
+            out_dir_str = os.fspath(output_dir)
+
+            # Ensure output directory exists
             output_dir.mkdir(parents=True, exist_ok=True)
-            
+
+            # Isolated profile so parallel soffice runs don't serialize on
+            # the shared profile lock (removed in the finally below)
+            profile = make_profile()
+
             # Build command to convert to XLSX format
             # LibreOffice uses the output extension to determine format
-            args = [
-                self._libreoffice,
-                "--headless",
-                "--invisible",
+            args = (
+                *self._prefix,
+                f"-env:UserInstallation=file://{profile}",
                 "--convert-to", "xlsx",  # Output as standard Excel
-                "--outdir", str(output_dir),
-                str(source),
-            ]
-            
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
+                "--outdir", out_dir_str,
+                src_str,
             )
             
-            if result.returncode != 0:
-                error = result.stderr or result.stdout or "Conversion failed"
+            returncode, _, stderr = self._run_soffice(args, timeout)
+
+            if returncode != 0:
+                error = (
+                    stderr.decode(errors="replace").strip()
+                    or "Conversion failed"
+                )
                 return ConversionResult(
                     success=False,
                     source_path=source,
                     error=error,
-                    duration_seconds=time.time() - start_time,
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
                 )
             
-            # Handle output naming
-            generated_xlsx = output_dir / f"{source.stem}.xlsx"
-            if generated_xlsx != target and generated_xlsx.exists():
-                generated_xlsx.rename(target)
+            # Handle output naming EAFP: attempt the move and retry briefly
+            # on FileNotFoundError in case soffice returned before the
+            # file became visible
+            generated_xlsx = output_dir / f"{stem}.xlsx"
+            if generated_xlsx != target:
+                poll_deadline = time.monotonic() + 2.0
+                while True:
+                    try:
+                        move_into_place(generated_xlsx, target)
+                        break
+                    except FileNotFoundError:
+                        if time.monotonic() >= poll_deadline:
+                            break
+                        time.sleep(0.05)
             
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self._logger.info(f"XLSX conversion complete: {target.name}")
             
             return ConversionResult(
@@ -303,5 +1134,9 @@ class LinuxExcelConverter:
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
+
+        finally:
+            if profile is not None:
+                shutil.rmtree(profile, ignore_errors=True)
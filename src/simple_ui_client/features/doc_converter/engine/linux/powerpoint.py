@@ -14,6 +14,8 @@ Created: December 2024
 from __future__ import annotations
 
 # Standard library imports
+import asyncio    # Non-blocking subprocess execution for convert_async
+import os         # CPU count for the async concurrency limit
 import subprocess  # Execute LibreOffice as external process
 import time       # Measure conversion duration
 from pathlib import Path  # Modern path handling
@@ -22,8 +24,17 @@ from typing import TYPE_CHECKING  # Type hints without runtime overhead
 # Structured logging
 from loguru import logger
 
-# Base result type
-from simple_ui_client.features.doc_converter.engine.base import ConversionResult
+# Base result type and output finalization helper
+from simple_ui_client.features.doc_converter.engine.base import (
+    ConversionResult,
+    move_into_place,
+)
+
+# Optional pool of warm soffice instances (None when uno is unavailable)
+from simple_ui_client.features.doc_converter.engine.linux.uno_pool import get_uno_pool
+
+# Per-invocation soffice profile directories (template-backed copies)
+from simple_ui_client.features.doc_converter.engine.linux.profiles import make_profile
 
 if TYPE_CHECKING:
     from simple_ui_client.features.doc_converter.config import PowerPointConfig
@@ -56,7 +67,11 @@ class LinuxPowerPointConverter:
             config=ppt_config
         )
     """
-    
+
+    # Caps concurrent async soffice processes at the CPU count; shared
+    # across instances and created lazily inside a running event loop
+    _semaphore: asyncio.Semaphore | None = None
+
     def __init__(self, libreoffice_path: str = "libreoffice") -> None:
         """
         Initialize the PowerPoint converter.
@@ -110,7 +125,7 @@ class LinuxPowerPointConverter:
                 - error: Error message (if failed)
                 - duration_seconds: Conversion time
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             self._logger.info(f"Converting PowerPoint: {source.name}")
@@ -131,9 +146,37 @@ class LinuxPowerPointConverter:
             # ===================================================================
             output_dir = target.parent
             output_dir.mkdir(parents=True, exist_ok=True)
-            
+
+            # ===================================================================
+            # STEP 3: Try the persistent UNO pool (fast path)
+            # ===================================================================
+            # When LibreOffice's `uno` bindings are importable, the
+            # presentation is converted on a pool of already-warm soffice
+            # instances, skipping the per-file process cold start. Any pool
+            # failure falls through to the subprocess path below.
+            pool = get_uno_pool(self._libreoffice)
+            if pool is not None:
+                try:
+                    pool.convert_to_pdf(source, target, "impress_pdf_Export")
+                    duration = (time.perf_counter_ns() - start_ns) / 1e9
+                    self._logger.info(
+                        f"PowerPoint conversion complete (UNO pool): "
+                        f"{target.name} ({duration:.1f}s)"
+                    )
+                    return ConversionResult(
+                        success=True,
+                        source_path=source,
+                        output_path=target,
+                        duration_seconds=duration,
+                    )
+                except Exception as e:
+                    self._logger.warning(
+                        f"UNO pool conversion failed, "
+                        f"falling back to subprocess: {e}"
+                    )
+
             # ===================================================================
-            # STEP 3: Build the LibreOffice command
+            # STEP 4: Build the LibreOffice command
             # ===================================================================
             # LibreOffice Impress uses the same command-line interface
             # as other LibreOffice applications. The output format is
@@ -150,46 +193,58 @@ class LinuxPowerPointConverter:
             ]
             
             # ===================================================================
-            # STEP 4: Execute the conversion
+            # STEP 5: Execute the conversion
             # ===================================================================
             self._logger.debug("Starting LibreOffice Impress conversion")
             
             result = subprocess.run(
                 args,
-                capture_output=True,  # Capture stdout and stderr
-                text=True,            # Return as string (not bytes)
-                timeout=timeout,      # Wait at most this many seconds
+                stdout=subprocess.DEVNULL,  # Progress chatter; never inspected
+                stderr=subprocess.PIPE,     # Bytes; decoded only on failure
+                close_fds=False,            # Keeps posix_spawn eligibility;
+                                            # we hold no sensitive fds
+                start_new_session=True,     # Own process group for soffice
+                timeout=timeout,            # Wait at most this many seconds
             )
             
             # ===================================================================
-            # STEP 5: Check for errors
+            # STEP 6: Check for errors
             # ===================================================================
             if result.returncode != 0:
-                # LibreOffice returns non-zero on failure
-                error = result.stderr or result.stdout or "Impress conversion failed"
+                # LibreOffice returns non-zero on failure; decode stderr
+                # only now that we know the run failed
+                error = (
+                    result.stderr.decode(errors="replace").strip()
+                    or "Impress conversion failed"
+                )
                 self._logger.error(f"LibreOffice Impress error: {error}")
                 
                 return ConversionResult(
                     success=False,
                     source_path=source,
                     error=error,
-                    duration_seconds=time.time() - start_time,
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
                 )
             
             # ===================================================================
-            # STEP 6: Handle output file name
+            # STEP 7: Handle output file name
             # ===================================================================
             # LibreOffice creates "filename.pdf" in the output directory
             generated_pdf = output_dir / f"{source.stem}.pdf"
             
-            # Rename to the user's desired target path if different
-            if generated_pdf != target and generated_pdf.exists():
-                generated_pdf.rename(target)
+            # Move to the user's desired target path EAFP — an atomic
+            # rename (zero-copy cross-device fallback) instead of an
+            # exists() stat followed by a rename
+            if generated_pdf != target:
+                try:
+                    move_into_place(generated_pdf, target)
+                except FileNotFoundError:
+                    pass  # soffice produced no output; caller sees missing PDF
             
             # ===================================================================
-            # STEP 7: Return successful result
+            # STEP 8: Return successful result
             # ===================================================================
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self._logger.info(
                 f"PowerPoint conversion complete: {target.name} ({duration:.1f}s)"
             )
@@ -208,7 +263,7 @@ class LinuxPowerPointConverter:
                 success=False,
                 source_path=source,
                 error=f"Conversion timed out after {timeout} seconds",
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
             
         except Exception as e:
@@ -218,5 +273,245 @@ class LinuxPowerPointConverter:
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
+
+    async def convert_async(
+        self,
+        source: Path,
+        target: Path,
+        config: "PowerPointConfig",
+        timeout: int = 300,
+    ) -> ConversionResult:
+        """
+        Convert a presentation to PDF without blocking the event loop.
+
+        Unlike convert(), which parks a worker thread in subprocess.run(),
+        this spawns soffice with asyncio.create_subprocess_exec so many
+        conversions can run concurrently from a single task set. A
+        class-wide semaphore caps concurrency at the CPU count, and each
+        invocation gets its own -env:UserInstallation profile directory
+        so parallel soffice processes never fight over the shared
+        profile lock (which silently serializes them).
+
+        Args:
+            source: Path to the PowerPoint file.
+            target: Desired output path for the PDF.
+            config: PowerPoint configuration (limited LibreOffice support).
+            timeout: Maximum conversion time in seconds.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        if LinuxPowerPointConverter._semaphore is None:
+            LinuxPowerPointConverter._semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async with LinuxPowerPointConverter._semaphore:
+            start_ns = time.perf_counter_ns()
+            self._logger.info(f"Converting PowerPoint (async): {source.name}")
+
+            output_dir = target.parent
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Private profile per invocation — see docstring
+            profile = make_profile()
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self._libreoffice,
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nofirststartwizard",
+                    f"-env:UserInstallation=file://{profile}",
+                    "--convert-to", "pdf",
+                    "--outdir", str(output_dir),
+                    str(source),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        process.communicate(), timeout=timeout
+                    )
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    self._logger.error(
+                        f"PowerPoint conversion timed out after {timeout}s"
+                    )
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=f"Conversion timed out after {timeout} seconds",
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                if process.returncode != 0:
+                    error = (
+                        stderr.decode(errors="replace").strip()
+                        or "Impress conversion failed"
+                    )
+                    self._logger.error(f"LibreOffice Impress error: {error}")
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=error,
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                # LibreOffice names output "<stem>.pdf"; move into place
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if generated_pdf != target:
+                    try:
+                        move_into_place(generated_pdf, target)
+                    except FileNotFoundError:
+                        pass  # soffice produced no output; caller sees missing PDF
+
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                self._logger.info(
+                    f"PowerPoint conversion complete: {target.name} ({duration:.1f}s)"
+                )
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=duration,
+                )
+
+            except Exception as e:
+                self._logger.error(f"PowerPoint conversion failed: {e}")
+                return ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=str(e),
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                )
+
+    def convert_batch(
+        self,
+        sources: list[Path],
+        output_dir: Path,
+        config: "PowerPointConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert many PowerPoint presentations in one soffice invocation.
+
+        LibreOffice accepts multiple input files per --convert-to run,
+        so the process cold start is paid once for the whole batch
+        instead of once per file. All outputs land in output_dir named
+        "<stem>.pdf"; callers that need different target names rename
+        afterwards (see LinuxConverter.convert_powerpoint_batch).
+
+        Per-file outcomes are recovered from soffice's stdout, which
+        prints one "convert <source> -> <output> ..." line per document
+        it actually exported; files missing from that output (and from
+        disk) are reported as individual failures.
+
+        Args:
+            sources: PowerPoint files to convert.
+            output_dir: Directory that receives all generated PDFs.
+            config: PowerPoint configuration (limited LibreOffice support).
+            timeout: Maximum time for the whole batch in seconds.
+
+        Returns:
+            One ConversionResult per source, in input order.
+        """
+        start_ns = time.perf_counter_ns()
+
+        def _all_failed(error: str) -> list[ConversionResult]:
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            return [
+                ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=error,
+                    duration_seconds=duration / max(len(sources), 1),
+                )
+                for source in sources
+            ]
+
+        try:
+            self._logger.info(
+                f"Converting PowerPoint batch: {len(sources)} files -> {output_dir}"
+            )
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            args = [
+                self._libreoffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nofirststartwizard",
+                "--convert-to", "pdf",
+                "--outdir", str(output_dir),
+                *(str(source) for source in sources),
+            ]
+
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,   # Per-file "convert" lines parsed below
+                stderr=subprocess.PIPE,
+                close_fds=False,
+                start_new_session=True,
+                timeout=timeout,
+            )
+
+            # soffice exits 0 even when individual files fail, so the
+            # stdout convert lines are the per-file ground truth
+            converted: set[str] = set()
+            for line in result.stdout.decode(errors="replace").splitlines():
+                if line.startswith("convert ") and " -> " in line:
+                    converted.add(line[len("convert "):].split(" -> ", 1)[0].strip())
+
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            per_file = duration / max(len(sources), 1)
+            batch_error = (
+                result.stderr.decode(errors="replace").strip()
+                or "LibreOffice did not convert this file"
+                if result.returncode != 0 or len(converted) < len(sources)
+                else ""
+            )
+
+            results: list[ConversionResult] = []
+            for source in sources:
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if str(source) in converted or generated_pdf.exists():
+                    results.append(
+                        ConversionResult(
+                            success=True,
+                            source_path=source,
+                            output_path=generated_pdf,
+                            duration_seconds=per_file,
+                        )
+                    )
+                else:
+                    self._logger.error(f"Batch conversion missed: {source.name}")
+                    results.append(
+                        ConversionResult(
+                            success=False,
+                            source_path=source,
+                            error=batch_error or "LibreOffice did not convert this file",
+                            duration_seconds=per_file,
+                        )
+                    )
+
+            succeeded = sum(1 for r in results if r.success)
+            self._logger.info(
+                f"PowerPoint batch complete: {succeeded}/{len(sources)} files "
+                f"({duration:.1f}s)"
+            )
+            return results
+
+        except subprocess.TimeoutExpired:
+            self._logger.error(f"PowerPoint batch timed out after {timeout}s")
+            return _all_failed(
+                f"Batch conversion timed out after {timeout} seconds. "
+                f"Try a smaller batch or a larger timeout."
+            )
+
+        except Exception as e:
+            self._logger.error(f"PowerPoint batch conversion failed: {e}")
+            return _all_failed(str(e))
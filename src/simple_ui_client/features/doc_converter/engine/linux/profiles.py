@@ -0,0 +1,47 @@
+"""
+Linux LibreOffice Engine - User Profile Helpers.
+
+Every fresh -env:UserInstallation directory makes soffice provision a
+new profile on first run — a burst of 50-200 small-file writes that
+dominates the first conversion on cold storage. These helpers let
+LinuxConverter.initialize() warm one template profile up front, after
+which each per-call profile is a plain directory copy instead of a full
+provisioning pass.
+
+Author: Simple UI Team
+Created: December 2024
+"""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+
+# Warm template created by warm-up; None until initialize() has run
+_template_dir: str | None = None
+
+
+def set_template(path: str) -> None:
+    """Register a provisioned profile directory as the copy template."""
+    global _template_dir
+    _template_dir = path
+
+
+def make_profile(prefix: str = "lo-profile-") -> str:
+    """
+    Create a throwaway LibreOffice profile directory.
+
+    When a warm template exists its contents are copied in, so soffice
+    skips first-run provisioning; otherwise the directory is empty and
+    soffice provisions it itself, exactly as before.
+
+    Returns:
+        Path to the new profile directory (caller removes it when done).
+    """
+    profile = tempfile.mkdtemp(prefix=prefix)
+    if _template_dir is not None:
+        try:
+            shutil.copytree(_template_dir, profile, dirs_exist_ok=True)
+        except OSError:
+            pass  # Fall back to cold provisioning by soffice
+    return profile
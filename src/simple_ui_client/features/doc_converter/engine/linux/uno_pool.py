@@ -0,0 +1,316 @@
+"""
+Linux LibreOffice Engine - Persistent UNO Server Pool.
+
+Cold-starting soffice costs seconds per file; a pool of long-running
+headless instances reached over UNO turns each conversion into an IPC
+call against an already-warm Calc/Writer/Impress.
+
+The `uno` bindings ship with LibreOffice itself (not from PyPI), so the
+pool is strictly optional: when the import fails the converters fall
+back to their one-subprocess-per-file path unchanged.
+
+Author: Simple UI Team
+Created: December 2024
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from loguru import logger
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+
+    _UNO_AVAILABLE = True
+except ImportError:  # pragma: no cover - bindings only exist alongside soffice
+    _UNO_AVAILABLE = False
+
+
+# How long to wait for a freshly-spawned soffice to accept connections
+_CONNECT_TIMEOUT = 30.0
+
+
+def _to_url(path: Path) -> str:
+    """Convert a filesystem path to a file:// URL for UNO."""
+    return uno.systemPathToFileUrl(os.fspath(path))
+
+
+def _prop(name: str, value: object) -> "PropertyValue":
+    """Build a UNO PropertyValue."""
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def _props(mapping: dict[str, object]) -> tuple:
+    """Build a tuple of UNO PropertyValues from a plain dict."""
+    return tuple(_prop(name, value) for name, value in mapping.items())
+
+
+class _UnoSession:
+    """
+    One long-running headless soffice process plus its UNO connection.
+
+    Each session gets its own UserInstallation profile and accepts UNO
+    over a named pipe (no TCP port management, nothing on the network),
+    so concurrent sessions never hand off to each other.
+    """
+
+    def __init__(self, soffice: str, index: int) -> None:
+        self._profile = Path(tempfile.mkdtemp(prefix=f"uno-profile-{index}-"))
+        # Pipe name must be unique per session; the profile dir already is
+        self._pipe = self._profile.name
+        self._logger = logger.bind(component="UnoSession")
+
+        self._process = subprocess.Popen(
+            [
+                soffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nofirststartwizard",
+                "--norestore",
+                f"-env:UserInstallation=file://{self._profile}",
+                f"--accept=pipe,name={self._pipe};urp;StarOffice.ServiceManager",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._desktop = None
+
+    def _connect(self) -> None:
+        """Resolve the remote Desktop, retrying while soffice boots."""
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx
+        )
+        url = f"uno:pipe,name={self._pipe};urp;StarOffice.ComponentContext"
+
+        deadline = time.monotonic() + _CONNECT_TIMEOUT
+        while True:
+            try:
+                ctx = resolver.resolve(url)
+                break
+            except Exception:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.25)
+
+        self._desktop = ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", ctx
+        )
+
+    def ping(self) -> bool:
+        """Cheap health check: is the soffice process still alive?"""
+        return self._process.poll() is None
+
+    def convert_to_pdf(
+        self,
+        source: Path,
+        target: Path,
+        filter_name: str,
+        filter_data: dict[str, object] | None = None,
+        sheet_name: str | None = None,
+    ) -> None:
+        """
+        Load a document hidden, export it as PDF, and close it.
+
+        Args:
+            source: Document to convert.
+            target: Output PDF path.
+            filter_name: Export filter (writer/calc/impress_pdf_Export).
+            filter_data: Optional filter options (PageRange, Selection,
+                IsSkipEmptyPages, ...) passed through as FilterData.
+            sheet_name: Restrict a Calc export to this sheet by passing
+                the sheet object as the filter's Selection. Only
+                meaningful for spreadsheet documents.
+
+        Raises:
+            RuntimeError: When the document fails to load.
+            KeyError: When sheet_name does not exist in the workbook.
+        """
+        if self._desktop is None:
+            self._connect()
+
+        document = self._desktop.loadComponentFromURL(
+            _to_url(source), "_blank", 0, (_prop("Hidden", True),)
+        )
+        if document is None:
+            raise RuntimeError(f"soffice could not load {source}")
+
+        try:
+            if sheet_name is not None:
+                # Selection scopes the export to one sheet; this is the
+                # only per-sheet mechanism the PDF filter exposes (the
+                # --convert-to CLI cannot name a sheet at all)
+                filter_data = dict(filter_data or {})
+                filter_data["Selection"] = document.Sheets.getByName(sheet_name)
+
+            store_props = {"FilterName": filter_name}
+            if filter_data:
+                store_props["FilterData"] = uno.Any(
+                    "[]com.sun.star.beans.PropertyValue", _props(filter_data)
+                )
+
+            document.storeToURL(_to_url(target), _props(store_props))
+        finally:
+            document.close(False)
+
+    def close(self) -> None:
+        """Terminate the soffice process and drop the profile."""
+        try:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+        finally:
+            shutil.rmtree(self._profile, ignore_errors=True)
+
+
+class UnoPool:
+    """
+    Fixed-size pool of warm soffice instances.
+
+    Sessions are spawned lazily on first checkout, handed out one at a
+    time, and replaced when a conversion leaves them broken. Thread-safe;
+    intended to be shared by the batch worker's converter threads.
+    """
+
+    def __init__(self, soffice: str, size: int | None = None) -> None:
+        self._soffice = soffice
+        self._size = size or min(4, os.cpu_count() or 1)
+        self._idle: queue.Queue[_UnoSession] = queue.Queue()
+        self._created = 0
+        self._next_index = 0
+        self._lock = threading.Lock()
+        self._logger = logger.bind(component="UnoPool")
+
+    def _spawn(self) -> _UnoSession:
+        """Start a fresh session (caller holds no lock)."""
+        with self._lock:
+            index = self._next_index
+            self._next_index += 1
+        self._logger.info(f"Starting pooled soffice instance #{index}")
+        return _UnoSession(self._soffice, index)
+
+    def _checkout(self) -> _UnoSession:
+        # Prefer an idle session, but supervise it: a crashed soffice is
+        # discarded and replaced instead of being handed to the caller
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if session.ping():
+                return session
+            self._logger.warning("Pooled soffice instance died; restarting")
+            session.close()
+            with self._lock:
+                self._created -= 1
+
+        with self._lock:
+            can_spawn = self._created < self._size
+            if can_spawn:
+                self._created += 1
+        if can_spawn:
+            return self._spawn()
+
+        # Pool exhausted — wait for a session to come back
+        return self._idle.get()
+
+    def convert_to_pdf(
+        self,
+        source: Path,
+        target: Path,
+        filter_name: str,
+        filter_data: dict[str, object] | None = None,
+        sheet_name: str | None = None,
+    ) -> None:
+        """
+        Convert one document on a pooled instance.
+
+        Raises on failure; the session involved is discarded and will be
+        replaced on the next checkout.
+        """
+        session = self._checkout()
+        try:
+            session.convert_to_pdf(
+                source, target, filter_name, filter_data, sheet_name
+            )
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            session.close()
+            raise
+        self._idle.put(session)
+
+    def warm(self, count: int = 1) -> None:
+        """
+        Pre-spawn idle sessions so early conversions skip the soffice boot.
+
+        Spawns at most `count` sessions, never exceeding the pool size.
+        A spawn failure is logged and stops the warm-up; the lazy
+        checkout path still works as before.
+
+        Args:
+            count: Number of sessions to start eagerly.
+        """
+        for _ in range(min(count, self._size)):
+            with self._lock:
+                if self._created >= self._size:
+                    return
+                self._created += 1
+            try:
+                self._idle.put(self._spawn())
+            except Exception as e:
+                with self._lock:
+                    self._created -= 1
+                self._logger.warning(f"soffice warm-up spawn failed: {e}")
+                return
+
+    def shutdown(self) -> None:
+        """Stop every idle instance."""
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            session.close()
+        with self._lock:
+            self._created = 0
+
+
+_pool: UnoPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_uno_pool(soffice: str) -> UnoPool | None:
+    """
+    Get the shared pool, or None when the UNO bindings are unavailable.
+
+    Args:
+        soffice: Path to the LibreOffice executable.
+
+    Returns:
+        The process-wide UnoPool, created on first call.
+    """
+    if not _UNO_AVAILABLE:
+        return None
+
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = UnoPool(soffice)
+    return _pool
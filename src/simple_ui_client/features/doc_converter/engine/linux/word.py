@@ -15,6 +15,8 @@ Created: December 2024
 from __future__ import annotations
 
 # Standard library imports for file and process handling
+import asyncio    # Non-blocking subprocess execution for convert_async
+import os         # CPU count for the async concurrency limit
 import subprocess  # Used to run LibreOffice as an external process
 import time       # Used to measure conversion duration
 from pathlib import Path  # Modern way to handle file paths cross-platform
@@ -24,7 +26,16 @@ from typing import TYPE_CHECKING  # Used for type hints without runtime import
 from loguru import logger
 
 # Import our base class and result type from the parent module
-from simple_ui_client.features.doc_converter.engine.base import ConversionResult
+from simple_ui_client.features.doc_converter.engine.base import (
+    ConversionResult,
+    move_into_place,
+)
+
+# Optional pool of warm soffice instances (None when uno is unavailable)
+from simple_ui_client.features.doc_converter.engine.linux.uno_pool import get_uno_pool
+
+# Per-invocation soffice profile directories (template-backed copies)
+from simple_ui_client.features.doc_converter.engine.linux.profiles import make_profile
 
 # TYPE_CHECKING is True only when running type checkers (like mypy),
 # not at runtime. This avoids circular imports for type hints.
@@ -55,7 +66,11 @@ class LinuxWordConverter:
         if result.success:
             print(f"Converted to: {result.output_path}")
     """
-    
+
+    # Caps concurrent async soffice processes at the CPU count; shared
+    # across instances and created lazily inside a running event loop
+    _semaphore: asyncio.Semaphore | None = None
+
     def __init__(self, libreoffice_path: str = "libreoffice") -> None:
         """
         Initialize the Word converter.
@@ -109,8 +124,10 @@ class LinuxWordConverter:
         Raises:
             No exceptions are raised - all errors are captured in the result.
         """
-        # Record start time to measure conversion duration
-        start_time = time.time()
+        # Record start time to measure conversion duration. perf_counter_ns
+        # is monotonic and integer-based: no wall-clock jumps, no float
+        # accumulation in the timing itself.
+        start_ns = time.perf_counter_ns()
         
         try:
             # Log the operation start for debugging and monitoring
@@ -127,9 +144,37 @@ class LinuxWordConverter:
             # parents=True: Create parent directories too (like mkdir -p)
             # exist_ok=True: Don't error if directory already exists
             output_dir.mkdir(parents=True, exist_ok=True)
-            
+
+            # ===================================================================
+            # STEP 2: Try the persistent UNO pool (fast path)
             # ===================================================================
-            # STEP 2: Build the LibreOffice command
+            # When LibreOffice's `uno` bindings are importable, the document
+            # is converted on a pool of already-warm soffice instances,
+            # skipping the per-file process cold start. Any pool failure
+            # falls through to the subprocess path below.
+            pool = get_uno_pool(self._libreoffice)
+            if pool is not None:
+                try:
+                    pool.convert_to_pdf(source, target, "writer_pdf_Export")
+                    duration = (time.perf_counter_ns() - start_ns) / 1e9
+                    self._logger.info(
+                        f"Word conversion complete (UNO pool): "
+                        f"{target.name} ({duration:.1f}s)"
+                    )
+                    return ConversionResult(
+                        success=True,
+                        source_path=source,
+                        output_path=target,
+                        duration_seconds=duration,
+                    )
+                except Exception as e:
+                    self._logger.warning(
+                        f"UNO pool conversion failed, "
+                        f"falling back to subprocess: {e}"
+                    )
+
+            # ===================================================================
+            # STEP 3: Build the LibreOffice command
             # ===================================================================
             # LibreOffice command-line arguments explained:
             # --headless     : Run without GUI (required for servers)
@@ -151,23 +196,29 @@ class LinuxWordConverter:
             ]
             
             # ===================================================================
-            # STEP 3: Execute LibreOffice conversion
+            # STEP 4: Execute LibreOffice conversion
             # ===================================================================
             # subprocess.run() executes the command and waits for completion
             result = subprocess.run(
-                args,                  # The command and arguments
-                capture_output=True,   # Capture stdout and stderr
-                text=True,             # Return output as strings, not bytes
-                timeout=timeout,       # Maximum wait time in seconds
+                args,                         # The command and arguments
+                stdout=subprocess.DEVNULL,    # Progress chatter; never inspected
+                stderr=subprocess.PIPE,       # Bytes; decoded only on failure
+                close_fds=False,              # Keeps posix_spawn eligibility;
+                                              # we hold no sensitive fds
+                start_new_session=True,       # Own process group for soffice
+                timeout=timeout,              # Maximum wait time in seconds
             )
             
             # ===================================================================
-            # STEP 4: Check for conversion errors
+            # STEP 5: Check for conversion errors
             # ===================================================================
             # A non-zero return code indicates failure
             if result.returncode != 0:
-                # Get error message from stderr or stdout (LibreOffice may use either)
-                error = result.stderr or result.stdout or "Unknown LibreOffice error"
+                # Decode stderr only now that we know the run failed
+                error = (
+                    result.stderr.decode(errors="replace").strip()
+                    or "Unknown LibreOffice error"
+                )
                 self._logger.error(f"LibreOffice failed: {error}")
                 
                 # Return failure result with error details
@@ -175,25 +226,31 @@ class LinuxWordConverter:
                     success=False,
                     source_path=source,
                     error=error,
-                    duration_seconds=time.time() - start_time,
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
                 )
             
             # ===================================================================
-            # STEP 5: Handle output file naming
+            # STEP 6: Handle output file naming
             # ===================================================================
             # LibreOffice creates output with the same base name but .pdf extension
             # For example: document.docx -> document.pdf
             generated_pdf = output_dir / f"{source.stem}.pdf"
             
-            # If the generated filename differs from our target, rename it
-            # This allows users to specify custom output names like "report_final.pdf"
-            if generated_pdf != target and generated_pdf.exists():
-                generated_pdf.rename(target)
+            # If the generated filename differs from our target, move it
+            # into place EAFP — an atomic rename (zero-copy cross-device
+            # fallback) instead of an exists() stat followed by a rename.
+            # This allows users to specify custom output names like
+            # "report_final.pdf".
+            if generated_pdf != target:
+                try:
+                    move_into_place(generated_pdf, target)
+                except FileNotFoundError:
+                    pass  # soffice produced no output; caller sees missing PDF
             
             # ===================================================================
-            # STEP 6: Return success result
+            # STEP 7: Return success result
             # ===================================================================
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             self._logger.info(
                 f"Word conversion complete: {target.name} ({duration:.1f}s)"
             )
@@ -212,7 +269,7 @@ class LinuxWordConverter:
                 success=False,
                 source_path=source,
                 error=f"Conversion timed out after {timeout} seconds",
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
             
         except Exception as e:
@@ -222,5 +279,243 @@ class LinuxWordConverter:
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
             )
+
+    async def convert_async(
+        self,
+        source: Path,
+        target: Path,
+        config: "WordConfig",
+        timeout: int = 300,
+    ) -> ConversionResult:
+        """
+        Convert a Word document to PDF without blocking the event loop.
+
+        Unlike convert(), which parks a worker thread in subprocess.run(),
+        this spawns soffice with asyncio.create_subprocess_exec so many
+        conversions can run concurrently from a single task set. A
+        class-wide semaphore caps concurrency at the CPU count, and each
+        invocation gets its own -env:UserInstallation profile directory
+        so parallel soffice processes never fight over the shared
+        profile lock (which silently serializes them).
+
+        Args:
+            source: Path to the input Word document.
+            target: Desired path for the output PDF file.
+            config: Word print configuration (limited LibreOffice support).
+            timeout: Maximum conversion time in seconds.
+
+        Returns:
+            ConversionResult with success status and details.
+        """
+        if LinuxWordConverter._semaphore is None:
+            LinuxWordConverter._semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async with LinuxWordConverter._semaphore:
+            start_ns = time.perf_counter_ns()
+            self._logger.info(f"Converting Word document (async): {source.name}")
+
+            output_dir = target.parent
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Private profile per invocation — see docstring
+            profile = make_profile()
+
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self._libreoffice,
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--nofirststartwizard",
+                    f"-env:UserInstallation=file://{profile}",
+                    "--convert-to", "pdf",
+                    "--outdir", str(output_dir),
+                    str(source),
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                try:
+                    _, stderr = await asyncio.wait_for(
+                        process.communicate(), timeout=timeout
+                    )
+                except TimeoutError:
+                    process.kill()
+                    await process.wait()
+                    self._logger.error(f"Word conversion timed out after {timeout}s")
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=f"Conversion timed out after {timeout} seconds",
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                if process.returncode != 0:
+                    error = (
+                        stderr.decode(errors="replace").strip()
+                        or "Unknown LibreOffice error"
+                    )
+                    self._logger.error(f"LibreOffice failed: {error}")
+                    return ConversionResult(
+                        success=False,
+                        source_path=source,
+                        error=error,
+                        duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                    )
+
+                # LibreOffice names output "<stem>.pdf"; move into place
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if generated_pdf != target:
+                    try:
+                        move_into_place(generated_pdf, target)
+                    except FileNotFoundError:
+                        pass  # soffice produced no output; caller sees missing PDF
+
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                self._logger.info(
+                    f"Word conversion complete: {target.name} ({duration:.1f}s)"
+                )
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=duration,
+                )
+
+            except Exception as e:
+                self._logger.error(f"Word conversion failed: {e}")
+                return ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=str(e),
+                    duration_seconds=(time.perf_counter_ns() - start_ns) / 1e9,
+                )
+
+    def convert_batch(
+        self,
+        sources: list[Path],
+        output_dir: Path,
+        config: "WordConfig",
+        timeout: int = 600,
+    ) -> list[ConversionResult]:
+        """
+        Convert many Word documents in a single soffice invocation.
+
+        LibreOffice accepts multiple input files per --convert-to run,
+        so the process cold start is paid once for the whole batch
+        instead of once per file. All outputs land in output_dir named
+        "<stem>.pdf"; callers that need different target names rename
+        afterwards (see LinuxConverter.convert_word_batch).
+
+        Per-file outcomes are recovered from soffice's stdout, which
+        prints one "convert <source> -> <output> ..." line per document
+        it actually exported; files missing from that output (and from
+        disk) are reported as individual failures.
+
+        Args:
+            sources: Word documents to convert.
+            output_dir: Directory that receives all generated PDFs.
+            config: Word print configuration (limited LibreOffice support).
+            timeout: Maximum time for the whole batch in seconds.
+
+        Returns:
+            One ConversionResult per source, in input order.
+        """
+        start_ns = time.perf_counter_ns()
+
+        def _all_failed(error: str) -> list[ConversionResult]:
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            return [
+                ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=error,
+                    duration_seconds=duration / max(len(sources), 1),
+                )
+                for source in sources
+            ]
+
+        try:
+            self._logger.info(
+                f"Converting Word batch: {len(sources)} files -> {output_dir}"
+            )
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+            args = [
+                self._libreoffice,
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nofirststartwizard",
+                "--convert-to", "pdf",
+                "--outdir", str(output_dir),
+                *(str(source) for source in sources),
+            ]
+
+            result = subprocess.run(
+                args,
+                stdout=subprocess.PIPE,   # Per-file "convert" lines parsed below
+                stderr=subprocess.PIPE,
+                close_fds=False,
+                start_new_session=True,
+                timeout=timeout,
+            )
+
+            # soffice exits 0 even when individual files fail, so the
+            # stdout convert lines are the per-file ground truth
+            converted: set[str] = set()
+            for line in result.stdout.decode(errors="replace").splitlines():
+                if line.startswith("convert ") and " -> " in line:
+                    converted.add(line[len("convert "):].split(" -> ", 1)[0].strip())
+
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            per_file = duration / max(len(sources), 1)
+            batch_error = (
+                result.stderr.decode(errors="replace").strip()
+                or "LibreOffice did not convert this file"
+                if result.returncode != 0 or len(converted) < len(sources)
+                else ""
+            )
+
+            results: list[ConversionResult] = []
+            for source in sources:
+                generated_pdf = output_dir / f"{source.stem}.pdf"
+                if str(source) in converted or generated_pdf.exists():
+                    results.append(
+                        ConversionResult(
+                            success=True,
+                            source_path=source,
+                            output_path=generated_pdf,
+                            duration_seconds=per_file,
+                        )
+                    )
+                else:
+                    self._logger.error(f"Batch conversion missed: {source.name}")
+                    results.append(
+                        ConversionResult(
+                            success=False,
+                            source_path=source,
+                            error=batch_error or "LibreOffice did not convert this file",
+                            duration_seconds=per_file,
+                        )
+                    )
+
+            succeeded = sum(1 for r in results if r.success)
+            self._logger.info(
+                f"Word batch complete: {succeeded}/{len(sources)} files "
+                f"({duration:.1f}s)"
+            )
+            return results
+
+        except subprocess.TimeoutExpired:
+            self._logger.error(f"Word batch timed out after {timeout}s")
+            return _all_failed(
+                f"Batch conversion timed out after {timeout} seconds. "
+                f"Try a smaller batch or a larger timeout."
+            )
+
+        except Exception as e:
+            self._logger.error(f"Word batch conversion failed: {e}")
+            return _all_failed(str(e))
@@ -26,12 +26,18 @@ Created: December 2024
 
 from simple_ui_client.features.doc_converter.engine.windows.converter import WindowsConverter
 from simple_ui_client.features.doc_converter.engine.windows.word import WindowsWordConverter
-from simple_ui_client.features.doc_converter.engine.windows.excel import WindowsExcelConverter
+from simple_ui_client.features.doc_converter.engine.windows.excel import (
+    LibreOfficeExcelConverter,
+    WindowsExcelConverter,
+    WindowsExcelConverterPool,
+)
 from simple_ui_client.features.doc_converter.engine.windows.powerpoint import WindowsPowerPointConverter
 
 __all__ = [
     "WindowsConverter",           # Main converter (use this normally)
     "WindowsWordConverter",       # Direct Word converter access
     "WindowsExcelConverter",      # Direct Excel converter access
+    "WindowsExcelConverterPool",  # Multi-process Excel batch conversion
+    "LibreOfficeExcelConverter",  # soffice backend for macro-free sheets
     "WindowsPowerPointConverter", # Direct PowerPoint converter access
 ]
@@ -146,6 +146,15 @@ class WindowsConverter(BaseConverter):
     ) -> ConversionResult:
         """Convert macro Excel to XLSX via WindowsExcelConverter."""
         return self._excel_converter.convert_xlsm_to_xlsx(source, target)
+
+    def convert_xlsm(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+    ) -> ConversionResult:
+        """Convert macro Excel straight to PDF via WindowsExcelConverter."""
+        return self._excel_converter.convert_xlsm(source, target, config)
     
     @property
     def supports_parallel(self) -> bool:
@@ -22,20 +22,58 @@ Created: December 2024
 
 from __future__ import annotations
 
+import os
+import re
+import shutil
+import tempfile
+import threading
 import time
+import zipfile
+from contextlib import contextmanager
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
 
+from simple_ui_client.features.doc_converter.config import (
+    ExcelBackend,
+    MarginType,
+    Orientation,
+    ScalingMode,
+)
 from simple_ui_client.features.doc_converter.engine.base import ConversionResult
+from simple_ui_client.features.doc_converter.engine.linux.excel import (
+    LinuxExcelConverter,
+)
+
+# COM bindings only exist on Windows with pywin32 installed; importing
+# them once here keeps the per-conversion hot path free of IMPORT_NAME
+# dispatch. Converters raise a clear error from initialize() when absent.
+try:
+    import pythoncom
+    import win32com.client
+    from win32com.client import gencache as _gencache
+
+    _COM_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only off-Windows
+    _COM_AVAILABLE = False
+
+# Job Object APIs used to tie the Excel child's lifetime to ours; kept
+# separate from the COM guard because conversion works without them —
+# they only add crash containment
+try:
+    import win32api
+    import win32con
+    import win32job
+    import win32process
+
+    _JOB_API_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only off-Windows
+    _JOB_API_AVAILABLE = False
 
 if TYPE_CHECKING:
-    from simple_ui_client.features.doc_converter.config import (
-        ExcelPrintConfig,
-        MarginType,
-        ScalingMode,
-    )
+    from simple_ui_client.features.doc_converter.config import ExcelPrintConfig
 
 
 # ============================================================================
@@ -57,6 +95,37 @@ XL_LANDSCAPE = 2
 # File format for XLSX (when converting XLSM)
 XL_OPENXML_WORKBOOK = 51  # .xlsx format
 
+# Manual page break (xlPageBreakManual)
+XL_PAGE_BREAK_MANUAL = -4135
+
+# Calculation modes
+XL_CALCULATION_MANUAL = -4135    # xlCalculationManual
+XL_CALCULATION_AUTOMATIC = -4105  # xlCalculationAutomatic
+
+# COM registration identifiers for early binding
+_EXCEL_PROGID = "Excel.Application"
+_EXCEL_TYPELIB = "{00020813-0000-0000-C000-000000000046}"  # Excel object library
+
+# Recycle the persistent Excel process after this many files to avoid
+# the slow memory growth / RPC-server-unavailable failure mode of
+# long-lived automation instances
+_MAX_FILES_PER_INSTANCE = 50
+
+# How long to wait for Excel.Quit before terminating the process:
+# on a wedged instance Quit blocks on COM RPC retries for tens of
+# seconds, stalling every job queued behind this worker
+_QUIT_TIMEOUT_SECONDS = 5.0
+
+# OOXML parts and metadata that make a workbook macro-enabled; removing
+# them (and nothing else) turns an .xlsm archive into a valid .xlsx
+_VBA_PARTS = ("xl/vbaProject.bin", "xl/vbaProjectSignature.bin")
+_MACRO_CONTENT_TYPE = b"application/vnd.ms-excel.sheet.macroEnabled.main+xml"
+_SHEET_CONTENT_TYPE = (
+    b"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+)
+_VBA_OVERRIDE_RE = re.compile(rb"<Override[^>]*vbaProject[^>]*/>")
+_VBA_RELATIONSHIP_RE = re.compile(rb"<Relationship[^>]*vbaProject[^>]*/>")
+
 
 class WindowsExcelConverter:
     """
@@ -89,30 +158,179 @@ class WindowsExcelConverter:
             converter.cleanup()
     """
     
+    # Set once per process when the Excel typelib wrapper is generated
+    _typelib_ready = False
+
     def __init__(self) -> None:
         """Initialize the Excel converter."""
         self._initialized = False
+        self._excel = None
+        self._excel_pid: int | None = None
+        self._files_since_recycle = 0
+        self._job = None
+        self._libreoffice: "LibreOfficeExcelConverter | None" = None
         self._logger = logger.bind(component="WindowsExcelConverter")
-    
+
     def initialize(self) -> None:
         """
         Initialize COM for Excel operations.
-        
+
         Must be called from the worker thread before conversion.
-        Sets up COM single-threaded apartment for this thread.
+        Sets up COM single-threaded apartment for this thread and
+        generates the early-binding wrapper for the Excel typelib once
+        per process.
         """
         if self._initialized:
             return
-        
+
+        if not _COM_AVAILABLE:
+            raise RuntimeError("pywin32 package required")
+
         try:
-            import pythoncom
             pythoncom.CoInitialize()
             self._initialized = True
             self._logger.debug("COM initialized for Excel converter")
-        except ImportError:
-            raise RuntimeError("pywin32 package required")
         except Exception as e:
             raise RuntimeError(f"COM initialization failed: {e}")
+
+        # Pre-generate the makepy wrapper so EnsureDispatch below gets
+        # early-bound (vtable) calls instead of per-call GetIDsOfNames
+        # lookups. Failure is non-fatal: we fall back to late binding.
+        if not WindowsExcelConverter._typelib_ready:
+            try:
+                _gencache.EnsureModule(_EXCEL_TYPELIB, 0, 1, 9)
+                WindowsExcelConverter._typelib_ready = True
+                self._logger.debug("Excel typelib wrapper ready (early binding)")
+            except Exception as e:
+                self._logger.debug(f"Excel typelib generation skipped: {e}")
+
+        # Create a kill-on-close Job Object: if this process dies with
+        # Excel still running (RPC failures wedge exactly this way), the
+        # OS terminates the Excel child instead of leaving a ~100MB
+        # orphan EXCEL.EXE behind. Optional — conversion works without it.
+        if _JOB_API_AVAILABLE and self._job is None:
+            try:
+                job = win32job.CreateJobObject(None, "")
+                info = win32job.QueryInformationJobObject(
+                    job, win32job.JobObjectExtendedLimitInformation
+                )
+                info["BasicLimitInformation"]["LimitFlags"] |= (
+                    win32job.JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+                )
+                win32job.SetInformationJobObject(
+                    job, win32job.JobObjectExtendedLimitInformation, info
+                )
+                self._job = job
+                self._logger.debug("Job object ready for Excel containment")
+            except Exception as e:
+                self._logger.warning(f"Job object setup skipped: {e}")
+
+    def _assign_to_job(self, excel) -> None:
+        """
+        Put the Excel process inside the kill-on-close job object.
+
+        The PID is found via the application window handle and kept for
+        the Quit watchdog in _quit_excel; failures are logged and
+        ignored, leaving the instance merely uncontained.
+        """
+        if self._job is None:
+            return
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(excel.Hwnd)
+            self._excel_pid = pid
+            handle = win32api.OpenProcess(
+                win32con.PROCESS_SET_QUOTA | win32con.PROCESS_TERMINATE,
+                False,
+                pid,
+            )
+            try:
+                win32job.AssignProcessToJobObject(self._job, handle)
+            finally:
+                win32api.CloseHandle(handle)
+        except Exception as e:
+            self._logger.warning(f"Could not contain Excel in job object: {e}")
+
+    def _dispatch_excel(self) -> object:
+        """
+        Create an Excel.Application COM object, early-bound when possible.
+
+        EnsureDispatch resolves DISPIDs at wrapper-generation time, so
+        every property set in convert() is one marshalled call instead
+        of a name lookup plus an invoke. Falls back to plain late-bound
+        Dispatch when gencache can't write its wrapper cache.
+        """
+        if not _COM_AVAILABLE:
+            raise RuntimeError("pywin32 package required")
+
+        try:
+            return _gencache.EnsureDispatch(_EXCEL_PROGID)
+        except Exception as e:
+            self._logger.debug(f"Early-bound dispatch unavailable: {e}")
+            return win32com.client.Dispatch(_EXCEL_PROGID)
+
+    def _ensure_excel(self) -> object:
+        """
+        Get the persistent Excel.Application, creating it on first use.
+
+        Excel takes seconds to launch, so one instance is kept alive and
+        reused across convert() calls instead of paying the startup cost
+        per file. The instance is recycled every _MAX_FILES_PER_INSTANCE
+        files and finally quit in cleanup().
+        """
+        if self._files_since_recycle >= _MAX_FILES_PER_INSTANCE:
+            self._logger.debug("Recycling Excel instance after 50 files")
+            self._quit_excel()
+
+        if self._excel is None:
+            self._excel = self._dispatch_excel()
+            self._excel.Visible = False           # Hide Excel window
+            self._excel.DisplayAlerts = False     # Suppress all dialogs
+            self._excel.ScreenUpdating = False    # Improve performance
+            self._files_since_recycle = 0
+            self._assign_to_job(self._excel)
+        return self._excel
+
+    def _quit_excel(self) -> None:
+        """
+        Quit the persistent Excel instance with a bounded wait.
+
+        Quit() runs on a daemon thread joined with a short timeout so a
+        wedged Excel can't stall the worker. If it doesn't return in
+        time, the process is terminated via the PID recorded at launch;
+        the kill-on-close job object remains the final backstop.
+        """
+        excel, self._excel = self._excel, None
+        pid, self._excel_pid = self._excel_pid, None
+        self._files_since_recycle = 0
+        if excel is None:
+            return
+
+        quitter = threading.Thread(target=excel.Quit, daemon=True)
+        quitter.start()
+        quitter.join(timeout=_QUIT_TIMEOUT_SECONDS)
+        if not quitter.is_alive():
+            return
+
+        self._logger.warning("Excel.Quit did not return; terminating process")
+        if not (_JOB_API_AVAILABLE and pid):
+            return
+        try:
+            handle = win32api.OpenProcess(win32con.PROCESS_TERMINATE, False, pid)
+            try:
+                win32api.TerminateProcess(handle, 1)
+            finally:
+                win32api.CloseHandle(handle)
+        except Exception as e:
+            self._logger.warning(f"Could not terminate Excel process: {e}")
+
+    def _safe_close(self, workbook) -> None:
+        """Close a workbook without saving, ignoring COM errors."""
+        if workbook is None:
+            return
+        try:
+            workbook.Close(False)
+        except Exception:
+            pass
     
     def cleanup(self) -> None:
         """
@@ -122,9 +340,20 @@ class WindowsExcelConverter:
         """
         if not self._initialized:
             return
-        
+
+        # Quit the persistent Excel instance before tearing down COM
+        self._quit_excel()
+
+        # Closing the job handle is the guarantee: any Excel process
+        # still inside it is terminated by the OS
+        if self._job is not None:
+            try:
+                self._job.Close()
+            except Exception as e:
+                self._logger.warning(f"Error closing job object: {e}")
+            self._job = None
+
         try:
-            import pythoncom
             pythoncom.CoUninitialize()
             self._initialized = False
             self._logger.debug("COM uninitialized for Excel converter")
@@ -133,8 +362,6 @@ class WindowsExcelConverter:
     
     def _get_margin_inches(self, margin_type: "MarginType") -> tuple[float, float, float, float]:
         """Get margin values for a preset."""
-        from simple_ui_client.features.doc_converter.config import MarginType
-        
         presets = {
             MarginType.NORMAL: (0.75, 0.75, 0.7, 0.7),
             MarginType.NARROW: (0.5, 0.5, 0.5, 0.5),
@@ -142,23 +369,203 @@ class WindowsExcelConverter:
         }
         return presets.get(margin_type, presets[MarginType.NORMAL])
     
+    @contextmanager
+    def _fast_excel(self, excel):
+        """
+        Put Excel into batch-configuration mode for the enclosed block.
+
+        Volatile formulas (NOW, RAND, ...) trigger a full recalc on open
+        and again after every PageSetup write; screen updates, event
+        handlers, and per-write print communication all add their own
+        cost. Everything is suspended on entry and restored on exit —
+        in a finally, so an exception inside the block can't leave the
+        persistent Excel instance in manual-calculation mode.
+
+        Args:
+            excel: The Excel.Application object to gate.
+        """
+        excel.ScreenUpdating = False
+        excel.DisplayAlerts = False
+        excel.EnableEvents = False
+        excel.Calculation = XL_CALCULATION_MANUAL
+        excel.PrintCommunication = False
+        try:
+            yield excel
+        finally:
+            excel.PrintCommunication = True
+            excel.Calculation = XL_CALCULATION_AUTOMATIC
+            excel.EnableEvents = True
+            excel.ScreenUpdating = False  # Stays off; Excel is never shown
+
+    def _configure_sheet(
+        self,
+        sheet,
+        config: "ExcelPrintConfig",
+        margin_pts: tuple[float, float, float, float, float | None, float | None],
+    ) -> None:
+        """
+        Apply page setup to one worksheet.
+
+        Shared by both convert() branches (single named sheet and whole
+        workbook) so there is exactly one implementation of the setup
+        logic. Caller is expected to have PrintCommunication, manual
+        calculation, and events already suspended.
+
+        Args:
+            sheet: Worksheet COM object to configure.
+            config: Excel print configuration.
+            margin_pts: (top, bottom, left, right, header, footer)
+                margins in points; header/footer are None for presets.
+        """
+        top_pts, bottom_pts, left_pts, right_pts, header_pts, footer_pts = margin_pts
+
+        # Get page setup object for this sheet
+        ps = sheet.PageSetup
+
+        # ---------------------------------------------------------
+        # Orientation Setting
+        # ---------------------------------------------------------
+        if config.orientation == Orientation.LANDSCAPE:
+            ps.Orientation = XL_LANDSCAPE
+        else:
+            ps.Orientation = XL_PORTRAIT
+
+        # ---------------------------------------------------------
+        # Margin Settings (precomputed by the caller, in points)
+        # ---------------------------------------------------------
+        ps.TopMargin = top_pts
+        ps.BottomMargin = bottom_pts
+        ps.LeftMargin = left_pts
+        ps.RightMargin = right_pts
+        if header_pts is not None:
+            # Custom margins also carry header/footer distances
+            ps.HeaderMargin = header_pts
+            ps.FooterMargin = footer_pts
+
+        # ---------------------------------------------------------
+        # Scaling Settings
+        # ---------------------------------------------------------
+        # Excel scaling works with Zoom OR FitToPages, not both
+
+        if config.scaling == ScalingMode.FIT_SHEET:
+            # Fit entire sheet on one page
+            ps.Zoom = False          # Disable percentage zoom
+            ps.FitToPagesWide = 1    # One page wide
+            ps.FitToPagesTall = 1    # One page tall
+
+        elif config.scaling == ScalingMode.FIT_COLUMNS:
+            # Fit all columns on page width, any number of rows
+            ps.Zoom = False
+            ps.FitToPagesWide = 1
+            ps.FitToPagesTall = False  # Unlimited pages tall
+
+        elif config.scaling == ScalingMode.FIT_ROWS:
+            # Fit all rows on page height, any number of columns
+            ps.Zoom = False
+            ps.FitToPagesWide = False
+            ps.FitToPagesTall = 1
+
+        elif config.scaling == ScalingMode.CUSTOM:
+            # Use specific percentage (10-400%)
+            ps.Zoom = config.scaling_percent
+            ps.FitToPagesWide = False
+            ps.FitToPagesTall = False
+
+        else:  # NO_SCALING
+            ps.Zoom = 100
+            ps.FitToPagesWide = False
+            ps.FitToPagesTall = False
+
+        # ---------------------------------------------------------
+        # Header/Footer Settings
+        # ---------------------------------------------------------
+        if config.print_header_footer:
+            # &A = Sheet name, &P = Current page, &N = Total pages
+            ps.CenterHeader = "&A"           # Sheet name centered
+            ps.RightHeader = "Page &P of &N" # Page numbers on right
+            ps.LeftHeader = ""
+            ps.CenterFooter = ""
+            ps.LeftFooter = ""
+            ps.RightFooter = ""
+        else:
+            # Clear all headers and footers
+            ps.CenterHeader = ""
+            ps.RightHeader = ""
+            ps.LeftHeader = ""
+            ps.CenterFooter = ""
+            ps.RightFooter = ""
+            ps.LeftFooter = ""
+
+        # ---------------------------------------------------------
+        # Row/Column Headings
+        # ---------------------------------------------------------
+        # PrintHeadings shows Excel's row numbers (1,2,3) and
+        # column letters (A,B,C) in the printout
+        ps.PrintHeadings = config.print_row_col_headings
+
+        # ---------------------------------------------------------
+        # Page Break Settings
+        # ---------------------------------------------------------
+        # Bind UsedRange once for both break directions — every fetch
+        # is an IDispatch call returning a fresh Range proxy
+        if config.rows_per_page or config.columns_per_page:
+            used_range = sheet.UsedRange
+
+        if config.rows_per_page:
+            # Add horizontal page breaks every N rows. Bind the count
+            # into a Python local before the loop — UsedRange.Rows.Count
+            # is three chained COM lookups
+            total_rows = used_range.Rows.Count
+
+            # First, clear existing page breaks
+            sheet.ResetAllPageBreaks()
+
+            # Cache the Rows collection once per sheet: each
+            # attribute lookup is its own IDispatch round-trip
+            rows_coll = sheet.Rows
+
+            # Add breaks at regular intervals. Setting PageBreak on
+            # the row is one marshalled call per break, vs the two
+            # (HPageBreaks lookup + Add) of the wrapper-object form
+            for row in range(
+                config.rows_per_page + 1,  # Start after first block
+                total_rows + 1,            # Go to end of data
+                config.rows_per_page       # Step by rows_per_page
+            ):
+                rows_coll(row).PageBreak = XL_PAGE_BREAK_MANUAL
+
+        if config.columns_per_page:
+            # Add vertical page breaks every N columns
+            total_cols = used_range.Columns.Count
+
+            # Same collection-caching as the row breaks above
+            cols_coll = sheet.Columns
+
+            for col in range(
+                config.columns_per_page + 1,
+                total_cols + 1,
+                config.columns_per_page
+            ):
+                cols_coll(col).PageBreak = XL_PAGE_BREAK_MANUAL
+
     def convert(
         self,
         source: Path,
         target: Path,
         config: "ExcelPrintConfig",
         sheet_name: str | None = None,
+        in_memory: bool = False,
     ) -> ConversionResult:
         """
         Convert an Excel spreadsheet to PDF.
-        
+
         This method:
-        1. Opens workbook in Excel (invisible)
+        1. Opens workbook in the persistent Excel instance (invisible)
         2. Applies page setup to all or specific sheets
         3. Sets up scaling, margins, headers
         4. Exports to PDF
-        5. Closes Excel
-        
+        5. Closes the workbook (Excel stays warm for the next file)
+
         Args:
             source: Path to Excel file (.xls, .xlsx, .xlsm).
             target: Output path for PDF file.
@@ -173,237 +580,257 @@ class WindowsExcelConverter:
                    - orientation: 'portrait' or 'landscape'
             sheet_name: Optional specific sheet to convert.
                        If None, all sheets are included.
-        
+            in_memory: Hand the PDF to the caller through a shared
+                      memory segment instead of leaving it at target.
+                      Excel still writes a (temp) file — its exporter
+                      only speaks filenames — but downstream consumers
+                      attach to ConversionResult.shared_memory_name and
+                      skip re-reading the PDF from disk. The attaching
+                      side owns unlinking the segment.
+
         Returns:
             ConversionResult with conversion details.
         """
-        start_time = time.time()
-        excel = None
+        start_time = time.perf_counter()
         workbook = None
-        
+        tmp_dir: str | None = None
+
+        # Optional soffice backend: only for macro-free workbooks
+        # (LibreOffice drops VBA) writing plain on-disk output
+        if (
+            config.backend == ExcelBackend.LIBREOFFICE
+            and not in_memory
+            and source.suffix.lower() not in (".xlsm", ".xlsb")
+        ):
+            if self._libreoffice is None:
+                self._libreoffice = LibreOfficeExcelConverter()
+            return self._libreoffice.convert(source, target, config, sheet_name)
+
         try:
-            import win32com.client
-            from simple_ui_client.features.doc_converter.config import (
-                MarginType,
-                Orientation,
-                ScalingMode,
-            )
-            
             self._logger.info(f"Converting Excel spreadsheet: {source.name}")
-            
+
+            # Resolve both paths once: Path.resolve() hits the filesystem
+            # and normalizes to the backslash form Excel expects, so doing
+            # it per call site pays the syscall four times per conversion
+            source_s = os.fspath(source.resolve())
+            target_s = os.fspath(target.resolve())
+
+            # In-memory hand-off still needs a file for Excel to export
+            # into; it lives in a private temp dir and is deleted after
+            # its bytes are copied to the shared memory segment
+            if in_memory:
+                tmp_dir = tempfile.mkdtemp(prefix="xl-pdf-")
+                target_s = os.path.join(tmp_dir, target.name)
+
             # ===================================================================
-            # STEP 1: Create Excel Application Instance
+            # STEP 1: Get Excel Application Instance
             # ===================================================================
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = False           # Hide Excel window
-            excel.DisplayAlerts = False     # Suppress all dialogs
-            excel.ScreenUpdating = False    # Improve performance
+            # Reused across calls; only the workbook is opened per file
+            excel = self._ensure_excel()
             
             # ===================================================================
             # STEP 2: Open the Workbook
             # ===================================================================
-            workbook = excel.Workbooks.Open(str(source.absolute()))
-            
+            workbook = excel.Workbooks.Open(source_s)
+
             # ===================================================================
             # STEP 3: Configure Each Worksheet
             # ===================================================================
-            for sheet in workbook.Worksheets:
-                # Skip sheets we're not converting (if specific sheet requested)
-                if sheet_name and sheet.Name != sheet_name:
-                    continue
-                
-                # Get page setup object for this sheet
-                ps = sheet.PageSetup
-                
-                # ---------------------------------------------------------
-                # Orientation Setting
-                # ---------------------------------------------------------
-                if config.orientation == Orientation.LANDSCAPE:
-                    ps.Orientation = XL_LANDSCAPE
-                else:
-                    ps.Orientation = XL_PORTRAIT
-                
-                # ---------------------------------------------------------
-                # Margin Settings
-                # ---------------------------------------------------------
-                if config.margins == MarginType.CUSTOM:
-                    # Custom margins from config (in inches, converted to points)
-                    ps.TopMargin = excel.InchesToPoints(config.margins_custom.top)
-                    ps.BottomMargin = excel.InchesToPoints(config.margins_custom.bottom)
-                    ps.LeftMargin = excel.InchesToPoints(config.margins_custom.left)
-                    ps.RightMargin = excel.InchesToPoints(config.margins_custom.right)
-                    ps.HeaderMargin = excel.InchesToPoints(config.margins_custom.header)
-                    ps.FooterMargin = excel.InchesToPoints(config.margins_custom.footer)
-                else:
-                    # Use preset margins
-                    top, bottom, left, right = self._get_margin_inches(config.margins)
-                    ps.TopMargin = excel.InchesToPoints(top)
-                    ps.BottomMargin = excel.InchesToPoints(bottom)
-                    ps.LeftMargin = excel.InchesToPoints(left)
-                    ps.RightMargin = excel.InchesToPoints(right)
-                
-                # ---------------------------------------------------------
-                # Scaling Settings
-                # ---------------------------------------------------------
-                # Excel scaling works with Zoom OR FitToPages, not both
-                
-                if config.scaling == ScalingMode.FIT_SHEET:
-                    # Fit entire sheet on one page
-                    ps.Zoom = False          # Disable percentage zoom
-                    ps.FitToPagesWide = 1    # One page wide
-                    ps.FitToPagesTall = 1    # One page tall
-                    
-                elif config.scaling == ScalingMode.FIT_COLUMNS:
-                    # Fit all columns on page width, any number of rows
-                    ps.Zoom = False
-                    ps.FitToPagesWide = 1
-                    ps.FitToPagesTall = False  # Unlimited pages tall
-                    
-                elif config.scaling == ScalingMode.FIT_ROWS:
-                    # Fit all rows on page height, any number of columns
-                    ps.Zoom = False
-                    ps.FitToPagesWide = False
-                    ps.FitToPagesTall = 1
-                    
-                elif config.scaling == ScalingMode.CUSTOM:
-                    # Use specific percentage (10-400%)
-                    ps.Zoom = config.scaling_percent
-                    ps.FitToPagesWide = False
-                    ps.FitToPagesTall = False
-                    
-                else:  # NO_SCALING
-                    ps.Zoom = 100
-                    ps.FitToPagesWide = False
-                    ps.FitToPagesTall = False
-                
-                # ---------------------------------------------------------
-                # Header/Footer Settings
-                # ---------------------------------------------------------
-                if config.print_header_footer:
-                    # &A = Sheet name, &P = Current page, &N = Total pages
-                    ps.CenterHeader = "&A"           # Sheet name centered
-                    ps.RightHeader = "Page &P of &N" # Page numbers on right
-                    ps.LeftHeader = ""
-                    ps.CenterFooter = ""
-                    ps.LeftFooter = ""
-                    ps.RightFooter = ""
-                else:
-                    # Clear all headers and footers
-                    ps.CenterHeader = ""
-                    ps.RightHeader = ""
-                    ps.LeftHeader = ""
-                    ps.CenterFooter = ""
-                    ps.RightFooter = ""
-                    ps.LeftFooter = ""
-                
-                # ---------------------------------------------------------
-                # Row/Column Headings
-                # ---------------------------------------------------------
-                # PrintHeadings shows Excel's row numbers (1,2,3) and
-                # column letters (A,B,C) in the printout
-                ps.PrintHeadings = config.print_row_col_headings
-                
-                # ---------------------------------------------------------
-                # Page Break Settings
-                # ---------------------------------------------------------
-                if config.rows_per_page:
-                    # Add horizontal page breaks every N rows
-                    used_range = sheet.UsedRange
-                    total_rows = used_range.Rows.Count
-                    
-                    # First, clear existing page breaks
-                    sheet.ResetAllPageBreaks()
-                    
-                    # Add breaks at regular intervals
-                    for row in range(
-                        config.rows_per_page + 1,  # Start after first block
-                        total_rows + 1,            # Go to end of data
-                        config.rows_per_page       # Step by rows_per_page
-                    ):
-                        # HPageBreaks = Horizontal Page Breaks (between rows)
-                        sheet.HPageBreaks.Add(Before=sheet.Rows(row))
-                
-                if config.columns_per_page:
-                    # Add vertical page breaks every N columns
-                    used_range = sheet.UsedRange
-                    total_cols = used_range.Columns.Count
-                    
-                    for col in range(
-                        config.columns_per_page + 1,
-                        total_cols + 1,
-                        config.columns_per_page
-                    ):
-                        # VPageBreaks = Vertical Page Breaks (between columns)
-                        sheet.VPageBreaks.Add(Before=sheet.Columns(col))
-            
+            # Margins don't depend on the sheet, so resolve them to points
+            # once up front. An inch is exactly 72 points, so the multiply
+            # replaces Application.InchesToPoints entirely — that was one
+            # COM round-trip per margin per worksheet.
+            header_pts = footer_pts = None
+            if config.margins == MarginType.CUSTOM:
+                top_pts = config.margins_custom.top * 72.0
+                bottom_pts = config.margins_custom.bottom * 72.0
+                left_pts = config.margins_custom.left * 72.0
+                right_pts = config.margins_custom.right * 72.0
+                header_pts = config.margins_custom.header * 72.0
+                footer_pts = config.margins_custom.footer * 72.0
+            else:
+                top, bottom, left, right = self._get_margin_inches(config.margins)
+                top_pts = top * 72.0
+                bottom_pts = bottom * 72.0
+                left_pts = left * 72.0
+                right_pts = right * 72.0
+
+            # All page-setup writes happen in batch mode — see _fast_excel
+            # for why. Exiting the block hands layout and recalculation
+            # back to Excel so the PDF export below paginates against
+            # final state.
+            margin_pts = (top_pts, bottom_pts, left_pts, right_pts,
+                          header_pts, footer_pts)
+            # Index the collection directly for a named sheet: iterating
+            # Worksheets marshals a proxy (plus a .Name fetch) for every
+            # sheet just to skip all but one. The bound proxy is reused
+            # by the single-sheet export in STEP 5.
+            if sheet_name:
+                target_sheet = workbook.Worksheets(sheet_name)
+                target_sheets = [target_sheet]
+            else:
+                target_sheet = None
+                target_sheets = workbook.Worksheets
+            with self._fast_excel(excel):
+                for sheet in target_sheets:
+                    self._configure_sheet(sheet, config, margin_pts)
+
+            # A workbook with volatile formulas may still be stale after
+            # the manual-calculation window; callers that care opt into
+            # one full recalc before the export snapshot is taken.
+            if config.recalculate_before_export:
+                workbook.Calculate()
+
             # ===================================================================
             # STEP 4: Create Output Directory
             # ===================================================================
-            target.parent.mkdir(parents=True, exist_ok=True)
-            
+            if not in_memory:
+                target.parent.mkdir(parents=True, exist_ok=True)
+
             # ===================================================================
             # STEP 5: Export to PDF
             # ===================================================================
-            if sheet_name:
-                # Export specific sheet only
-                sheet = workbook.Worksheets(sheet_name)
-                sheet.ExportAsFixedFormat(
+            # All optional arguments are passed explicitly: skipping the
+            # document-properties block avoids serializing XMP metadata
+            # into the PDF, and OpenAfterPublish=False keeps Excel from
+            # even considering a viewer launch. Print areas set above
+            # stay respected (IgnorePrintAreas=False).
+            if target_sheet is not None:
+                # Export specific sheet only (proxy bound in STEP 3)
+                target_sheet.ExportAsFixedFormat(
                     Type=XL_TYPE_PDF,
-                    Filename=str(target.absolute()),
+                    Filename=target_s,
                     Quality=XL_QUALITY_STANDARD,
+                    IncludeDocProperties=False,
+                    IgnorePrintAreas=False,
+                    OpenAfterPublish=False,
                 )
             else:
                 # Export entire workbook (all sheets)
                 workbook.ExportAsFixedFormat(
                     Type=XL_TYPE_PDF,
-                    Filename=str(target.absolute()),
+                    Filename=target_s,
                     Quality=XL_QUALITY_STANDARD,
+                    IncludeDocProperties=False,
+                    IgnorePrintAreas=False,
+                    OpenAfterPublish=False,
                 )
             
             # ===================================================================
-            # STEP 6: Close and Cleanup
+            # STEP 6: Close the Workbook
             # ===================================================================
+            # Excel itself stays alive for the next call (see _ensure_excel)
             workbook.Close(SaveChanges=False)  # Don't save changes
             workbook = None
-            
-            excel.Quit()
-            excel = None
-            
+            self._files_since_recycle += 1
+
             # ===================================================================
-            # STEP 7: Return Success
+            # STEP 7: Publish to Shared Memory (in-memory mode only)
             # ===================================================================
-            duration = time.time() - start_time
-            self._logger.info(f"Excel conversion complete: {target.name} ({duration:.1f}s)")
-            
+            # Copy the PDF bytes into a named segment so the next stage
+            # attaches and mmaps them instead of re-reading from disk
+            shm_name = None
+            if in_memory:
+                data = Path(target_s).read_bytes()
+                segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+                segment.buf[: len(data)] = data
+                shm_name = segment.name
+                segment.close()  # Keep the segment alive; consumer unlinks
+
+            # ===================================================================
+            # STEP 8: Return Success
+            # ===================================================================
+            duration = time.perf_counter() - start_time
+            self._logger.info(f"Excel conversion complete: {target.name} ({duration:.3f}s)")
+
             return ConversionResult(
                 success=True,
                 source_path=source,
-                output_path=target,
+                output_path=None if in_memory else target,
                 duration_seconds=duration,
+                shared_memory_name=shm_name,
             )
-            
+
         except Exception as e:
             self._logger.error(f"Excel conversion failed: {e}")
-            
-            # Cleanup on error
-            if workbook:
-                try:
-                    workbook.Close(False)
-                except Exception:
-                    pass
-            if excel:
-                try:
-                    excel.Quit()
-                except Exception:
-                    pass
-            
+
+            # Cleanup on error; don't hand a possibly-wedged Excel to
+            # the next call
+            self._safe_close(workbook)
+            self._quit_excel()
+
             return ConversionResult(
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=time.perf_counter() - start_time,
             )
-    
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def convert_xlsm(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+        sheet_name: str | None = None,
+    ) -> ConversionResult:
+        """
+        Convert a macro-enabled Excel file directly to PDF.
+
+        Excel's PDF export never includes VBA code, so the workbook can
+        be opened once and exported straight to PDF — no intermediate
+        XLSX and no second Excel launch.
+
+        Args:
+            source: Path to the XLSM/XLSB file with macros.
+            target: Output path for the PDF file.
+            config: Excel print configuration.
+            sheet_name: Optional specific sheet to convert.
+
+        Returns:
+            ConversionResult with conversion details.
+        """
+        return self.convert(source, target, config, sheet_name)
+
+    def _strip_macros_fast(self, source: Path, target: Path) -> None:
+        """
+        Rewrite an XLSM as XLSX at zip level, without launching Excel.
+
+        An .xlsm is an .xlsx plus the VBA binary parts, a macro-enabled
+        workbook content type, and one relationship entry, so copying
+        the archive member-by-member while skipping/patching those turns
+        it into a valid plain workbook:
+
+        1. Skip xl/vbaProject.bin and xl/vbaProjectSignature.bin
+        2. Patch [Content_Types].xml: drop the vbaProject Overrides and
+           switch the workbook content type to the plain spreadsheet one
+        3. Drop the vbaProject <Relationship> from
+           xl/_rels/workbook.xml.rels
+
+        Cell data, formulas, formatting, charts, and pivot tables pass
+        through byte-for-byte.
+
+        Raises:
+            Exception: On any zip or metadata problem — the caller falls
+                back to the Excel COM conversion.
+        """
+        with (
+            zipfile.ZipFile(source) as src,
+            zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as dst,
+        ):
+            for item in src.infolist():
+                if item.filename in _VBA_PARTS:
+                    continue
+                data = src.read(item.filename)
+                if item.filename == "[Content_Types].xml":
+                    data = data.replace(_MACRO_CONTENT_TYPE, _SHEET_CONTENT_TYPE)
+                    data = _VBA_OVERRIDE_RE.sub(b"", data)
+                elif item.filename == "xl/_rels/workbook.xml.rels":
+                    data = _VBA_RELATIONSHIP_RE.sub(b"", data)
+                dst.writestr(item, data)
+
     def convert_xlsm_to_xlsx(
         self,
         source: Path,
@@ -411,57 +838,79 @@ class WindowsExcelConverter:
     ) -> ConversionResult:
         """
         Convert macro-enabled Excel file to standard XLSX.
-        
+
         This removes VBA macros while preserving:
         - All cell data and formulas
         - Formatting and styles
         - Charts and images
         - Pivot tables
         - Named ranges
-        
+
         Use case: Some systems can't process XLSM files,
         or you want to remove macros for security.
-        
+
+        XLSM input is rewritten in-process with zip-level surgery
+        (_strip_macros_fast) — no Excel launch, so milliseconds instead
+        of seconds. Other formats (.xls, .xlsb need a real format
+        conversion) or a malformed archive go through Excel COM.
+
         Args:
             source: Path to XLSM/XLSB file.
             target: Path for output XLSX file.
-        
+
         Returns:
             ConversionResult indicating success/failure.
         """
-        start_time = time.time()
-        excel = None
+        start_time = time.perf_counter()
         workbook = None
-        
+
+        if source.suffix.lower() == ".xlsm":
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                self._strip_macros_fast(source, target)
+                duration = time.perf_counter() - start_time
+                self._logger.info(
+                    f"Stripped macros at zip level: {target.name} ({duration:.3f}s)"
+                )
+                return ConversionResult(
+                    success=True,
+                    source_path=source,
+                    output_path=target,
+                    duration_seconds=duration,
+                )
+            except Exception as e:
+                self._logger.warning(
+                    f"Zip-level macro strip failed, falling back to Excel: {e}"
+                )
+                target.unlink(missing_ok=True)  # Drop any partial output
+
         try:
-            import win32com.client
-            
             self._logger.info(f"Converting to XLSX: {source.name}")
-            
-            # Create Excel instance
-            excel = win32com.client.Dispatch("Excel.Application")
-            excel.Visible = False
-            excel.DisplayAlerts = False
-            
+
+            # Resolve both paths once (see convert)
+            source_s = os.fspath(source.resolve())
+            target_s = os.fspath(target.resolve())
+
+            # Reuse the persistent Excel instance
+            excel = self._ensure_excel()
+
             # Open macro file
-            workbook = excel.Workbooks.Open(str(source.absolute()))
-            
+            workbook = excel.Workbooks.Open(source_s)
+
             # Ensure output directory exists
             target.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Save as XLSX (FileFormat=51 removes macros)
             workbook.SaveAs(
-                Filename=str(target.absolute()),
+                Filename=target_s,
                 FileFormat=XL_OPENXML_WORKBOOK  # 51 = .xlsx
             )
-            
+
             workbook.Close(SaveChanges=False)
             workbook = None
-            
-            excel.Quit()
-            excel = None
-            
-            duration = time.time() - start_time
+            self._files_since_recycle += 1
+
+            duration = time.perf_counter() - start_time
             self._logger.info(f"XLSX conversion complete: {target.name}")
             
             return ConversionResult(
@@ -473,21 +922,199 @@ class WindowsExcelConverter:
             
         except Exception as e:
             self._logger.error(f"XLSM to XLSX conversion failed: {e}")
-            
-            if workbook:
-                try:
-                    workbook.Close(False)
-                except Exception:
-                    pass
-            if excel:
-                try:
-                    excel.Quit()
-                except Exception:
-                    pass
-            
+
+            # Don't hand a possibly-wedged Excel to the next call
+            self._safe_close(workbook)
+            self._quit_excel()
+
             return ConversionResult(
                 success=False,
                 source_path=source,
                 error=str(e),
-                duration_seconds=time.time() - start_time,
+                duration_seconds=time.perf_counter() - start_time,
             )
+
+
+class LibreOfficeExcelConverter:
+    """
+    Headless-soffice backend for macro-free workbook conversion.
+
+    Excel COM pays a multi-second application launch plus add-in load;
+    for plain .xlsx/.xls sheets `soffice --headless` is usually faster
+    and needs no COM apartment at all, so it also parallelizes freely
+    across processes. The subprocess mechanics — private profiles,
+    timeout handling, multi-file batch invocations that amortize the
+    cold start — already live in the LibreOffice engine, so this
+    delegates to it instead of reimplementing them. Print-setup
+    fidelity is reduced (LibreOffice honors only part of
+    ExcelPrintConfig) and macros are always dropped; workbooks that
+    need either stay on the COM backend.
+
+    Selected per conversion via ExcelPrintConfig.backend.
+    """
+
+    def __init__(self, soffice_path: str = "soffice") -> None:
+        """
+        Initialize the LibreOffice Excel backend.
+
+        Args:
+            soffice_path: LibreOffice executable; "soffice" is the
+                binary name Windows installs put on PATH.
+        """
+        self._delegate = LinuxExcelConverter(libreoffice_path=soffice_path)
+        self._logger = logger.bind(component="LibreOfficeExcelConverter")
+
+    def convert(
+        self,
+        source: Path,
+        target: Path,
+        config: "ExcelPrintConfig",
+        sheet_name: str | None = None,
+        timeout: int = 600,
+    ) -> ConversionResult:
+        """
+        Convert one spreadsheet to PDF in a single soffice run.
+
+        Args:
+            source: Path to the Excel file (.xls, .xlsx, .csv).
+            target: Output path for the PDF file.
+            config: Excel print configuration (partially honored).
+            sheet_name: Optional specific sheet to convert.
+            timeout: Maximum conversion time in seconds.
+
+        Returns:
+            ConversionResult with conversion details.
+        """
+        return self._delegate.convert(
+            source, target, config, sheet_name=sheet_name, timeout=timeout
+        )
+
+    def convert_batch(
+        self,
+        sources: "list[Path]",
+        output_dir: Path,
+        config: "ExcelPrintConfig",
+        timeout: int = 600,
+    ) -> "list[ConversionResult]":
+        """
+        Convert many spreadsheets in one soffice invocation.
+
+        soffice accepts multiple inputs per --convert-to run, so the
+        process cold start is paid once for the whole batch.
+
+        Args:
+            sources: Excel files to convert.
+            output_dir: Directory that receives all generated PDFs.
+            config: Excel print configuration (partially honored).
+            timeout: Maximum time for the whole batch in seconds.
+
+        Returns:
+            One ConversionResult per source, in order.
+        """
+        return self._delegate.convert_batch(
+            sources, output_dir, config, timeout=timeout
+        )
+
+
+class WindowsExcelConverterPool:
+    """
+    Parallel Excel conversion across worker processes.
+
+    Threads are the wrong tool here: Excel COM lives in a single-threaded
+    apartment, so threaded callers serialize on COM marshalling and end
+    up slower than a single thread. Separate processes sidestep both the
+    STA and the GIL — each worker owns its own persistent
+    Excel.Application (WindowsExcelConverter already recycles it every
+    _MAX_FILES_PER_INSTANCE files) and COM is initialized once per
+    worker, not once per file.
+
+    Example:
+        pool = WindowsExcelConverterPool(n_workers=4)
+        results = pool.convert_many([(src, dst, config), ...])
+    """
+
+    def __init__(self, n_workers: int = 4) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            n_workers: Number of worker processes (one Excel each).
+        """
+        self._n_workers = n_workers
+        self._logger = logger.bind(component="WindowsExcelConverterPool")
+
+    def convert_many(
+        self,
+        jobs: "list[tuple[Path, Path, ExcelPrintConfig]]",
+    ) -> list[ConversionResult]:
+        """
+        Convert a batch of spreadsheets in parallel.
+
+        Args:
+            jobs: (source, target, config) tuples.
+
+        Returns:
+            One ConversionResult per job, in input order.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._logger.info(
+            f"Converting {len(jobs)} spreadsheets on {self._n_workers} workers"
+        )
+        # spawn is required on Windows; fork would duplicate COM state
+        with ProcessPoolExecutor(
+            max_workers=self._n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_excel_worker,
+        ) as executor:
+            return list(executor.map(_run_excel_job, jobs, chunksize=4))
+
+
+# ============================================================================
+# WindowsExcelConverterPool worker helpers (must be module-level to pickle)
+# ============================================================================
+
+# One converter per worker process, created by _init_excel_worker
+_worker_converter: WindowsExcelConverter | None = None
+
+
+def _init_excel_worker() -> None:
+    """
+    Initialize a pool worker: one COM apartment, one persistent Excel.
+
+    The converter's initialize() performs CoInitialize and typelib
+    generation once for the lifetime of this worker process.
+    """
+    global _worker_converter
+    _worker_converter = WindowsExcelConverter()
+    _worker_converter.initialize()
+
+
+def _run_excel_job(job: "tuple[Path, Path, ExcelPrintConfig]") -> ConversionResult:
+    """Run one (source, target, config) job on the worker's converter."""
+    source, target, config = job
+    return _worker_converter.convert(source, target, config)
+
+
+def _warm_gencache() -> None:
+    """
+    Pre-generate the Excel typelib wrapper off the critical path.
+
+    EnsureModule parses the type library and writes the makepy wrapper
+    to disk the first time (hundreds of milliseconds); running it on a
+    background thread at import means the first convert() finds the
+    cache already hot instead of paying that cost itself.
+    """
+    try:
+        _gencache.EnsureModule(_EXCEL_TYPELIB, 0, 1, 9)
+        WindowsExcelConverter._typelib_ready = True
+    except Exception:
+        pass  # Non-fatal: initialize() retries, else late binding works
+
+
+# Kick the warm-up on a daemon thread so import time is unchanged.
+# _COM_AVAILABLE doubles as the platform gate: pywin32 only imports
+# on Windows, so non-Windows imports skip this entirely.
+if _COM_AVAILABLE:
+    threading.Thread(target=_warm_gencache, daemon=True).start()
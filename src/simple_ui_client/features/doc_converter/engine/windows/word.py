@@ -95,7 +95,12 @@ class WindowsWordConverter:
         """
         # Track whether COM has been initialized in current thread
         self._initialized = False
-        
+
+        # Cached Word.Application COM object: launching Word costs
+        # around half a second, so one instance is reused across
+        # conversions and quit only in cleanup()
+        self._app = None
+
         # Logger with component context for filtering
         self._logger = logger.bind(component="WindowsWordConverter")
     
@@ -128,10 +133,18 @@ class WindowsWordConverter:
             # Initialize COM for this thread
             # CoInitialize sets up single-threaded apartment (STA) model
             pythoncom.CoInitialize()
-            
+
             self._initialized = True
             self._logger.debug("COM initialized for Word converter")
-            
+
+            # Launch Word eagerly so the first conversion doesn't pay
+            # the application start; a launch failure here is only
+            # logged — convert() retries and reports it properly
+            try:
+                self._get_app()
+            except Exception as e:
+                self._logger.warning(f"Deferred Word launch to first convert: {e}")
+
         except ImportError:
             self._logger.error("pywin32 not installed - pip install pywin32")
             raise RuntimeError("pywin32 package required for Windows converter")
@@ -151,10 +164,13 @@ class WindowsWordConverter:
         """
         if not self._initialized:
             return
-        
+
+        # Quit the persistent Word instance before dropping COM
+        self._quit_app()
+
         try:
             import pythoncom
-            
+
             # Uninitialize COM for this thread
             # Releases all COM resources acquired in this thread
             pythoncom.CoUninitialize()
@@ -165,6 +181,43 @@ class WindowsWordConverter:
         except Exception as e:
             self._logger.warning(f"Error during COM cleanup: {e}")
     
+    def _get_app(self):
+        """
+        Get the cached Word.Application, launching it on first use.
+
+        The instance is configured invisible with alerts suppressed and
+        stays alive across conversions; per-file work is just
+        Documents.Open/Close against it.
+
+        Returns:
+            The Word.Application COM object.
+        """
+        if self._app is None:
+            import win32com.client
+
+            # Dispatch creates a COM connection to Word
+            # "Word.Application" is the ProgID for Microsoft Word
+            self._app = win32com.client.Dispatch("Word.Application")
+
+            # Make Word invisible - no window shown to user
+            self._app.Visible = False
+
+            # Suppress all alerts and confirmation dialogs
+            # This prevents Word from prompting during conversion
+            self._app.DisplayAlerts = False
+
+            self._logger.debug("Launched persistent Word instance")
+        return self._app
+
+    def _quit_app(self) -> None:
+        """Quit the cached Word instance, ignoring COM errors."""
+        if self._app is not None:
+            try:
+                self._app.Quit()
+            except Exception as e:
+                self._logger.warning(f"Error quitting Word: {e}")
+            self._app = None
+
     def _get_margin_inches(self, margin_type: "MarginType") -> tuple[float, float, float, float]:
         """
         Get margin values in inches for a margin preset.
@@ -230,35 +283,25 @@ class WindowsWordConverter:
             - Original document is not modified
         """
         start_time = time.time()
-        
-        # References to COM objects - need for cleanup
-        word = None
+
+        # Reference to the open document - needed for cleanup
         doc = None
-        
+
         try:
-            # Import Windows COM library
-            import win32com.client
             from simple_ui_client.features.doc_converter.config import (
                 MarginType,
                 Orientation,
             )
-            
+
             self._logger.info(f"Converting Word document: {source.name}")
-            
+
             # ===================================================================
-            # STEP 1: Create Word Application Instance
+            # STEP 1: Get the Word Application Instance
             # ===================================================================
-            # Dispatch creates a COM connection to Word
-            # "Word.Application" is the ProgID for Microsoft Word
-            word = win32com.client.Dispatch("Word.Application")
-            
-            # Make Word invisible - no window shown to user
-            word.Visible = False
-            
-            # Suppress all alerts and confirmation dialogs
-            # This prevents Word from prompting during conversion
-            word.DisplayAlerts = False
-            
+            # Launched on first use and reused across conversions; the
+            # per-file cost is just opening and closing the document
+            word = self._get_app()
+
             # ===================================================================
             # STEP 2: Open the Document
             # ===================================================================
@@ -324,16 +367,14 @@ class WindowsWordConverter:
             page_count = doc.ComputeStatistics(2)
             
             # ===================================================================
-            # STEP 7: Close Document and Word
+            # STEP 7: Close the Document
             # ===================================================================
-            # Close document without saving changes (False)
+            # Close document without saving changes (False); Word itself
+            # stays running for the next conversion and is quit in
+            # cleanup()
             doc.Close(False)
             doc = None  # Clear reference
-            
-            # Quit Word application
-            word.Quit()
-            word = None  # Clear reference
-            
+
             # ===================================================================
             # STEP 8: Return Success Result
             # ===================================================================
@@ -363,14 +404,11 @@ class WindowsWordConverter:
                     doc.Close(False)
                 except Exception:
                     pass  # Ignore errors during cleanup
-            
-            # Attempt to quit Word if running
-            if word is not None:
-                try:
-                    word.Quit()
-                except Exception:
-                    pass
-            
+
+            # Don't reuse a possibly-wedged Word instance: quit it and
+            # let the next conversion launch a fresh one
+            self._quit_app()
+
             return ConversionResult(
                 success=False,
                 source_path=source,
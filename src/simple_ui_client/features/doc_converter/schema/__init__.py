@@ -34,6 +34,8 @@ from simple_ui_client.features.doc_converter.schema.schema import (
     ConversionJob,
     JobProgress,
     JobResult,
+    BatchingConfig,
+    BatchingScheduler,
 )
 
 __all__ = [
@@ -41,4 +43,6 @@ __all__ = [
     "ConversionJob",
     "JobProgress",
     "JobResult",
+    "BatchingConfig",
+    "BatchingScheduler",
 ]
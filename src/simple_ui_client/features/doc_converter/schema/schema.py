@@ -5,13 +5,14 @@ Defines the data structures for job requests, progress updates, and results.
 All internal events use these models for payload validation.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class JobStatus(str, Enum):
@@ -34,13 +35,23 @@ class ConversionJob(BaseModel):
         source_path: Local path to the source document (alternative to URL).
         target_format: Desired output format.
         options: Additional conversion options.
+        shared_memory_name: Name of a multiprocessing shared memory
+            segment holding the document bytes, for pipelines that
+            hand output between stages without a disk round-trip.
+            Workers attach by name; the attaching side unlinks.
         created_at: When the job was created.
         priority: Job priority (higher = more urgent).
     """
-    
+
+    # Frozen: jobs cross thread/process boundaries and sit in batch
+    # buffers, so immutability makes sharing safe (and skips the
+    # per-assignment validation machinery entirely)
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(default_factory=uuid4)
     source_url: str | None = None
     source_path: Path | None = None
+    shared_memory_name: str | None = None
     target_format: str = "text"
     options: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -71,7 +82,9 @@ class JobProgress(BaseModel):
         message: Optional status message.
         updated_at: When this update was created.
     """
-    
+
+    model_config = ConfigDict(frozen=True)
+
     job_id: UUID
     progress: int = Field(ge=0, le=100)
     status: JobStatus = JobStatus.PROCESSING
@@ -93,7 +106,9 @@ class JobResult(BaseModel):
         completed_at: When the job completed.
         duration_ms: Processing duration in milliseconds.
     """
-    
+
+    model_config = ConfigDict(frozen=True)
+
     job_id: UUID
     success: bool
     output_path: Path | None = None
@@ -110,3 +125,124 @@ class JobResult(BaseModel):
         if isinstance(v, str):
             return Path(v)
         return v
+
+
+class BatchingConfig(BaseModel):
+    """
+    Tuning knobs for the job batching scheduler.
+    
+    Attributes:
+        batch_size: Flush as soon as this many jobs are buffered.
+        max_wait_ms: Flush a partial batch once its oldest job has
+            waited this long. This is the latency-vs-throughput knob:
+            larger values build bigger batches, smaller values bound
+            how long a lone job sits in the buffer.
+    """
+    
+    batch_size: int = Field(default=10, ge=1)
+    max_wait_ms: int = Field(default=500, ge=0)
+
+
+class BatchingScheduler:
+    """
+    Collects conversion jobs and hands them to a converter in batches.
+    
+    Submitting files one at a time makes the engine pay its startup
+    cost (an Office/LibreOffice process launch) per file. The scheduler
+    buffers submitted jobs and flushes them together — either when
+    batch_size is reached or when max_wait_ms has elapsed since the
+    batch started — so the startup cost is amortized over the whole
+    batch while per-job latency stays bounded.
+    
+    The flush handler is an async callable taking a list of
+    ConversionJobs; wiring it to a persistent or pooled converter is
+    the caller's choice, which keeps this class platform-neutral.
+    
+    Usage:
+        scheduler = BatchingScheduler(flush_handler=worker.run_batch)
+        await scheduler.start()
+        await scheduler.submit(job)
+        ...
+        await scheduler.stop()  # Flushes anything still buffered
+    """
+    
+    def __init__(
+        self,
+        flush_handler: Any,
+        config: BatchingConfig | None = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+        
+        Args:
+            flush_handler: Async callable invoked with each batch
+                (a list of ConversionJobs).
+            config: Batch size and latency window; defaults apply
+                when omitted.
+        """
+        self._flush_handler = flush_handler
+        self._config = config or BatchingConfig()
+        self._buffer: list[ConversionJob] = []
+        self._kick: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running = False
+    
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Stop the loop, flushing any still-buffered jobs first."""
+        if not self._running:
+            return
+        self._running = False
+        self._kick.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self._flush()
+    
+    async def submit(self, job: ConversionJob) -> None:
+        """
+        Queue a job for the next batch.
+        
+        Args:
+            job: The conversion job to schedule.
+        """
+        self._buffer.append(job)
+        self._kick.set()
+    
+    async def _run(self) -> None:
+        """Flush loop: wake on submissions, build a batch, hand it off."""
+        loop = asyncio.get_running_loop()
+        while self._running:
+            # Sleep until at least one job arrives (or stop() kicks us)
+            await self._kick.wait()
+            self._kick.clear()
+            if not self._buffer:
+                continue
+            
+            # Batch-building window: keep collecting until the batch is
+            # full or the latency budget for the first job runs out
+            deadline = loop.time() + self._config.max_wait_ms / 1000.0
+            while self._running and len(self._buffer) < self._config.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._kick.wait(), timeout=remaining)
+                except TimeoutError:
+                    break
+                self._kick.clear()
+            
+            await self._flush()
+    
+    async def _flush(self) -> None:
+        """Hand the buffered jobs to the flush handler, if any."""
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        await self._flush_handler(batch)
@@ -23,11 +23,9 @@ Author: Simple UI Team
 from simple_ui_client.features.doc_converter.ui.progress_ui import (
     ProgressManager,
     FileStatus,
-    LogEntry,
 )
 
 __all__ = [
     "ProgressManager",
     "FileStatus",
-    "LogEntry",
 ]
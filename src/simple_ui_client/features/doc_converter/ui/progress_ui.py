@@ -10,8 +10,10 @@ from __future__ import annotations
 import threading
 import time
 from collections import deque
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+
+from loguru import logger
 from typing import Any
 
 from rich.console import Console, Group
@@ -32,7 +34,31 @@ from rich.table import Table
 from rich.text import Text
 
 
-@dataclass
+# Style lookups shared by the render and log paths; module-level so the
+# 4 Hz refresh and every add_log reuse the same dicts instead of
+# allocating throwaway literals
+_STATUS_STYLES = {
+    "pending": "yellow",
+    "converting": "blue",
+    "completed": "green",
+    "failed": "red",
+}
+_LEVEL_STYLES = {
+    "DEBUG": "dim",
+    "INFO": "blue",
+    "WARNING": "yellow",
+    "ERROR": "red",
+}
+
+# Seconds between summary lines when output is not a terminal
+_PLAIN_SUMMARY_INTERVAL = 5.0
+
+# Minimum spacing between accepted progress updates per file; anything
+# faster is invisible at the 4 Hz display refresh anyway
+_UPDATE_MIN_INTERVAL = 0.2
+
+
+@dataclass(slots=True)
 class FileStatus:
     """Status of a single file being processed."""
     filename: str
@@ -41,15 +67,20 @@ class FileStatus:
     started_at: float | None = None
     completed_at: float | None = None
     error: str | None = None
+    # Truncated name for the Active Files column, computed once at
+    # start_file instead of re-sliced on every refresh
+    display_name: str = ""
+
 
+@lru_cache(maxsize=101)
+def _make_progress_bar(progress: int) -> str:
+    """Render a ten-cell progress bar for an integer percentage.
 
-@dataclass
-class LogEntry:
-    """A log entry for the log stream."""
-    timestamp: datetime
-    level: str
-    message: str
-    thread: str = "main"
+    Progress is always 0-100, so the cache holds every possible bar
+    and the 4 Hz refresh loop never re-allocates the block strings.
+    """
+    filled = int(progress / 10)
+    return f"[green]{'█' * filled}[/green][dim]{'░' * (10 - filled)}[/dim] {progress}%"
 
 
 class ProgressManager:
@@ -76,24 +107,55 @@ class ProgressManager:
         total_files: int,
         log_lines: int = 20,
         console: Console | None = None,
+        eta_smoothing: float = 0.3,
     ) -> None:
         """
         Initialize the progress manager.
-        
+
         Args:
             total_files: Total number of files to process.
             log_lines: Number of log lines to display.
             console: Rich console instance.
+            eta_smoothing: Weight given to the most recent file
+                duration in the ETA moving average (0-1); higher
+                values react faster to throughput changes.
         """
         self.total_files = total_files
         self.log_lines = log_lines
         self.console = console or Console()
+        self.eta_smoothing = eta_smoothing
         
         # State
         self._files: dict[str, FileStatus] = {}
-        self._logs: deque[LogEntry] = deque(maxlen=log_lines)
+        # Ring of filenames shown in the Active Files panel: start_file
+        # appends and the deque evicts the oldest automatically, so each
+        # refresh walks at most 5 names instead of materializing the
+        # whole (unbounded) _files dict just to slice its tail
+        self._active: deque[str] = deque(maxlen=5)
+        # Log lines are rendered to their final markup once in add_log
+        # (entries are immutable after append), so each repaint only
+        # joins strings instead of re-formatting the whole window
+        self._logs: deque[str] = deque(maxlen=log_lines)
+        # Last joined log text, reused when a worker appends in the
+        # middle of a render-side join (see _create_layout)
+        self._last_logs_text = "[dim]No logs yet[/dim]"
+        # Per-file monotonic timestamp of the last accepted update,
+        # used to throttle page-level progress storms in update_file
+        self._last_update_ts: dict[str, float] = {}
+        # One-slot memo (epoch second, formatted "HH:MM:SS"): bursts of
+        # log lines within the same second skip strftime entirely. A
+        # racy overwrite just recomputes the identical string.
+        self._ts_memo: tuple[int, str] = (0, "")
         self._completed_count = 0
         self._failed_count = 0
+        # Exponential moving average of per-file duration; one scalar
+        # update per completion, reacts to throughput changes much
+        # faster than the cumulative elapsed/completed average
+        self._ema_file_time: float | None = None
+        # Completions accumulated since the last repaint; flushed into
+        # the main progress bar by _create_layout so a burst of
+        # parallel finishes costs one Rich task update per tick
+        self._pending_advance = 0
         self._start_time = time.time()
         self._lock = threading.Lock()
         
@@ -110,18 +172,50 @@ class ProgressManager:
             console=self.console,
         )
         self._main_task: TaskID | None = None
-        
+
         # Live display
         self._live: Live | None = None
-    
+
+        # Plain mode (stdout is a pipe/CI log): no Live repaints, just
+        # a periodic one-line summary — see __enter__
+        self._plain_mode = False
+        self._plain_stop = threading.Event()
+        self._plain_thread: threading.Thread | None = None
+
+        # Static renderables, built once in __enter__: the Progress
+        # object re-renders itself in place, so its wrapping Panel never
+        # needs rebuilding. Only the sections whose content actually
+        # changes (files table, stats line, log panel) are recreated
+        # per repaint.
+        self._progress_panel: Panel | None = None
+
     def __enter__(self) -> "ProgressManager":
         """Start the live display."""
+        # When output is a pipe every Live refresh would emit a full
+        # ANSI repaint of the nested panels; print a one-line summary
+        # on an interval instead and route logs to the logger
+        if not self.console.is_terminal:
+            self._plain_mode = True
+            self._plain_thread = threading.Thread(
+                target=self._plain_loop, name="progress-summary", daemon=True
+            )
+            self._plain_thread.start()
+            return self
+
         self._main_task = self._progress.add_task(
             "Converting files",
             total=self.total_files,
         )
+        self._progress_panel = Panel(
+            self._progress,
+            title="[bold]Overall Progress[/bold]",
+            border_style="blue",
+        )
+        # Pull-based rendering: Live's refresh thread calls
+        # _create_layout itself at 4 Hz, so any number of state changes
+        # between ticks costs exactly one render
         self._live = Live(
-            self._create_layout(),
+            get_renderable=self._create_layout,
             console=self.console,
             refresh_per_second=4,
         )
@@ -130,18 +224,63 @@ class ProgressManager:
     
     def __exit__(self, *args: Any) -> None:
         """Stop the live display."""
+        if self._plain_mode:
+            self._plain_stop.set()
+            if self._plain_thread is not None:
+                self._plain_thread.join()
+            self._print_plain_summary()
+            return
+        self._flush_advance()
         if self._live:
             self._live.__exit__(*args)
+
+    def _plain_loop(self) -> None:
+        """Print summary lines until stopped (non-TTY mode)."""
+        while not self._plain_stop.wait(_PLAIN_SUMMARY_INTERVAL):
+            self._print_plain_summary()
+
+    def _print_plain_summary(self) -> None:
+        """Emit one plain progress line (non-TTY mode)."""
+        stats = self._calculate_stats()
+        done = self._completed_count + self._failed_count
+        self.console.print(
+            f"[{done}/{self.total_files}] "
+            f"completed={self._completed_count} "
+            f"failed={self._failed_count} "
+            f"eta={stats['total_eta']}"
+        )
+
+    def _flush_advance(self) -> None:
+        """Apply buffered completions to the main progress bar."""
+        with self._lock:
+            adv, self._pending_advance = self._pending_advance, 0
+        if adv and self._main_task is not None:
+            self._progress.update(self._main_task, advance=adv)
     
     def _create_layout(self) -> Panel:
         """Create the display layout."""
-        # Progress section
-        progress_panel = Panel(
+        # Runs on Live's refresh thread: fold any completions since the
+        # last tick into the bar in one update
+        self._flush_advance()
+
+        # Single-file fast path (the common UI-driven case): the
+        # per-file table, stats line, and log panel only restate what
+        # the overall bar already shows for one document, so skip
+        # building them altogether
+        if self.total_files == 1:
+            return Panel(
+                self._progress,
+                title="[bold white]Document Converter[/bold white]",
+                border_style="white",
+            )
+
+        # Progress section (static wrapper; Progress redraws itself)
+        progress_panel = self._progress_panel or Panel(
             self._progress,
             title="[bold]Overall Progress[/bold]",
             border_style="blue",
         )
-        
+
         # Active files section
         files_table = Table(show_header=True, header_style="bold cyan", box=None)
         files_table.add_column("File", style="dim", width=40)
@@ -150,13 +289,9 @@ class ProgressManager:
         files_table.add_column("ETA", width=10)
         
         with self._lock:
-            for filename, status in list(self._files.items())[-5:]:  # Show last 5
-                status_style = {
-                    "pending": "yellow",
-                    "converting": "blue",
-                    "completed": "green",
-                    "failed": "red",
-                }.get(status.status, "white")
+            for filename in self._active:
+                status = self._files[filename]
+                status_style = _STATUS_STYLES.get(status.status, "white")
                 
                 # Calculate per-file ETA
                 file_eta = "-"
@@ -166,10 +301,10 @@ class ProgressManager:
                         remaining = (elapsed / status.progress) * (100 - status.progress)
                         file_eta = f"{remaining:.0f}s"
                 
-                progress_bar = self._make_progress_bar(status.progress)
-                
+                progress_bar = _make_progress_bar(status.progress)
+
                 files_table.add_row(
-                    filename[:38] + ".." if len(filename) > 40 else filename,
+                    status.display_name,
                     f"[{status_style}]{status.status}[/{status_style}]",
                     progress_bar,
                     file_eta,
@@ -193,24 +328,15 @@ class ProgressManager:
         stats_text.append(f"  Total ETA: ", style="dim")
         stats_text.append(f"{stats['total_eta']}", style="cyan bold")
         
-        # Logs section
-        log_lines = []
-        with self._lock:
-            for entry in self._logs:
-                level_style = {
-                    "DEBUG": "dim",
-                    "INFO": "blue",
-                    "WARNING": "yellow",
-                    "ERROR": "red",
-                }.get(entry.level, "white")
-                
-                log_lines.append(
-                    f"[dim]{entry.timestamp.strftime('%H:%M:%S')}[/dim] "
-                    f"[{level_style}]{entry.level:5}[/{level_style}] "
-                    f"{entry.message}"
-                )
-        
-        logs_text = "\n".join(log_lines) if log_lines else "[dim]No logs yet[/dim]"
+        # Logs section (lines pre-rendered in add_log). Appends are
+        # lock-free, so a worker can mutate the deque mid-join; when
+        # that rare race trips the iterator, show the previous frame's
+        # text and let the next tick catch up.
+        try:
+            logs_text = "\n".join(self._logs) or "[dim]No logs yet[/dim]"
+            self._last_logs_text = logs_text
+        except RuntimeError:
+            logs_text = self._last_logs_text
         logs_panel = Panel(
             logs_text,
             title="[bold]Log Stream[/bold]",
@@ -230,11 +356,6 @@ class ProgressManager:
             border_style="white",
         )
     
-    def _make_progress_bar(self, progress: int) -> str:
-        """Create a simple progress bar string."""
-        filled = int(progress / 10)
-        return f"[green]{'█' * filled}[/green][dim]{'░' * (10 - filled)}[/dim] {progress}%"
-    
     def _calculate_stats(self) -> dict[str, str]:
         """Calculate overall statistics."""
         completed = self._completed_count + self._failed_count
@@ -243,10 +364,16 @@ class ProgressManager:
         if completed == 0:
             total_eta = "calculating..."
         else:
-            elapsed = time.time() - self._start_time
-            avg_time = elapsed / completed
+            # Smoothed per-file time tracks bursty workloads (large
+            # docs mixed with small) far better than the cumulative
+            # average, which only matters as the cold-start fallback
+            if self._ema_file_time is not None:
+                avg_time = self._ema_file_time
+            else:
+                elapsed = time.time() - self._start_time
+                avg_time = elapsed / completed
             eta_seconds = avg_time * remaining
-            
+
             if eta_seconds < 60:
                 total_eta = f"{eta_seconds:.0f}s"
             elif eta_seconds < 3600:
@@ -256,11 +383,6 @@ class ProgressManager:
         
         return {"total_eta": total_eta}
     
-    def _update_display(self) -> None:
-        """Update the live display."""
-        if self._live:
-            self._live.update(self._create_layout())
-    
     def start_file(self, filename: str) -> None:
         """Mark a file as started."""
         with self._lock:
@@ -268,16 +390,31 @@ class ProgressManager:
                 filename=filename,
                 status="converting",
                 started_at=time.time(),
+                display_name=(
+                    filename[:38] + ".." if len(filename) > 40 else filename
+                ),
             )
-        self._update_display()
-    
+            self._active.append(filename)
+
     def update_file(self, filename: str, status: str, progress: int) -> None:
         """Update file status and progress."""
+        # Converter backends can emit per-page progress every few ms;
+        # changes faster than the refresh rate never reach the screen,
+        # so drop them before touching the lock. Terminal transitions
+        # and the 100% mark always go through.
+        now = time.monotonic()
+        if (
+            status == "converting"
+            and progress < 100
+            and now - self._last_update_ts.get(filename, 0.0) < _UPDATE_MIN_INTERVAL
+        ):
+            return
+        self._last_update_ts[filename] = now
+
         with self._lock:
             if filename in self._files:
                 self._files[filename].status = status
                 self._files[filename].progress = progress
-        self._update_display()
     
     def complete_file(self, filename: str, success: bool = True, error: str | None = None) -> None:
         """Mark a file as completed."""
@@ -287,28 +424,45 @@ class ProgressManager:
                 self._files[filename].progress = 100 if success else self._files[filename].progress
                 self._files[filename].completed_at = time.time()
                 self._files[filename].error = error
-            
+
+                status = self._files[filename]
+                if status.started_at:
+                    dur = status.completed_at - status.started_at
+                    alpha = self.eta_smoothing
+                    self._ema_file_time = (
+                        dur
+                        if self._ema_file_time is None
+                        else alpha * dur + (1 - alpha) * self._ema_file_time
+                    )
+
             if success:
                 self._completed_count += 1
             else:
                 self._failed_count += 1
-        
-        if self._main_task is not None:
-            self._progress.update(self._main_task, advance=1)
-        
-        self._update_display()
-    
+            self._pending_advance += 1
+
     def add_log(self, message: str, level: str = "INFO", thread: str = "main") -> None:
         """Add a log entry to the stream."""
-        entry = LogEntry(
-            timestamp=datetime.now(),
-            level=level,
-            message=message,
-            thread=thread,
+        # Without a log panel to feed, hand records to the logger
+        if self._plain_mode:
+            logger.bind(component="ProgressManager").log(level, message)
+            return
+
+        sec = int(time.time())
+        memo_sec, timestamp = self._ts_memo
+        if sec != memo_sec:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._ts_memo = (sec, timestamp)
+
+        level_style = _LEVEL_STYLES.get(level, "white")
+        line = (
+            f"[dim]{timestamp}[/dim] "
+            f"[{level_style}]{level:5}[/{level_style}] "
+            f"{message}"
         )
-        with self._lock:
-            self._logs.append(entry)
-        self._update_display()
+        # deque.append is atomic under the GIL — the most frequent
+        # call in the class no longer serializes worker threads
+        self._logs.append(line)
     
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of the conversion process."""
@@ -70,6 +70,49 @@ class BatchWorker:
         self._logger = logger.bind(component="BatchWorker")
         self._parallel_failures = 0
         self._max_parallel_failures = 3
+
+        # Shared executor, created lazily on the first parallel batch and
+        # reused across batches so worker threads (and any per-thread COM
+        # state on Windows) stay warm. Torn down in close().
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers = 0
+
+        # Single persistent thread for the sequential path, so every file
+        # runs on the same thread instead of whichever worker the default
+        # asyncio executor happens to pick.
+        self._seq_executor: ThreadPoolExecutor | None = None
+
+        # One converter per worker thread, initialized once and kept warm
+        # for the thread's lifetime instead of per file. On Windows this
+        # keeps the COM apartment (and Office automation state) alive
+        # between files.
+        self._tls = threading.local()
+
+        # Office COM leaks memory over long runs; recycle each thread's
+        # converter after this many conversions to bound the leak.
+        self._recycle_after = config.conversion.recycle_after
+
+    def close(self) -> None:
+        """Shut down the shared worker pools (if any were created)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_workers = 0
+        if self._seq_executor is not None:
+            self._seq_executor.shutdown(wait=False)
+            self._seq_executor = None
+
+    def _get_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Get the shared executor, (re)creating it if the size changed."""
+        if self._executor is None or self._executor_workers != workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="conv",
+            )
+            self._executor_workers = workers
+        return self._executor
     
     def _log(self, message: str, level: str = "INFO") -> None:
         """Log a message and update progress UI."""
@@ -77,6 +120,40 @@ class BatchWorker:
         if self.progress:
             self.progress.add_log(message, level, threading.current_thread().name)
     
+    def _get_thread_converter(self) -> "BaseConverter":
+        """
+        Get the converter bound to the current worker thread.
+
+        Created and initialized on first use per thread; reused for every
+        subsequent file processed on that thread.
+        """
+        converter = getattr(self._tls, "converter", None)
+        if converter is None:
+            converter = get_converter()
+            converter.initialize()
+            self._tls.converter = converter
+            self._tls.converted = 0
+        return converter
+
+    def _note_converted(self) -> None:
+        """
+        Count a finished conversion on this thread and recycle the
+        thread's converter once the recycle threshold is reached.
+        """
+        count = getattr(self._tls, "converted", 0) + 1
+        if count >= self._recycle_after:
+            converter = getattr(self._tls, "converter", None)
+            if converter is not None:
+                converter.cleanup()
+                self._tls.converter = None
+                self._log(
+                    f"Recycled converter after {count} conversions "
+                    f"on {threading.current_thread().name}",
+                    "DEBUG",
+                )
+            count = 0
+        self._tls.converted = count
+
     def _convert_file(
         self,
         converter: "BaseConverter",
@@ -85,68 +162,66 @@ class BatchWorker:
     ) -> ConversionResult:
         """
         Convert a single file.
-        
+
+        The converter is expected to already be initialized for the
+        current thread (see _get_thread_converter).
+
         Args:
             converter: The converter to use.
             source: Source file path.
             output_manager: Output manager instance.
-            
+
         Returns:
             ConversionResult from the conversion.
         """
-        # Initialize COM for this thread (Windows)
-        converter.initialize()
-        
-        try:
-            file_type = output_manager.get_file_type(source)
-            target = output_manager.get_output_path(source)
-            
-            self._log(f"Converting: {source.name}")
-            
-            if self.progress:
-                self.progress.start_file(source.name)
-            
-            # Handle macro Excel files
-            if output_manager.is_macro_excel(source):
-                temp_path = output_manager.get_temp_path(source, ".xlsx")
-                result = converter.convert_xlsm_to_xlsx(source, temp_path)
-                
-                if not result.success:
-                    return result
-                
-                source = temp_path
-            
-            # Convert based on file type
-            if file_type == FileType.WORD:
-                result = converter.convert_word(
-                    source, target, self.config.word.default
-                )
-            elif file_type == FileType.EXCEL:
-                result = converter.convert_excel(
-                    source, target, self.config.excel.default
-                )
-            elif file_type == FileType.POWERPOINT:
-                result = converter.convert_powerpoint(
-                    source, target, self.config.powerpoint.default
-                )
-            else:
-                result = ConversionResult(
-                    success=False,
-                    source_path=source,
-                    error=f"Unsupported file type: {source.suffix}",
-                )
-            
-            if self.progress:
-                self.progress.complete_file(
-                    source.name,
-                    success=result.success,
-                    error=result.error,
-                )
-            
-            return result
-            
-        finally:
-            converter.cleanup()
+        # Lower the extension once; both the type dispatch and the macro
+        # check below reuse it
+        ext = source.suffix.lower()
+        file_type = output_manager.get_file_type_for_ext(ext)
+        target = output_manager.get_output_path(source)
+
+        self._log(f"Converting: {source.name}")
+
+        if self.progress:
+            self.progress.start_file(source.name)
+
+        # Convert based on file type. Macro Excel goes through the fused
+        # single-session path: one open/export instead of a macro-stripping
+        # pass followed by a second Excel launch.
+        if output_manager.is_macro_ext(ext):
+            result = converter.convert_xlsm(
+                source, target, self.config.excel.default
+            )
+        elif file_type == FileType.WORD:
+            result = converter.convert_word(
+                source, target, self.config.word.default
+            )
+        elif file_type == FileType.EXCEL:
+            result = converter.convert_excel(
+                source, target, self.config.excel.default
+            )
+        elif file_type == FileType.POWERPOINT:
+            result = converter.convert_powerpoint(
+                source, target, self.config.powerpoint.default
+            )
+        else:
+            result = ConversionResult(
+                success=False,
+                source_path=source,
+                error=f"Unsupported file type: {source.suffix}",
+            )
+
+        if self.progress:
+            self.progress.complete_file(
+                source.name,
+                success=result.success,
+                error=result.error,
+            )
+
+        if result.success:
+            self._note_converted()
+
+        return result
     
     def _process_file_with_timeout(
         self,
@@ -197,8 +272,29 @@ class BatchWorker:
                 duration_seconds=0,
             )
         
+        # Idempotent re-run fast path: drop files whose target PDF already
+        # exists. Stats run on a small pool because a serial stat loop is
+        # latency-bound on networked filesystems.
+        if self.config.conversion.skip_existing:
+            with ThreadPoolExecutor(max_workers=8) as stat_pool:
+                exists_flags = list(stat_pool.map(
+                    lambda f: output_manager.get_output_path(f).exists(), files
+                ))
+            skipped = sum(exists_flags)
+            if skipped:
+                self._log(f"Skipping {skipped} files with existing output")
+                files = [f for f, exists in zip(files, exists_flags) if not exists]
+            if not files:
+                self._log("All targets already exist, nothing to convert")
+                return BatchResult(
+                    total_files=0,
+                    successful=0,
+                    failed=0,
+                    duration_seconds=time.time() - start_time,
+                )
+
         self._log(f"Starting batch conversion of {len(files)} files")
-        
+
         converter = get_converter()
         timeout_seconds = self.config.conversion.timeout_minutes * 60
         workers = self.config.conversion.workers
@@ -266,38 +362,43 @@ class BatchWorker:
         timeout_seconds: int,
     ) -> BatchResult:
         """Process files in parallel using thread pool."""
-        
-        def process_one(source: Path) -> ConversionResult:
-            # Create new converter instance for this thread
-            thread_converter = get_converter()
-            return self._process_file_with_timeout(
-                thread_converter, source, output_manager, timeout_seconds
-            )
-        
-        loop = asyncio.get_event_loop()
-        
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            futures: dict[Future[ConversionResult], Path] = {}
-            
-            for source in files:
-                future = executor.submit(process_one, source)
-                futures[future] = source
-            
-            for future in as_completed(futures, timeout=timeout_seconds * len(files)):
-                source = futures[future]
-                try:
-                    result = future.result(timeout=timeout_seconds)
-                    
-                    if result.success:
-                        output_manager.record_success(source)
-                    else:
-                        output_manager.record_error(source, result.error or "Unknown error")
-                        self._parallel_failures += 1
-                        
-                except Exception as e:
-                    self._log(f"Parallel task failed for {source.name}: {e}", "ERROR")
-                    output_manager.record_error(source, str(e))
-                    self._parallel_failures += 1
+
+        def process_one(source: Path) -> tuple[Path, ConversionResult]:
+            # The source rides along with the result so completion handling
+            # never needs a Future -> Path map (every probe of such a map
+            # hashes the Path's string form)
+            try:
+                # Reuse the converter bound to this worker thread
+                thread_converter = self._get_thread_converter()
+                result = self._process_file_with_timeout(
+                    thread_converter, source, output_manager, timeout_seconds
+                )
+            except Exception as e:
+                self._log(f"Parallel task failed for {source.name}: {e}", "ERROR")
+                result = ConversionResult(
+                    success=False,
+                    source_path=source,
+                    error=str(e),
+                )
+            return source, result
+
+        executor = self._get_executor(workers)
+        futures: list[Future[tuple[Path, ConversionResult]]] = [
+            executor.submit(process_one, source) for source in files
+        ]
+
+        # Buffer outcomes locally and flush them to the output manager in
+        # one batched call after the completion loop
+        outcomes: list[tuple[Path, bool, str | None]] = []
+
+        for future in as_completed(futures, timeout=timeout_seconds * len(files)):
+            source, result = future.result()
+            outcomes.append((source, result.success, result.error))
+
+            if not result.success:
+                self._parallel_failures += 1
+
+        output_manager.record_batch(outcomes)
         
         summary = output_manager.get_summary()
         return BatchResult(
@@ -316,15 +417,29 @@ class BatchWorker:
         timeout_seconds: int,
     ) -> BatchResult:
         """Process files sequentially."""
-        
+
+        if self._seq_executor is None:
+            self._seq_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="conv-seq",
+            )
+
+        loop = asyncio.get_running_loop()
+
+        def process_one(source: Path) -> ConversionResult:
+            # Fetch the converter on the worker thread so COM init happens
+            # there, once, rather than per file
+            thread_converter = self._get_thread_converter()
+            return self._process_file_with_timeout(
+                thread_converter, source, output_manager, timeout_seconds
+            )
+
         for source in files:
             try:
-                result = await asyncio.to_thread(
-                    self._process_file_with_timeout,
-                    converter,
+                result = await loop.run_in_executor(
+                    self._seq_executor,
+                    process_one,
                     source,
-                    output_manager,
-                    timeout_seconds,
                 )
                 
                 if result.success:
@@ -7,6 +7,7 @@ blocking the WebSocket heartbeat.
 """
 
 import asyncio
+import os
 import time
 from pathlib import Path
 from typing import Callable, Any
@@ -69,10 +70,9 @@ class DocumentProcessor:
                 on_progress,
             )
             
+            # JobResult is frozen; stamp the duration via a copy
             duration_ms = int((time.time() - start_time) * 1000)
-            result.duration_ms = duration_ms
-            
-            return result
+            return result.model_copy(update={"duration_ms": duration_ms})
             
         except Exception as e:
             self._logger.exception(f"Processing failed for job {job.id}: {e}")
@@ -127,8 +127,12 @@ class DocumentProcessor:
                     metadata={"source": job.source_url},
                 )
             
-            if not source_path.exists():
-                raise FileNotFoundError(f"Source file not found: {source_path}")
+            # Single stat covers both the existence check and the size used
+            # in the result metadata below
+            try:
+                source_size = os.stat(source_path).st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Source file not found: {source_path}") from None
             
             # Report progress
             if on_progress:
@@ -157,7 +161,7 @@ class DocumentProcessor:
                 output_text=result_text,
                 metadata={
                     "source": str(source_path),
-                    "size": source_path.stat().st_size,
+                    "size": source_size,
                     "format": suffix,
                 },
             )
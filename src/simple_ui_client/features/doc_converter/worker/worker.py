@@ -6,15 +6,24 @@ the document processor. Publishes progress and results back to the bus.
 """
 
 import asyncio
+import contextlib
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # perf extra not installed
+    orjson = None  # type: ignore[assignment]
 
 from simple_ui_client.core.bus import Event, EventPayload
 from simple_ui_client.features.doc_converter.worker.processor import DocumentProcessor
 from simple_ui_client.features.doc_converter.schema.schema import (
     ConversionJob,
-    JobProgress,
     JobResult,
     JobStatus,
 )
@@ -23,6 +32,60 @@ if TYPE_CHECKING:
     from simple_ui_client.core.bus import EventBus
 
 
+# Compiled once at import so per-request validation skips schema building
+_JOB_ADAPTER: TypeAdapter[ConversionJob] = TypeAdapter(ConversionJob)
+
+
+def _dump_payload(model: BaseModel) -> dict:
+    """
+    Serialize a model to a JSON-shaped dict for bus/pool transport.
+
+    model_dump(mode="json") walks the model in Python to coerce each
+    field; model_dump_json runs entirely in pydantic's Rust core, and
+    orjson parses the result back in C. When orjson is absent the
+    plain dump path is used unchanged.
+    """
+    if orjson is not None:
+        return orjson.loads(model.model_dump_json())
+    return model.model_dump(mode="json")
+
+
+# Per-process state for the optional process-pool dispatch path. The
+# initializer builds one DocumentProcessor per worker process, so every
+# job landing in that process reuses it instead of re-creating the
+# processor (and any converter it warms up) per job.
+_POOL_PROCESSOR: DocumentProcessor | None = None
+
+
+def _pool_init() -> None:
+    """Executor initializer: build this process's DocumentProcessor once."""
+    global _POOL_PROCESSOR
+    _POOL_PROCESSOR = DocumentProcessor()
+
+
+def _pool_run(payload: dict) -> dict:
+    """
+    Run one serialized job inside a pool process.
+
+    Takes and returns plain dicts so only JSON-shaped data crosses the
+    process boundary.
+
+    Args:
+        payload: ConversionJob as a json-mode dump.
+
+    Returns:
+        JobResult as a json-mode dump.
+    """
+    start_time = time.time()
+    job = _JOB_ADAPTER.validate_python(payload)
+    processor = _POOL_PROCESSOR or DocumentProcessor()
+    result = processor._process_sync(job)
+    result = result.model_copy(
+        update={"duration_ms": int((time.time() - start_time) * 1000)}
+    )
+    return _dump_payload(result)
+
+
 class DocConverterWorker:
     """
     Event bus worker for document conversion.
@@ -35,16 +98,41 @@ class DocConverterWorker:
         await worker.start()
     """
     
-    def __init__(self, bus: "EventBus") -> None:
+    def __init__(
+        self,
+        bus: "EventBus",
+        max_concurrent: int = 4,
+        process_workers: int | None = None,
+    ) -> None:
         """
         Initialize the worker.
-        
+
         Args:
             bus: The event bus to subscribe to.
+            max_concurrent: Maximum number of jobs processed at once;
+                further jobs stay queued on the semaphore.
+            process_workers: When set, dispatch jobs to a
+                ProcessPoolExecutor of this many persistent worker
+                processes (each pre-builds its DocumentProcessor once)
+                instead of in-process threads. Sidesteps the GIL for
+                CPU-bound conversion at the cost of fine-grained
+                progress events — pooled jobs only report completion.
         """
         self.bus = bus
         self.processor = DocumentProcessor()
         self._active_jobs: dict[str, asyncio.Task[None]] = {}
+        # Each job drives an external conversion process, so admission
+        # is capped instead of forking one process per doc:convert
+        # event in a burst
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._pool: ProcessPoolExecutor | None = (
+            ProcessPoolExecutor(
+                max_workers=process_workers,
+                initializer=_pool_init,
+            )
+            if process_workers
+            else None
+        )
         self._logger = logger.bind(component="DocConverterWorker")
     
     async def start(self) -> None:
@@ -66,7 +154,11 @@ class DocConverterWorker:
         # Unsubscribe from events
         self.bus.unsubscribe("doc:convert", self._on_convert_request)
         self.bus.unsubscribe("doc:cancel", self._on_cancel_request)
-        
+
+        # Tear down the process pool without waiting on stragglers
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
         self._logger.info("Document converter worker stopped")
     
     async def _on_convert_request(self, event: Event) -> None:
@@ -80,7 +172,7 @@ class DocConverterWorker:
             # Parse job from event payload
             payload = event.payload
             if isinstance(payload, dict):
-                job = ConversionJob(**payload)
+                job = _JOB_ADAPTER.validate_python(payload)
             elif isinstance(payload, ConversionJob):
                 job = payload
             else:
@@ -139,39 +231,80 @@ class DocConverterWorker:
     async def _process_job(self, job: ConversionJob) -> None:
         """
         Process a conversion job and publish results.
-        
+
+        Waits on the admission semaphore first, so at most
+        max_concurrent jobs convert at a time; the rest remain in
+        _active_jobs (and stay cancellable) until a slot frees up.
+
+        Args:
+            job: The job to process.
+        """
+        async with self._semaphore:
+            await self._run_job(job)
+
+    async def _run_job(self, job: ConversionJob) -> None:
+        """
+        Run one admitted conversion job and publish results.
+
         Args:
             job: The job to process.
         """
         job_id = str(job.id)
-        
-        try:
-            # Publish progress callback
-            async def on_progress(progress: int, message: str) -> None:
+        loop = asyncio.get_running_loop()
+
+        # Progress ticks flow through a single thread-safe queue consumed by
+        # one task, instead of scheduling a new task per tick via
+        # call_soon_threadsafe. One put + one loop wakeup per tick.
+        progress_queue: queue.SimpleQueue[tuple[int, str] | None] = queue.SimpleQueue()
+
+        async def consume_progress() -> None:
+            while True:
+                item = await loop.run_in_executor(None, progress_queue.get)
+                if item is None:
+                    break
+                progress, message = item
+                # The progress payload has a tiny, stable shape — build the
+                # dict directly instead of round-tripping through Pydantic
+                # serialization on every tick.
                 await self.bus.publish(Event(
                     name="doc:progress",
-                    payload=JobProgress(
-                        job_id=job.id,
-                        progress=progress,
-                        message=message,
-                    ).model_dump(mode="json"),
+                    payload={
+                        "job_id": job_id,
+                        "progress": progress,
+                        "status": JobStatus.PROCESSING.value,
+                        "message": message,
+                    },
                     source="DocConverterWorker",
                 ))
-            
-            # Wrapper for sync callback
-            def progress_sync(progress: int, message: str) -> None:
-                # Schedule async callback
-                asyncio.get_event_loop().call_soon_threadsafe(
-                    lambda: asyncio.create_task(on_progress(progress, message))
-                )
-            
+
+        # Thread-safe progress callback for the processor
+        def progress_sync(progress: int, message: str) -> None:
+            progress_queue.put_nowait((progress, message))
+
+        consumer = asyncio.create_task(consume_progress())
+
+        try:
             # Process the document
-            result = await self.processor.process_async(job, progress_sync)
+            try:
+                if self._pool is not None:
+                    # Pooled path: only JSON-shaped dicts cross the
+                    # process boundary; progress is completion-only
+                    result_data = await loop.run_in_executor(
+                        self._pool, _pool_run, _dump_payload(job)
+                    )
+                    result = JobResult.model_validate(result_data)
+                else:
+                    result = await self.processor.process_async(job, progress_sync)
+            finally:
+                # Sentinel unblocks the consumer so it can drain and exit
+                progress_queue.put_nowait(None)
+                with contextlib.suppress(asyncio.CancelledError):
+                    await consumer
             
             # Publish result
             await self.bus.publish(Event(
                 name="doc:result",
-                payload=result.model_dump(mode="json"),
+                payload=_dump_payload(result),
                 source="DocConverterWorker",
             ))
             
@@ -186,11 +319,11 @@ class DocConverterWorker:
             # Publish cancellation result
             await self.bus.publish(Event(
                 name="doc:result",
-                payload=JobResult(
+                payload=_dump_payload(JobResult(
                     job_id=job.id,
                     success=False,
                     error="Job cancelled",
-                ).model_dump(mode="json"),
+                )),
                 source="DocConverterWorker",
             ))
             
@@ -200,11 +333,11 @@ class DocConverterWorker:
             # Publish error result
             await self.bus.publish(Event(
                 name="doc:result",
-                payload=JobResult(
+                payload=_dump_payload(JobResult(
                     job_id=job.id,
                     success=False,
                     error=str(e),
-                ).model_dump(mode="json"),
+                )),
                 source="DocConverterWorker",
             ))
     
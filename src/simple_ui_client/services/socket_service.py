@@ -6,11 +6,18 @@ including authentication, exponential backoff reconnection, and event routing.
 """
 
 import asyncio
+import random
+import sys
 from typing import TYPE_CHECKING, Any
 
 import socketio
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional `perf` extra
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from simple_ui_client.core.bus import EventBus
     from simple_ui_client.utils.config import Settings
@@ -18,21 +25,65 @@ if TYPE_CHECKING:
 from simple_ui_client.core.bus import Event, EventPayload
 
 
+# Shared source tag for all events bridged from the socket
+_SOURCE = "SocketService"
+
+
+class _OrjsonModule:
+    """
+    json-module shim backed by orjson for the Socket.IO client.
+
+    python-engineio expects a module with str-returning `dumps` and a
+    `loads`; orjson returns bytes and takes no keyword args, so adapt.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, *args: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data: Any, *args: Any, **kwargs: Any) -> Any:
+        return orjson.loads(data)
+
+
 class SocketService:
     """
     Socket.IO client service with automatic reconnection.
     
     Features:
     - Authentication with API key and optional email
-    - Exponential backoff reconnection (1s, 2s, 4s... up to max_delay)
+    - Jittered backoff reconnection (random initial delay, golden-ratio
+      growth up to max_delay, immediate retry after a clean disconnect)
     - Event bridging to internal event bus
     - Configurable ping interval/timeout matching server config
-    
+
     Example:
         service = SocketService(settings, event_bus)
         await service.connect()
     """
-    
+
+    # Recovery backoff (same scheme as the `websockets` library): the first
+    # retry waits a random 0..BACKOFF_INITIAL seconds so a fleet of clients
+    # doesn't reconnect in lockstep after a server blip; later retries grow
+    # by BACKOFF_FACTOR with a BACKOFF_MIN floor, capped at
+    # settings.reconnect_max_delay.
+    BACKOFF_INITIAL = 5.0
+    BACKOFF_MIN = 1.92
+    BACKOFF_FACTOR = 1.618
+
+    # Capacity of the bridge queue between socket handlers and the bus
+    # pump; when full, the oldest event is dropped so fresh server state
+    # wins over stale backlog
+    EVENT_QUEUE_SIZE = 256
+
+    # How long progress updates are coalesced before one emit per job
+    # goes out; only the latest value per job survives the window
+    PROGRESS_FLUSH_INTERVAL = 0.1
+
+    # Results bigger than this (when cheaply measurable) block every
+    # emit queued behind them on the single websocket transport
+    RESULT_INLINE_MAX = 64 * 1024
+
     def __init__(self, settings: "Settings", bus: "EventBus") -> None:
         """
         Initialize the socket service.
@@ -45,91 +96,163 @@ class SocketService:
         self.bus = bus
         self._logger = logger.bind(component="SocketService")
         
-        # Reconnection state
-        self._reconnect_delay = 1.0
+        # Reconnection state (None = next failure picks a jittered
+        # initial delay)
+        self._reconnect_delay: float | None = None
         self._connected = False
         self._should_reconnect = True
+        # Set by disconnect() to cut backoff waits short
+        self._shutdown_event = asyncio.Event()
         
-        # Create Socket.IO client
+        # Interned `server:<type>` event names — notification types come
+        # from a small vocabulary, so the hot receive path reuses the same
+        # string objects instead of re-formatting per message. The known
+        # vocabulary is seeded up front; unknown types are interned lazily.
+        self._notif_names: dict[str, str] = {
+            t: sys.intern(f"server:{t}")
+            for t in ("info", "warn", "error", "progress", "unknown")
+        }
+
+        # Bounded bridge queue between socket handlers and the bus: the
+        # receive coroutine only does a put_nowait, and a pump task drains
+        # whole bursts into a single publish_many
+        self._event_queue: asyncio.Queue[Event] = asyncio.Queue(
+            maxsize=self.EVENT_QUEUE_SIZE
+        )
+        self._pump_task: asyncio.Task[None] | None = None
+
+        # Coalesced progress: latest (progress, status) per job, flushed
+        # on a short timer so rapid updates cost one emit per window
+        self._progress_latest: dict[str, tuple[int, str]] = {}
+        self._progress_flush_handle: asyncio.TimerHandle | None = None
+        # Last value actually emitted per job, so repeated identical
+        # updates never leave the client
+        self._last_progress: dict[str, tuple[int, str]] = {}
+
+        # Auth payload never changes for the lifetime of the service, so
+        # build it once instead of on every reconnect attempt
+        self._auth: dict[str, str] = {"apiKey": settings.websocket_api_key}
+        if settings.user_email:
+            self._auth["email"] = settings.user_email
+
+        # Create Socket.IO client (orjson for packet encoding when the
+        # `perf` extra is installed, stdlib json otherwise)
         self._sio = socketio.AsyncClient(
             reconnection=False,  # We handle reconnection ourselves
             logger=False,
             engineio_logger=False,
+            json=_OrjsonModule if orjson is not None else None,
         )
         
         # Register event handlers
         self._setup_handlers()
     
+    def _publish(self, name: str, payload: dict[str, Any] | None = None) -> None:
+        """
+        Queue a bridged event for publication on the internal bus.
+
+        Server payload dicts are passed through as-is, never copied.
+        Events from the same loop tick are coalesced into one batched
+        bus publish.
+
+        Args:
+            name: Internal event name.
+            payload: Optional payload dict from the server.
+        """
+        if payload is None:
+            event = Event(name=name, source=_SOURCE)
+        else:
+            event = Event(name=name, payload=payload, source=_SOURCE)
+
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Drop the oldest queued event to make room for the new one
+            dropped = self._event_queue.get_nowait()
+            self._event_queue.put_nowait(event)
+            self._logger.warning("Event queue full, dropped {}", dropped)
+
+    async def _pump(self) -> None:
+        """Drain the bridge queue into the bus, one batch per burst."""
+        while True:
+            batch = [await self._event_queue.get()]
+            while True:
+                try:
+                    batch.append(self._event_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            await self.bus.publish_many(batch)
+
+    def _notif_name(self, notification_type: str) -> str:
+        """Get the interned `server:<type>` event name for a notification."""
+        name = self._notif_names.get(notification_type)
+        if name is None:
+            name = self._notif_names.setdefault(
+                notification_type, sys.intern(f"server:{notification_type}")
+            )
+        return name
+
     def _setup_handlers(self) -> None:
         """Setup Socket.IO event handlers."""
-        
+
         @self._sio.event
         async def connect() -> None:
             self._connected = True
-            self._reconnect_delay = 1.0  # Reset backoff on successful connect
+            self._reconnect_delay = None  # Reset backoff on successful connect
             self._logger.info("Connected to server")
-            
-            await self.bus.publish(Event(
-                name="socket:connected",
-                source="SocketService",
-            ))
-        
+
+            # Lifecycle events are skipped entirely when nothing listens
+            # (common in daemon mode)
+            if self.bus.has_subscribers("socket:connected"):
+                self._publish("socket:connected")
+
         @self._sio.event
         async def disconnect() -> None:
             self._connected = False
             self._logger.warning("Disconnected from server")
-            
-            await self.bus.publish(Event(
-                name="socket:disconnected",
-                source="SocketService",
-            ))
-        
+
+            if self.bus.has_subscribers("socket:disconnected"):
+                self._publish("socket:disconnected")
+
         @self._sio.event
         async def connect_error(data: Any) -> None:
             self._logger.error(f"Connection error: {data}")
             self._connected = False
-            
-            await self.bus.publish(Event(
-                name="socket:error",
-                payload={"error": str(data)},
-                source="SocketService",
-            ))
-        
+
+            if self.bus.has_subscribers("socket:error"):
+                self._publish("socket:error", {"error": str(data)})
+
         # Handle server notifications (document conversion requests, etc.)
         @self._sio.on("notification")
         async def on_notification(data: dict[str, Any]) -> None:
-            self._logger.debug(f"Received notification: {data}")
-            
-            notification_type = data.get("type", "unknown")
-            
+            # Deferred formatting: the payload is only stringified if
+            # DEBUG is actually enabled
+            self._logger.debug("Received notification: {}", data)
+
             # Route to appropriate event
-            await self.bus.publish(Event(
-                name=f"server:{notification_type}",
-                payload=data,
-                source="SocketService",
-            ))
-        
+            self._publish(self._notif_name(data.get("type", "unknown")), data)
+
         # Handle document conversion requests specifically
         @self._sio.on("doc:convert:request")
         async def on_doc_convert_request(data: dict[str, Any]) -> None:
-            self._logger.info(f"Received document conversion request: {data.get('id', 'unknown')}")
-            
-            await self.bus.publish(Event(
-                name="doc:convert",
-                payload=data,
-                source="SocketService",
-            ))
-        
+            self._logger.info(
+                "Received document conversion request: {}", data.get("id", "unknown")
+            )
+
+            self._publish("doc:convert", data)
+
         # Handle generic messages
         @self._sio.on("message")
         async def on_message(data: Any) -> None:
-            self._logger.debug(f"Received message: {data}")
-            
-            await self.bus.publish(Event(
-                name="server:message",
-                payload={"data": data} if not isinstance(data, dict) else data,
-                source="SocketService",
-            ))
+            self._logger.debug("Received message: {}", data)
+
+            if not self.bus.has_subscribers("server:message"):
+                return
+
+            self._publish(
+                "server:message",
+                data if isinstance(data, dict) else {"data": data},
+            )
     
     async def connect(self) -> None:
         """
@@ -138,28 +261,30 @@ class SocketService:
         This method runs indefinitely, handling reconnection with
         exponential backoff until shutdown is requested.
         """
-        self._logger.info(f"Connecting to {self.settings.websocket_url}...")
-        
+        url = self.settings.websocket_url
+        max_delay = self.settings.reconnect_max_delay
+
+        self._logger.info(f"Connecting to {url}...")
+
+        if self._pump_task is None:
+            self._pump_task = asyncio.create_task(self._pump())
+
         while self._should_reconnect:
+            clean_close = False
+
             try:
-                # Prepare auth payload
-                auth = {
-                    "apiKey": self.settings.websocket_api_key,
-                }
-                if self.settings.user_email:
-                    auth["email"] = self.settings.user_email
-                
-                # Connect with auth
+                # Connect with cached auth
                 await self._sio.connect(
-                    self.settings.websocket_url,
-                    auth=auth,
+                    url,
+                    auth=self._auth,
                     transports=["websocket"],
                     wait_timeout=10,
                 )
-                
+
                 # Wait until disconnected
                 await self._sio.wait()
-                
+                clean_close = True
+
             except socketio.exceptions.ConnectionError as e:
                 self._logger.warning(f"Connection failed: {e}")
             except asyncio.CancelledError:
@@ -167,63 +292,134 @@ class SocketService:
                 break
             except Exception as e:
                 self._logger.exception(f"Unexpected error: {e}")
-            
+
             if not self._should_reconnect:
                 break
-            
-            # Exponential backoff
+
+            if clean_close:
+                # The session was established and ended normally — no need
+                # to punish the reconnect with a backoff wait
+                self._logger.info("Reconnecting immediately after clean disconnect...")
+                continue
+
+            # Jittered backoff on handshake failure
+            if self._reconnect_delay is None:
+                self._reconnect_delay = random.random() * self.BACKOFF_INITIAL
+            else:
+                self._reconnect_delay = min(
+                    max(self._reconnect_delay * self.BACKOFF_FACTOR, self.BACKOFF_MIN),
+                    max_delay,
+                )
+
             self._logger.info(f"Reconnecting in {self._reconnect_delay:.1f}s...")
-            await asyncio.sleep(self._reconnect_delay)
-            self._reconnect_delay = min(
-                self._reconnect_delay * 2,
-                self.settings.reconnect_max_delay
-            )
+            # Interruptible wait: disconnect() sets the shutdown event so
+            # shutdown doesn't stall for up to the full backoff delay
+            try:
+                await asyncio.wait_for(
+                    self._shutdown_event.wait(), timeout=self._reconnect_delay
+                )
+            except asyncio.TimeoutError:
+                pass
     
     async def disconnect(self) -> None:
         """Disconnect from the server and stop reconnection attempts."""
         self._should_reconnect = False
-        
+        self._shutdown_event.set()
+
         if self._connected:
             try:
+                await self._flush_progress()
                 await self._sio.disconnect()
             except Exception as e:
                 self._logger.warning(f"Error during disconnect: {e}")
-        
+
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            try:
+                await self._pump_task
+            except asyncio.CancelledError:
+                pass
+            self._pump_task = None
+
         self._logger.info("Socket service stopped")
     
-    async def emit(self, event: str, data: Any = None) -> None:
+    def on(self, event: str, handler: Any, namespace: str | None = None) -> None:
+        """
+        Register a handler for a server event on the shared client.
+
+        New logical channels must register here (optionally under a
+        Socket.IO namespace) instead of creating their own AsyncClient:
+        one client multiplexes all namespaces over a single transport,
+        so TLS setup, ping/pong, and socket resources are paid once.
+
+        Args:
+            event: Server event name.
+            handler: Async callback receiving the event data.
+            namespace: Optional Socket.IO namespace (default: "/").
+        """
+        self._sio.on(event, handler, namespace=namespace)
+
+    async def emit(self, event: str, data: Any = None, namespace: str | None = None) -> None:
         """
         Emit an event to the server.
-        
+
         Args:
             event: Event name to emit.
             data: Data payload to send.
+            namespace: Optional Socket.IO namespace (default: "/").
         """
         if not self._connected:
             self._logger.warning(f"Cannot emit '{event}': not connected")
             return
-        
+
         try:
-            await self._sio.emit(event, data)
-            self._logger.debug(f"Emitted '{event}'")
+            await self._sio.emit(event, data, namespace=namespace)
+            self._logger.debug("Emitted '{}'", event)
         except Exception as e:
             self._logger.error(f"Failed to emit '{event}': {e}")
     
     async def send_progress(self, job_id: str, progress: int, status: str = "processing") -> None:
         """
         Send job progress update to the server.
-        
+
+        Updates are coalesced: only the latest value per job is emitted,
+        at most once per PROGRESS_FLUSH_INTERVAL.
+
         Args:
             job_id: Job identifier.
             progress: Progress percentage (0-100).
             status: Current job status.
         """
-        await self.emit("doc:convert:progress", {
-            "id": job_id,
-            "progress": progress,
-            "status": status,
-        })
-    
+        key = (progress, status)
+        if self._last_progress.get(job_id) == key:
+            return
+        self._progress_latest[job_id] = key
+
+        if self._progress_flush_handle is None:
+            self._progress_flush_handle = asyncio.get_running_loop().call_later(
+                self.PROGRESS_FLUSH_INTERVAL, self._on_progress_timer
+            )
+
+    def _on_progress_timer(self) -> None:
+        """Timer callback: flush coalesced progress updates."""
+        self._progress_flush_handle = None
+        asyncio.ensure_future(self._flush_progress())
+
+    async def _flush_progress(self) -> None:
+        """Emit the latest coalesced progress update for each job."""
+        if self._progress_flush_handle is not None:
+            self._progress_flush_handle.cancel()
+            self._progress_flush_handle = None
+
+        latest, self._progress_latest = self._progress_latest, {}
+        for job_id, (progress, status) in latest.items():
+            self._last_progress[job_id] = (progress, status)
+            await self.emit("doc:convert:progress", {
+                "id": job_id,
+                "progress": progress,
+                "status": status,
+            })
+
     async def send_result(self, job_id: str, success: bool, result: Any = None, error: str | None = None) -> None:
         """
         Send job result to the server.
@@ -234,6 +430,22 @@ class SocketService:
             result: Job result data (if successful).
             error: Error message (if failed).
         """
+        # Make sure any pending progress for this job lands before the
+        # terminal result
+        await self._flush_progress()
+        self._last_progress.pop(job_id, None)
+
+        # Oversized results head-of-line block everything behind them on
+        # the shared transport; flag them without paying for a trial
+        # serialization
+        if isinstance(result, (str, bytes)) and len(result) > self.RESULT_INLINE_MAX:
+            self._logger.warning(
+                "Result for job {} is {} bytes; consider delivering large "
+                "payloads out of band",
+                job_id,
+                len(result),
+            )
+
         await self.emit("doc:convert:result", {
             "id": job_id,
             "success": success,
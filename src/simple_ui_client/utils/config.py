@@ -5,7 +5,7 @@ Loads settings from environment variables and .env files with validation.
 Provides a singleton pattern for accessing application configuration.
 """
 
-from functools import lru_cache
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Literal
 
@@ -16,6 +16,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 # Type alias for log levels (PEP 695)
 type LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# Resolved once: Path.home() consults the environment on every call,
+# and each Settings() construction would otherwise repeat it
+_HOME = Path.home()
+
 
 class Settings(BaseSettings):
     """
@@ -83,7 +87,7 @@ class Settings(BaseSettings):
     
     # Path Configuration
     simple_ui_home: Path = Field(
-        default_factory=lambda: Path.home() / ".simple-ui",
+        default_factory=lambda: _HOME / ".simple-ui",
         description="Base directory for Simple UI client data",
     )
     log_dir: Path | None = Field(
@@ -119,14 +123,20 @@ class Settings(BaseSettings):
             return v.upper()
         return v
     
-    @property
+    @cached_property
     def pid_file(self) -> Path:
-        """Path to the PID file for daemon mode."""
+        """Path to the PID file for daemon mode (computed once)."""
         return self.simple_ui_home / "client.pid"
-    
+
     @property
     def effective_log_dir(self) -> Path:
-        """Path to the effective log directory (explicit or default)."""
+        """
+        Path to the effective log directory (explicit or default).
+
+        Stays a plain property: `log_dir` can be reassigned at runtime
+        (the convert command points it at the converter's log dir), so
+        this must not be cached.
+        """
         if self.log_dir:
             return self.log_dir
         return self.simple_ui_home / "logs"
@@ -137,7 +147,7 @@ class Settings(BaseSettings):
         self.effective_log_dir.mkdir(parents=True, exist_ok=True)
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """
     Get cached application settings.
@@ -15,6 +15,40 @@ if TYPE_CHECKING:
     from simple_ui_client.utils.config import Settings
 
 
+# Handler ids from the last setup_logger call, so the file sink can be
+# swapped later without tearing down / duplicating the console sink
+_console_id: int | None = None
+_file_id: int | None = None
+
+
+def _add_file_sink(settings: "Settings", *, daemon_mode: bool = False) -> int:
+    """Add the rotating file sink and return its handler id."""
+    serialize = settings.json_logs or daemon_mode  # JSON for daemon / production
+
+    # When serializing, don't pass a custom format: Loguru would render
+    # the markup template per record only to bury it in the JSON
+    # envelope's text field — pure double-formatting
+    extra: dict[str, str] = {}
+    if not serialize:
+        extra["format"] = (
+            "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | "
+            "{name}:{function}:{line} - {message}"
+        )
+
+    return logger.add(
+        settings.effective_log_dir / settings.log_filename_template,
+        level=settings.log_level,
+        rotation=settings.log_rotation,
+        retention=settings.log_retention,
+        compression=settings.log_compression,
+        serialize=serialize,
+        enqueue=True,  # Disk writes happen on a background thread
+        backtrace=False,
+        diagnose=False,  # Skip expensive variable reprs on exceptions
+        **extra,
+    )
+
+
 def setup_logger(
     settings: "Settings",
     *,
@@ -22,62 +56,80 @@ def setup_logger(
 ) -> None:
     """
     Configure the Loguru logger based on application settings.
-    
+
+    Safe to call more than once: existing sinks are replaced, never
+    duplicated.
+
     Args:
         settings: Application settings containing log configuration.
         daemon_mode: If True, suppress console output and enable JSON logs.
     """
-    # Remove default handler
+    global _console_id, _file_id
+
+    # Remove default and any previously-added handlers
     logger.remove()
-    
+    _console_id = None
+    _file_id = None
+
     # Ensure log directory exists
     settings.ensure_directories()
-    
-    # Console handler (only in non-daemon mode)
+
+    # Console handler (only in non-daemon mode); when stderr is not a
+    # TTY (pipes, CI) use the plain format so no markup is parsed per
+    # record
     if not daemon_mode:
-        logger.add(
-            sys.stderr,
-            level=settings.log_level,
-            format=(
+        is_tty = sys.stderr.isatty()
+        if is_tty:
+            console_format = (
                 "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
                 "<level>{level: <8}</level> | "
                 "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
                 "<level>{message}</level>"
-            ),
-            colorize=True,
-        )
-    
-    # File handler with rotation
-    log_format = "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
-    
-    if settings.json_logs or daemon_mode:
-        # JSON format for daemon mode / production
-        logger.add(
-            settings.effective_log_dir / settings.log_filename_template,
-            level=settings.log_level,
-            format=log_format,
-            rotation=settings.log_rotation,
-            retention=settings.log_retention,
-            compression=settings.log_compression,
-            serialize=True,  # JSON output
-        )
-    else:
-        # Human-readable format
-        logger.add(
-            settings.effective_log_dir / settings.log_filename_template,
+            )
+        else:
+            console_format = (
+                "{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | "
+                "{name}:{function}:{line} - {message}"
+            )
+        _console_id = logger.add(
+            sys.stderr,
             level=settings.log_level,
-            format=log_format,
-            rotation=settings.log_rotation,
-            retention=settings.log_retention,
-            compression=settings.log_compression,
+            format=console_format,
+            colorize=is_tty,
+            backtrace=False,
+            diagnose=False,  # Same as the file sink: cheap exceptions
         )
-    
+
+    # File handler with rotation
+    _file_id = _add_file_sink(settings, daemon_mode=daemon_mode)
+
     logger.info(
         f"Logger initialized | level={settings.log_level} | "
         f"daemon_mode={daemon_mode} | json_logs={settings.json_logs}"
     )
 
 
+def reconfigure_log_dir(settings: "Settings") -> None:
+    """
+    Repoint the file sink at the settings' current log directory.
+
+    Only the file handler is replaced; the console handler keeps running
+    untouched, so records are never written twice.
+
+    Args:
+        settings: Application settings with the updated log_dir.
+    """
+    global _file_id
+
+    if _file_id is not None:
+        logger.remove(_file_id)
+
+    settings.ensure_directories()
+    _file_id = _add_file_sink(settings)
+
+    logger.info(f"Log directory changed to {settings.effective_log_dir}")
+
+
 def get_logger(name: str = "simple_ui_client") -> "logger":
     """
     Get a contextualized logger instance.
@@ -1,4 +1,3 @@
-import asyncio
 import pytest
 from simple_ui_client.core.bus import Event, EventBus
 
@@ -16,8 +15,8 @@ async def test_bus_publish_subscribe(event_bus):
     event = Event(name="test:event", payload={"data": 123})
     await event_bus.publish(event)
     
-    # Wait for dispatch
-    await asyncio.sleep(0.1)
+    # Wait for dispatch to finish (deterministic, no timer)
+    await event_bus.join()
     
     assert len(received) == 1
     assert received[0].name == "test:event"
@@ -40,7 +39,7 @@ async def test_bus_wildcard_subscription(event_bus):
     await event_bus.publish(Event(name="doc:progress"))
     await event_bus.publish(Event(name="other:event"))
     
-    await asyncio.sleep(0.1)
+    await event_bus.join()
     
     assert len(received) == 2
     assert all(e.name.startswith("doc:") for e in received)
@@ -60,12 +59,12 @@ async def test_bus_unsubscribe(event_bus):
     await event_bus.start()
     
     await event_bus.publish(Event(name="test:event"))
-    await asyncio.sleep(0.1)
+    await event_bus.join()
     assert calls == 1
     
     event_bus.unsubscribe("test:event", handler)
     await event_bus.publish(Event(name="test:event"))
-    await asyncio.sleep(0.1)
+    await event_bus.join()
     assert calls == 1
     
     await event_bus.stop()
@@ -79,7 +78,7 @@ async def test_bus_history(event_bus):
     for i in range(10):
         await event_bus.publish(Event(name=f"event:{i}"))
         
-    await asyncio.sleep(0.1)
+    await event_bus.join()
     
     history = event_bus.history
     assert len(history) == 5
@@ -5,11 +5,13 @@ from simple_ui_client.features.doc_converter.engine.linux.converter import Linux
 
 @pytest.fixture
 def converter():
-    # Patch the sub-converters to avoid actual initialization/dependencies
+    # Patch the sub-converters to avoid actual initialization/dependencies.
+    # Keep the patches active for the whole test: the sub-converters are
+    # created lazily on first use, not in __init__.
     with patch("simple_ui_client.features.doc_converter.engine.linux.converter.LinuxWordConverter"), \
          patch("simple_ui_client.features.doc_converter.engine.linux.converter.LinuxExcelConverter"), \
          patch("simple_ui_client.features.doc_converter.engine.linux.converter.LinuxPowerPointConverter"):
-        return LinuxConverter(libreoffice_path="test-office")
+        yield LinuxConverter(libreoffice_path="test-office")
 
 def test_linux_converter_init(converter):
     assert converter._libreoffice_path == "test-office"
@@ -12,29 +12,33 @@ def test_linux_excel_convert_success(converter):
     target = Path("test.pdf")
     config = MagicMock()
     
-    with patch("subprocess.run") as mock_run, \
+    with patch("subprocess.Popen") as mock_popen, \
          patch("pathlib.Path.mkdir"), \
          patch("pathlib.Path.exists", return_value=True), \
-         patch("pathlib.Path.rename"):
-        
-        mock_run.return_value = MagicMock(returncode=0)
-        
+         patch("os.replace"):
+
+        mock_popen.return_value = MagicMock(
+            returncode=0, communicate=MagicMock(return_value=(b"", b""))
+        )
+
         result = converter.convert(source, target, config)
         assert result.success is True
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
 def test_linux_excel_convert_xlsm(converter):
     source = Path("test.xlsm")
     target = Path("test.xlsx")
     
-    with patch("subprocess.run") as mock_run, \
+    with patch("subprocess.Popen") as mock_popen, \
          patch("pathlib.Path.mkdir"), \
          patch("pathlib.Path.exists", return_value=True), \
-         patch("pathlib.Path.rename"):
-        
-        mock_run.return_value = MagicMock(returncode=0)
-        
+         patch("os.replace"):
+
+        mock_popen.return_value = MagicMock(
+            returncode=0, communicate=MagicMock(return_value=(b"", b""))
+        )
+
         result = converter.convert_xlsm_to_xlsx(source, target)
         assert result.success is True
-        assert "--convert-to" in mock_run.call_args[0][0]
-        assert "xlsx" in mock_run.call_args[0][0]
+        assert "--convert-to" in mock_popen.call_args[0][0]
+        assert "xlsx" in mock_popen.call_args[0][0]
@@ -15,7 +15,7 @@ def test_linux_powerpoint_convert_success(converter):
     with patch("subprocess.run") as mock_run, \
          patch("pathlib.Path.mkdir"), \
          patch("pathlib.Path.exists", return_value=True), \
-         patch("pathlib.Path.rename"):
+         patch("os.replace"):
         
         mock_run.return_value = MagicMock(returncode=0)
         
@@ -16,7 +16,7 @@ def test_linux_word_convert_success(converter):
     with patch("subprocess.run") as mock_run, \
          patch("pathlib.Path.mkdir") as mock_mkdir, \
          patch("pathlib.Path.exists", return_value=True), \
-         patch("pathlib.Path.rename") as mock_rename:
+         patch("os.replace"):
         
         mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
         
@@ -37,7 +37,7 @@ def test_linux_word_convert_failure(converter):
     with patch("subprocess.run") as mock_run, \
          patch("pathlib.Path.mkdir"):
         
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Error message")
+        mock_run.return_value = MagicMock(returncode=1, stdout=b"", stderr=b"Error message")
         
         result = converter.convert(source, target, config)
         
@@ -28,3 +28,46 @@ def test_job_progress():
 def test_job_status_enum():
     assert JobStatus.COMPLETED == "completed"
     assert JobStatus.FAILED == "failed"
+
+async def test_batching_scheduler_flushes_full_batch():
+    from simple_ui_client.features.doc_converter.schema.schema import (
+        BatchingConfig,
+        BatchingScheduler,
+    )
+    import asyncio
+
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    scheduler = BatchingScheduler(handler, BatchingConfig(batch_size=2, max_wait_ms=5000))
+    await scheduler.start()
+    await scheduler.submit(ConversionJob(source_path="a.docx"))
+    await scheduler.submit(ConversionJob(source_path="b.docx"))
+    await asyncio.sleep(0.05)
+    await scheduler.stop()
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+async def test_batching_scheduler_flushes_on_timeout():
+    from simple_ui_client.features.doc_converter.schema.schema import (
+        BatchingConfig,
+        BatchingScheduler,
+    )
+    import asyncio
+
+    batches = []
+
+    async def handler(batch):
+        batches.append(batch)
+
+    scheduler = BatchingScheduler(handler, BatchingConfig(batch_size=10, max_wait_ms=20))
+    await scheduler.start()
+    await scheduler.submit(ConversionJob(source_path="a.docx"))
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert len(batches) == 1
+    assert len(batches[0]) == 1